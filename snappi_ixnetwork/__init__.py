@@ -1 +1,3 @@
 from snappi_ixnetwork.snappi_api import Api
+from snappi_ixnetwork.asyncapi import AsyncApi
+from snappi_ixnetwork.pcapindex import PcapIndex
@@ -0,0 +1,95 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from snappi_ixnetwork.snappi_api import Api
+
+
+class AsyncApi(object):
+    """asyncio façade of the Api class
+
+    Every call runs the blocking Api call in a worker thread so the event
+    loop is never blocked. The calls run one at a time: metrics, states
+    and capture requests also change state shared by the session, e.g. the
+    requested columns and the page of the statistics views.
+
+    A cancelled call returns immediately with asyncio.CancelledError, the
+    underlying IxNetwork request is completed in its worker thread before
+    the next call is started.
+
+    Args
+    ----
+    - api (Api): the Api to wrap, an Api is created from kwargs if None
+    - max_workers (int): number of worker threads
+    - kwargs: the arguments of Api, e.g. location, username and password
+    """
+
+    def __init__(self, api=None, max_workers=1, **kwargs):
+        self._api = Api(**kwargs) if api is None else api
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="snappi-ixn-async"
+        )
+        self._condition = None
+        self._running = False
+
+    @property
+    def api(self):
+        """The wrapped Api"""
+        return self._api
+
+    async def set_config(self, config):
+        return await self._call(self._api.set_config, config)
+
+    async def set_control_state(self, payload):
+        return await self._call(self._api.set_control_state, payload)
+
+    async def set_control_action(self, payload):
+        return await self._call(self._api.set_control_action, payload)
+
+    async def get_metrics(self, request):
+        return await self._call(self._api.get_metrics, request)
+
+    async def get_states(self, request):
+        return await self._call(self._api.get_states, request)
+
+    async def get_capture(self, request):
+        return await self._call(self._api.get_capture, request)
+
+    async def close(self):
+        """Wait for the running calls and release the worker threads"""
+        await self._call(lambda: None)
+        self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def _get_condition(self):
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def _call(self, func, *args):
+        condition = self._get_condition()
+        async with condition:
+            await condition.wait_for(lambda: self._running is False)
+            self._running = True
+        return await self._run(func, args, self._release)
+
+    async def _run(self, func, args, release):
+        loop = asyncio.get_running_loop()
+        future = self._executor.submit(func, *args)
+        # the lock is released once the call is completed in its thread,
+        # even if the awaiting task is cancelled
+        future.add_done_callback(
+            lambda _: loop.call_soon_threadsafe(
+                lambda: loop.create_task(release())
+            )
+        )
+        return await asyncio.wrap_future(future)
+
+    async def _release(self):
+        condition = self._get_condition()
+        async with condition:
+            self._running = False
+            condition.notify_all()
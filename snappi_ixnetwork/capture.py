@@ -1,7 +1,9 @@
 import json
-import time
 import io
+import os
+from concurrent.futures import ThreadPoolExecutor
 from snappi_ixnetwork.timer import Timer
+from snappi_ixnetwork.poll import poll
 from snappi_ixnetwork.logger import get_ixnet_logger
 
 
@@ -31,6 +33,8 @@ class Capture(object):
 
     """
 
+    _CHUNK_SIZE = 1024 * 1024
+
     def __init__(self, ixnetworkapi):
         self._api = ixnetworkapi
         self._capture_request = None
@@ -583,80 +587,99 @@ class Capture(object):
 
     def results(self, request):
         """Gets capture file and returns it as a byte stream"""
-        with Timer(self._api, "Captures stop"):
-            capture = self._api._vport.find(
-                Name=self._api.special_char(request.port_name)
-            ).Capture
-            capture.Stop("allTraffic")
-
-            # Internally setting max time_out to 90sec,
-            #  with 3sec polling interval.
-            # Todo: Need to discuss and incorporate time_out field within model
-            retry_count = 30
-            port_ready = True
-            for x in range(retry_count):
-                port_ready = True
-                time.sleep(3)
-                capture = self._api._vport.find(
-                    Name=self._api.special_char(request.port_name)
-                ).Capture
-                if (
-                    capture.HardwareEnabled
-                    and capture.DataCaptureState == "notReady"
-                ):
-                    port_ready = False
-                    continue
-                if (
-                    capture.SoftwareEnabled
-                    and capture.ControlCaptureState == "notReady"
-                ):
-                    port_ready = False
-                    continue
+        return self._download(self._get_capture_urls(request.port_name))
+
+    def stream(self, request, output=None, offset=0, resume=False):
+        """Downloads the capture file in chunks without holding it in memory
+
+        The chunks are written to output, a file path or a writable binary
+        file object, which is returned. If output is None an iterator of the
+        chunks is returned instead. The download starts at byte offset of
+        the capture file, with resume the download of a partially written
+        file path continues from its size.
+        """
+        if resume is True and isinstance(output, str):
+            if os.path.exists(output):
+                offset = os.path.getsize(output)
+        last_exc = None
+        for url in self._get_capture_urls(request.port_name):
+            try:
+                response = self._api._request_stream(url, offset)
                 break
-            if not port_ready:
-                self._api.warning(
-                    "Capture was not stopped for this port %s"
-                    % (request.port_name)
-                )
-
-        self._api._ixnetwork.SaveCaptureFiles(
-            self._api._ixnetwork.Globals.PersistencePath + "/capture"
-        )
-
-        vport_name = self._api._vport.Name
-        persist = self._api._ixnetwork.Globals.PersistencePath
-        dc = persist + "/capture/" + vport_name + "_HW.cap"
-        cc = persist + "/capture/" + vport_name + "_SW.cap"
-        merged_capture = persist + "/capture/" + vport_name + ".cap"
+            except Exception as exc:
+                last_exc = exc
+                continue
+        else:
+            raise last_exc
+        chunks = self._iter_chunks(response, offset)
+        if output is None:
+            return chunks
+        if isinstance(output, str):
+            with open(output, "ab" if offset > 0 else "wb") as fp:
+                for chunk in chunks:
+                    fp.write(chunk)
+        else:
+            for chunk in chunks:
+                output.write(chunk)
+        return output
 
+    def _iter_chunks(self, response, offset):
         try:
-            self._api._ixnetwork.MergeCapture(
-                Arg1=cc, Arg2=dc, Arg3=merged_capture
-            )
-        except Exception:
-            # MergeCapture fails when one of the source files is absent
-            # (e.g. port has only SW or only HW capture).  Continue and
-            # download whichever individual file is available.
-            pass
-
-        url = "{}/vport/operations/releaseCapturePorts".format(
-            self._api._ixnetwork.href
-        )
-        payload = {"arg1": [self._api._vport.href]}
-        self._api._request("POST", url, payload)
-
-        path = "%s/capture" % persist
-        # Try merged capture first (preferred); fall back to HW then SW.
-        # The original code used dc (_HW.cap) directly as a workaround for
-        # an IxNetwork 9.20 bug where merged-capture download was broken.
-        # That bug is fixed in later versions, so prefer merged now.
+            # the server ignored the range, skip the bytes already received
+            skip = offset if response.status_code == 200 else 0
+            for chunk in response.iter_content(self._CHUNK_SIZE):
+                if skip > 0:
+                    if len(chunk) <= skip:
+                        skip -= len(chunk)
+                        continue
+                    chunk = chunk[skip:]
+                    skip = 0
+                yield chunk
+        finally:
+            response.close()
+
+    def _get_capture_urls(self, port_name):
+        """Stops and saves the capture of the port and returns the file urls
+        of the merged, hardware and software captures"""
+        return self._save_captures([port_name])[port_name]
+
+    def results_batch(self, port_names, output_dir=None, max_workers=4):
+        """Gets the capture files of many ports with one stop, one
+        readiness poll and one SaveCaptureFiles, the files are downloaded
+        concurrently by max_workers threads.
+
+        Returns a dict of the capture of every port, a byte stream or the
+        path of the file written in output_dir.
+        """
+        port_urls = self._save_captures(port_names)
+
+        def download(port_name):
+            if output_dir is None:
+                return self._download(port_urls[port_name])
+            path = os.path.join(output_dir, "%s.cap" % port_name)
+            last_exc = None
+            for url in port_urls[port_name]:
+                try:
+                    response = self._api._request_stream(url)
+                except Exception as exc:
+                    last_exc = exc
+                    continue
+                with open(path, "wb") as fp:
+                    for chunk in self._iter_chunks(response, 0):
+                        fp.write(chunk)
+                return path
+            raise last_exc
+
+        with Timer(self._api, "Captures download"):
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                captures = executor.map(download, port_names)
+                return dict(zip(port_names, captures))
+
+    def _download(self, urls):
+        """Returns the first of the capture file urls which exists as a
+        byte stream"""
         last_exc = None
-        for cap_path in [merged_capture, dc, cc]:
-            url = "%s/files?absolute=%s&filename=%s" % (
-                self._api._ixnetwork.href,
-                path,
-                cap_path,
-            )
+        for url in urls:
             try:
                 pcap_file_bytes = self._api._request("GET", url)
                 return io.BytesIO(pcap_file_bytes)
@@ -665,6 +688,124 @@ class Capture(object):
                 continue
         raise last_exc
 
+    def _select_captures(self, port_names):
+        port_filter = {
+            "property": "name",
+            "regex": "^(%s)$"
+            % "|".join(self._api.special_char(list(port_names))),
+        }
+        payload = {
+            "selects": [
+                {
+                    "from": "/",
+                    "properties": [],
+                    "children": [
+                        {
+                            "child": "vport",
+                            "properties": ["name"],
+                            "filters": [port_filter],
+                        },
+                        {
+                            "child": "capture",
+                            "properties": [
+                                "hardwareEnabled",
+                                "softwareEnabled",
+                                "dataCaptureState",
+                                "controlCaptureState",
+                            ],
+                            "filters": [],
+                        },
+                    ],
+                    "inlines": [],
+                }
+            ]
+        }
+        url = "%s/operations/select?xpath=true" % self._api._ixnetwork.href
+        results = self._api._ixnetwork._connection._execute(url, payload)
+        return {vport["name"]: vport for vport in results[0].get("vport", [])}
+
+    def _get_not_ready(self, port_names):
+        not_ready = []
+        for name, vport in self._select_captures(port_names).items():
+            capture = vport["capture"]
+            if (
+                capture["hardwareEnabled"] is True
+                and capture["dataCaptureState"] == "notReady"
+            ) or (
+                capture["softwareEnabled"] is True
+                and capture["controlCaptureState"] == "notReady"
+            ):
+                not_ready.append(name)
+        return not_ready
+
+    def _save_captures(self, port_names):
+        """Stops and saves the captures of the ports at once and returns
+        the file urls of the merged, hardware and software captures of
+        every port"""
+        ixnetwork = self._api._ixnetwork
+        with Timer(self._api, "Captures stop"):
+            vports = self._select_captures(port_names)
+            missing = set(port_names) - set(vports)
+            if len(missing) > 0:
+                raise Exception(
+                    "Capture ports %s are not configured" % sorted(missing)
+                )
+            url = "%s/vport/capture/operations/stop" % ixnetwork.href
+            payload = {
+                "arg1": [
+                    vport["capture"]["href"] for vport in vports.values()
+                ],
+                "arg2": "allTraffic",
+            }
+            self._api._request("POST", url, payload)
+
+            # Internally setting max time_out to 90sec
+            # Todo: Need to discuss and incorporate time_out field within model
+            state = {"not_ready": list(vports)}
+
+            def is_ready():
+                state["not_ready"] = self._get_not_ready(state["not_ready"])
+                return len(state["not_ready"]) == 0
+
+            if not poll(is_ready, "Captures ready", 90, max_interval=3):
+                self._api.warning(
+                    "Capture was not stopped for these ports %s"
+                    % ", ".join(state["not_ready"])
+                )
+
+        ixnetwork.SaveCaptureFiles(
+            ixnetwork.Globals.PersistencePath + "/capture"
+        )
+
+        persist = ixnetwork.Globals.PersistencePath
+        path = "%s/capture" % persist
+        port_urls = {}
+        for port_name in port_names:
+            dc = persist + "/capture/" + port_name + "_HW.cap"
+            cc = persist + "/capture/" + port_name + "_SW.cap"
+            merged_capture = persist + "/capture/" + port_name + ".cap"
+            try:
+                ixnetwork.MergeCapture(Arg1=cc, Arg2=dc, Arg3=merged_capture)
+            except Exception:
+                # MergeCapture fails when one of the source files is absent
+                # (e.g. port has only SW or only HW capture).  Continue and
+                # download whichever individual file is available.
+                pass
+            # Try merged capture first (preferred); fall back to HW then SW.
+            # The original code used dc (_HW.cap) directly as a workaround
+            # for an IxNetwork 9.20 bug where merged-capture download was
+            # broken. That bug is fixed in later versions, so prefer merged.
+            port_urls[port_name] = [
+                "%s/files?absolute=%s&filename=%s"
+                % (ixnetwork.href, path, cap_path)
+                for cap_path in [merged_capture, dc, cc]
+            ]
+
+        url = "{}/vport/operations/releaseCapturePorts".format(ixnetwork.href)
+        payload = {"arg1": [vport["href"] for vport in vports.values()]}
+        self._api._request("POST", url, payload)
+        return port_urls
+
 
 class GetPattern(object):
     """This is validating captureFilterPattern and return expected patterns"""
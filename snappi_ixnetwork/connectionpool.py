@@ -0,0 +1,84 @@
+import gzip
+import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class ConnectionPool(object):
+    """Tunes the HTTP connection pool shared by all the REST requests
+
+    The restpy connections of the TestPlatform and of the session are
+    given one requests session holding a pool of persistent connections,
+    so that Api._request and the restpy requests of every module reuse
+    the established TCP/TLS connections of the API server.
+
+    Args
+    ----
+    - pool_size (int): maximum number of connections kept open
+    - keep_alive (bool): keep the connections open between requests
+    - retries (int): number of retries of idempotent requests (GET, PUT,
+      DELETE) failing on a connection error or a 502, 503 or 504 status
+    - backoff_factor (float): the retries wait backoff_factor * 2^retry s
+    - gzip (bool): gzip the json body of the requests of Api._request,
+      responses are always accepted gzip encoded
+    """
+
+    _GZIP_MIN_SIZE = 1024
+
+    def __init__(
+        self,
+        pool_size=10,
+        keep_alive=True,
+        retries=0,
+        backoff_factor=0.5,
+        gzip=False,
+    ):
+        self._pool_size = pool_size
+        self._keep_alive = keep_alive
+        self._retries = retries
+        self._backoff_factor = backoff_factor
+        self._gzip = gzip
+        self._session = None
+
+    def mount(self, *connections):
+        """Share one pooled requests session between restpy connections"""
+        if self._session is None:
+            self._session = connections[0]._session
+            adapter = HTTPAdapter(
+                pool_connections=self._pool_size,
+                pool_maxsize=self._pool_size,
+                max_retries=Retry(
+                    total=self._retries,
+                    backoff_factor=self._backoff_factor,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                ),
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        for connection in connections:
+            connection._session = self._session
+            if self._keep_alive is False:
+                connection._headers["Connection"] = "close"
+
+    def headers(self, connection):
+        """The headers of Api._request"""
+        headers = {
+            "Content-Type": "application/json",
+            "x-api-key": connection.x_api_key,
+        }
+        if self._keep_alive is False:
+            headers["Connection"] = "close"
+        return headers
+
+    def encode(self, payload, headers):
+        """Serialize the payload of Api._request, returns the body and the
+        headers to send it with"""
+        if payload is None:
+            return None, headers
+        data = json.dumps(payload)
+        if self._gzip is True and len(data) >= self._GZIP_MIN_SIZE:
+            headers = dict(headers)
+            headers["Content-Encoding"] = "gzip"
+            return gzip.compress(data.encode("utf-8")), headers
+        return data, headers
@@ -1,3 +1,4 @@
+import snappi
 from copy import deepcopy
 
 
@@ -59,7 +60,8 @@ class CustomField(object):
         xpath = "{CE}/stack[@alias = '{HEADER}-{INDEX}']".format(
             CE=xpath, HEADER="custom", INDEX=2
         )
-        custom = snappi_header.parent.custom
+        # a detached header, the user's pause header must not become custom
+        custom = snappi.FlowHeader().custom
         control_op_code = tr_instance._get_first_value(
             snappi_header.get("control_op_code", True)
         )
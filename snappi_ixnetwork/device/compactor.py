@@ -12,62 +12,53 @@ class Compactor(object):
     def compact(self, roots, isTopoComp = False):
         if roots is None or len(roots) == 0:
             return
-        similar_objs_list = []
+        similar_objs_map = {}
         for root in roots:
-            is_match = False
-            for similar_objs in similar_objs_list:
-                if self._comparator(similar_objs.primary_obj, root) is True:
-                    similar_objs.append(root)
-                    is_match = True
-                    break
-            if len(similar_objs_list) == 0 or is_match is False:
-                similar_objs = SimilarObjects(root)
-                similar_objs_list.append(similar_objs)
+            signature = self._get_signature(root)
+            similar_objs = similar_objs_map.get(signature)
+            if similar_objs is None:
+                similar_objs_map[signature] = SimilarObjects(root)
+            else:
+                similar_objs.append(root)
 
-        for similar_objs in similar_objs_list:
+        compacted_ids = set()
+        for similar_objs in similar_objs_map.values():
             if len(similar_objs.objects) > 0:
-                similar_objs.compact(roots, isTopoComp)
+                similar_objs.compact(isTopoComp)
+                compacted_ids.update(id(obj) for obj in similar_objs.objects)
                 self.set_scalable(similar_objs.primary_obj)
+        if len(compacted_ids) > 0:
+            roots[:] = [
+                root for root in roots if id(root) not in compacted_ids
+            ]
 
-    def _comparator(self, src, dst):
-        if type(src) != type(dst):
-            raise Exception("comparision issue")
-        src_node_keys = [
-            k for k, v in src.items() if not isinstance(v, MultiValue)
-        ]
-        dst_node_keys = [
-            k for k, v in dst.items() if not isinstance(v, MultiValue)
-        ]
-        src_node_keys.sort()
-        src_node_keys = list(set(src_node_keys) - set(self._ignore_keys))
-        dst_node_keys.sort()
-        dst_node_keys = list(set(dst_node_keys) - set(self._ignore_keys))
-        if src_node_keys != dst_node_keys:
-            return False
-        for key in src_node_keys:
+    def _get_signature(self, node):
+        """Returns a hashable structure of the node ignoring MultiValue,
+        xpath and name. Nodes with equal signature can be compacted."""
+        signature = []
+        for key in sorted(node.keys()):
+            value = node[key]
+            if key in self._ignore_keys or isinstance(value, MultiValue):
+                continue
             if key in self._unsupported_nodes:
-                return False
-            src_value = src.get(key)
-            dst_value = dst[key]
-            if isinstance(src_value, dict):
-                if self._comparator(src_value, dst_value) is False:
-                    return False
-            # todo: we need to restructure if same element in different position
-            elif isinstance(src_value, list):
-                if len(src_value) != len(dst_value):
-                    return False
-                for index, src_dict in enumerate(src_value):
-                    if not isinstance(src_dict, dict):
-                        continue
-                    if self._comparator(src_dict, dst_value[index]) is False:
-                        return False
-            # Scalar comparison
-            elif isinstance(src_value, PostCalculated):
-                if src_value.value != dst_value.value:
-                    return False
-            elif src_value != dst_value:
-                return False
-        return True
+                # never similar to any other node
+                return (id(node),)
+            if isinstance(value, dict):
+                value = ("dict", self._get_signature(value))
+            elif isinstance(value, list):
+                # only the dict elements of a list take part in comparison
+                value = ("list",) + tuple(
+                    self._get_signature(val) if isinstance(val, dict) else None
+                    for val in value
+                )
+            elif isinstance(value, PostCalculated):
+                value = value.value
+            try:
+                hash(value)
+            except TypeError:
+                value = id(value)
+            signature.append((key, value))
+        return tuple(signature)
 
     def _get_names(self, ixnobject):
         name = ixnobject.get("name")
@@ -110,11 +101,10 @@ class SimilarObjects(Base):
     def append(self, object):
         self._objects.append(object)
 
-    def compact(self, roots, isTopoComp):
+    def compact(self, isTopoComp):
         multiplier = len(self._objects) + 1
         for object in self._objects:
             self._value_compactor(self._primary_obj, object, isTopoComp)
-            roots.remove(object)
         if not isTopoComp:
             self._primary_obj["multiplier"] = multiplier
 
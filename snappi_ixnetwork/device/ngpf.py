@@ -1,4 +1,4 @@
-import json, re
+import json, re, hashlib
 
 from snappi_ixnetwork.timer import Timer
 from snappi_ixnetwork.device.base import Base
@@ -50,6 +50,12 @@ class Ngpf(Base):
         self.ether_v4gateway_map = {}
         self.ether_v6gateway_map = {}
         self.ether_ip_restriction_map = {}
+        # (topology name, signature) of the last push in IxNetwork order
+        self._applied_topologies = None
+        # xpaths of the topologies (re-)created by the last push, None when
+        # every topology was
+        self._changed_topologies = None
+        self._topology_cleared = False
         self.logger = get_ixnet_logger(__name__)
         self._ethernet = Ethernet(self)
         self._bgp = Bgp(self)
@@ -62,6 +68,11 @@ class Ngpf(Base):
         self._createixnconfig = CreateIxnConfig(self)
 
     def config(self):
+        self.convert()
+        self.push()
+
+    def convert(self):
+        """Build the IxNetwork device config without any import"""
         self._ixn_topo_objects = {}
         self.working_dg = None
         self._ixn_config = dict()
@@ -79,6 +90,8 @@ class Ngpf(Base):
                 self._ixn_config["topology"], "topology"
             )
             self._createixnconfig.post_calculate()
+
+    def push(self):
         with Timer(self.api, "Push IxNetwork device config :"):
             self._pushixnconfig()
 
@@ -113,8 +126,9 @@ class Ngpf(Base):
                 self.api.set_dev_compacted(names[0], names)
 
     def _configure_topology(self):
-        self.stop_topology()
-        self.api._remove(self.api._topology, [])
+        self._topology_cleared = False
+        if self.api._incremental_devices is not True:
+            self._clear_topology()
         ixn_topos = self.create_node(self._ixn_config, "topology")
         # Configured all interfaces
         self._configure_device_group(ixn_topos)
@@ -267,13 +281,141 @@ class Ngpf(Base):
 
     def _pushixnconfig(self):
         self.logger.debug("pushing ixnet config")
+        topologies = None
+        if self.api._incremental_devices and len(self.api.get_errors()) == 0:
+            topologies = self._remove_changed_topologies()
+        if topologies is None:
+            self._changed_topologies = None
+            if self._topology_cleared is False:
+                self._clear_topology()
+            ixn_config = self._ixn_config
+        elif len(topologies) > 0:
+            ixn_config = {"xpath": "/", "topology": topologies}
+        else:
+            ixn_config = None
+        self._applied_topologies = None
         erros = self.api.get_errors()
         if len(erros) > 0:
             return
-        ixn_cnf = json.dumps(self._ixn_config, indent=2)
-        errata = self._resource_manager.ImportConfig(ixn_cnf, False)
-        for item in errata:
-            self.api.warning(item)
+        if ixn_config is not None:
+            ixn_cnf = json.dumps(ixn_config, indent=2)
+            errata = self._resource_manager.ImportConfig(ixn_cnf, False)
+            for item in errata:
+                self.api.warning(item)
+        applied_topologies = []
+        for ixn_topo in self._ixn_config.get("topology", []):
+            applied_topologies.append(
+                (ixn_topo.get("name"), self._get_topology_signature(ixn_topo))
+            )
+        self._applied_topologies = applied_topologies
+
+    def _get_topology_signature(self, ixn_topo):
+        """Returns a digest of the topology which does not depend on the
+        position of the topology or None when the topology refers to
+        any other topology."""
+        own_xpath = ixn_topo["xpath"]
+        content = json.dumps(ixn_topo, sort_keys=True)
+        content = content.replace(own_xpath, "{topology}")
+        if "/topology[" in content:
+            return None
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def _remove_changed_topologies(self):
+        """Remove the topologies which differ from the last push, keeping
+        unchanged topologies (and their running protocols) in place.
+
+        Returns the list of topologies to be imported or None when
+        IxNetwork is out of sync and everything needs to be re-created.
+        The topologies of _ixn_config are reordered and their xpaths are
+        rewritten to match the position they will have in IxNetwork.
+        """
+        if self._applied_topologies is None:
+            return None
+        applied_names = [name for name, _ in self._applied_topologies]
+        if None in dict(self._applied_topologies).values():
+            return None
+        ixn_topos = self.api._topology.find()
+        if [ixn_topo.Name for ixn_topo in ixn_topos] != applied_names:
+            self.logger.debug("Topologies are out of sync with last push")
+            return None
+        signatures = {}
+        for ixn_topo in self._ixn_config.get("topology", []):
+            signature = self._get_topology_signature(ixn_topo)
+            if signature is None:
+                return None
+            signatures[ixn_topo.get("name")] = signature
+        if len(signatures) != len(self._ixn_config.get("topology", [])):
+            return None
+        keep_names = [
+            name
+            for name, signature in self._applied_topologies
+            if signatures.get(name) == signature
+        ]
+        self.logger.debug("Keeping unchanged topologies %s" % keep_names)
+        for ixn_topo in ixn_topos:
+            if ixn_topo.Name in keep_names:
+                continue
+            if ixn_topo.Status == "started":
+                ixn_topo.Stop()
+        self.api._remove(
+            self.api._topology, [{"name": name} for name in keep_names]
+        )
+
+        ixn_topo_map = {}
+        for ixn_topo in self._ixn_config.get("topology", []):
+            ixn_topo_map[ixn_topo.get("name")] = ixn_topo
+        topologies = [ixn_topo_map[name] for name in keep_names]
+        changed_topologies = [
+            ixn_topo
+            for name, ixn_topo in ixn_topo_map.items()
+            if name not in keep_names
+        ]
+        topologies.extend(changed_topologies)
+        for index, ixn_topo in enumerate(topologies, start=1):
+            xpath = "/topology[%d]" % index
+            if ixn_topo["xpath"] != xpath:
+                self._replace_xpath(ixn_topo, ixn_topo["xpath"], xpath)
+        self._ixn_config["topology"] = topologies
+        self._changed_topologies = set(
+            ixn_topo["xpath"] for ixn_topo in changed_topologies
+        )
+        return changed_topologies
+
+    def is_topology_changed(self, names):
+        """Returns True when any of the named objects is part of a topology
+        which was (re-)created by the last push"""
+        if self._changed_topologies is None:
+            return True
+        for name in names:
+            ixn_info = self.api.ixn_objects._ixnet_infos.get(name)
+            if ixn_info is None:
+                ixn_info = self.api.ixn_routes._ixnet_infos.get(name)
+            if ixn_info is None or ixn_info.xpath is None:
+                return True
+            match = re.match(r"^/topology\[\d+\]", ixn_info.xpath)
+            if match is None or match.group() in self._changed_topologies:
+                return True
+        return False
+
+    def _replace_xpath(self, ixn_obj, old_xpath, new_xpath):
+        """Replace old_xpath within every string of the ixn_obj tree"""
+        if isinstance(ixn_obj, dict):
+            items = ixn_obj.items()
+        elif isinstance(ixn_obj, list):
+            items = enumerate(ixn_obj)
+        else:
+            return
+        for key, value in items:
+            if isinstance(value, str):
+                if old_xpath in value:
+                    ixn_obj[key] = value.replace(old_xpath, new_xpath)
+            else:
+                self._replace_xpath(value, old_xpath, new_xpath)
+
+    def _clear_topology(self):
+        self.stop_topology()
+        self.api._remove(self.api._topology, [])
+        self._topology_cleared = True
 
     def stop_topology(self):
         glob_topo = self.api._globals.Topology.refresh()
@@ -297,44 +439,35 @@ class Ngpf(Base):
         if payload.state is None:
             return
         names = payload.names
-        if len(names) == 0:
+        if names is None or len(names) == 0:
             names = self.api.ixn_routes.names
-        ixn_obj_idx_list = {}
         names = list(set(names))
         self.logger.debug("set route state for %s" % names)
+        # route ranges of the same ixnetwork object share one multivalue
+        ranges = {}
         for name in names:
             route_info = self.api.ixn_routes.get(name)
-            ixn_obj = None
-            for obj in ixn_obj_idx_list.keys():
-                if obj.xpath == route_info.xpath:
-                    ixn_obj = obj
-                    break
-            if ixn_obj is None:
-                ixn_obj_idx_list[route_info] = list(
-                    range(
-                        route_info.index,
-                        route_info.index + route_info.multiplier,
-                    )
-                )
-            else:
-                ixn_obj_idx_list[route_info].extend(
-                    list(
-                        range(
-                            route_info.index,
-                            route_info.index + route_info.multiplier,
-                        )
-                    )
-                )
+            ranges.setdefault(route_info.xpath, []).append(
+                (route_info.index, route_info.multiplier)
+            )
+        state = Ngpf._ROUTE_STATE[payload.state]
+        active = "active"
+        xpaths = list(ranges.keys())
         imports = []
-        for obj, index_list in ixn_obj_idx_list.items():
-            xpath = obj.xpath
-            active = "active"
-            index_list = list(set(index_list))
-            object_info = self.select_properties(xpath, properties=[active])
+        for xpath, object_info in zip(
+            xpaths, self.select_properties_list(xpaths, properties=[active])
+        ):
             values = object_info[active]["values"]
-            for idx in index_list:
-                values[idx] = Ngpf._ROUTE_STATE[payload.state]
-            imports.append(self.configure_value(xpath, active, values))
+            changed = False
+            for index, multiplier in ranges[xpath]:
+                if any(
+                    str(value).lower() != str(state).lower()
+                    for value in values[index : index + multiplier]
+                ):
+                    changed = True
+                values[index : index + multiplier] = [state] * multiplier
+            if changed is True:
+                imports.append(self.configure_value(xpath, active, values))
         self.imports(imports)
         self.api._ixnetwork.Globals.Topology.ApplyOnTheFly()
         return names
@@ -378,27 +511,13 @@ class Ngpf(Base):
     def get_states(self, request):
         self.logger.debug("get_states for %s" % request.choice)
         if request.choice == "ipv4_neighbors":
-            ip_objs = (
-                self.api._ixnetwork.Topology.find()
-                .DeviceGroup.find()
-                .Ethernet.find()
-                .Ipv4.find()
-            )
             resolved_mac_list = self._get_ether_resolved_mac(
-                ip_objs,
                 self.ether_v4gateway_map,
                 request.ipv4_neighbors,
                 "ipv4",
             )
         elif request.choice == "ipv6_neighbors":
-            ip_objs = (
-                self.api._ixnetwork.Topology.find()
-                .DeviceGroup.find()
-                .Ethernet.find()
-                .Ipv6.find()
-            )
             resolved_mac_list = self._get_ether_resolved_mac(
-                ip_objs,
                 self.ether_v6gateway_map,
                 request.ipv6_neighbors,
                 "ipv6",
@@ -410,21 +529,76 @@ class Ngpf(Base):
 
         return {"choice": request.choice, request.choice: resolved_mac_list}
 
-    def _get_ether_resolved_mac(
-        self, ip_objs, ether_gateway_map, ip_neighbors, choice
-    ):
+    def _get_arp_entries(self, ethernet_names, choice):
+        """Returns the resolved mac of every gateway of the ethernets,
+        selected with their gateway multivalues in one request"""
+        hrefs = []
+        for ethernet_name in ethernet_names:
+            try:
+                ixn_eth = self.api.ixn_objects.get(ethernet_name)
+            except NameError:
+                ixn_eth = None
+            if (
+                ixn_eth is None
+                or ixn_eth.xpath is None
+                or self.is_ip_restricted(ethernet_name) is True
+            ):
+                # the ip is not configured below the ethernet itself
+                hrefs = ["/"]
+                break
+            href = self._get_href(ixn_eth.xpath)
+            if href not in hrefs:
+                hrefs.append(href)
+        child = "(?i)^(%s)$" % choice
+        if hrefs == ["/"]:
+            child = "(?i)^(topology|deviceGroup|ethernet|%s)$" % choice
+        payload = {
+            "selects": [
+                {
+                    "from": href,
+                    "properties": [],
+                    "children": [
+                        {
+                            "child": child,
+                            "properties": [
+                                "gatewayIp",
+                                "resolvedGatewayMac",
+                            ],
+                            "filters": [],
+                        }
+                    ],
+                    "inlines": [
+                        {"child": "multivalue", "properties": ["values"]}
+                    ],
+                }
+                for href in hrefs
+            ]
+        }
+        url = "%s/operations/select?xpath=true" % self.api._ixnetwork.href
+        results = self.api._ixnetwork._connection._execute(url, payload)
         arp_entries = {}
-        for ip_obj in ip_objs:
-            resolved_mac_list = ip_obj.ResolvedGatewayMac
-            for index, gateway in enumerate(ip_obj.GatewayIp.Values):
-                resolved_mac = resolved_mac_list[index]
-                if re.search("unresolved", resolved_mac.lower()) is not None:
-                    resolved_mac = None
-                arp_entries[gateway] = resolved_mac
-
+        nodes = list(results or [])
+        while len(nodes) > 0:
+            node = nodes.pop()
+            for key in ["topology", "deviceGroup", "ethernet"]:
+                nodes.extend(node.get(key, []))
+            for ip_obj in node.get(choice, []):
+                resolved_mac_list = ip_obj["resolvedGatewayMac"]
+                for index, gateway in enumerate(ip_obj["gatewayIp"]["values"]):
+                    resolved_mac = resolved_mac_list[index]
+                    if (
+                        re.search("unresolved", resolved_mac.lower())
+                        is not None
+                    ):
+                        resolved_mac = None
+                    arp_entries[gateway] = resolved_mac
+        return arp_entries
+
+    def _get_ether_resolved_mac(self, ether_gateway_map, ip_neighbors, choice):
         ethernet_names = ip_neighbors.ethernet_names
         if ethernet_names is None:
             ethernet_names = ether_gateway_map.keys()
+        arp_entries = self._get_arp_entries(ethernet_names, choice)
         resolved_mac_list = []
         for ethernet_name in ethernet_names:
             gateway_ips = ether_gateway_map[ethernet_name]
@@ -460,7 +634,13 @@ class Ngpf(Base):
         return xpath.replace("[", "/").replace("]", "")
 
     def select_properties(self, xpath, properties=[]):
-        href = self._get_href(xpath)
+        return self.select_properties_list([xpath], properties)[0]
+
+    def select_properties_list(self, xpaths, properties=[]):
+        """Selects the properties of many objects in one request"""
+        if len(xpaths) == 0:
+            return []
+        hrefs = [self._get_href(xpath) for xpath in xpaths]
         payload = {
             "selects": [
                 {
@@ -474,14 +654,14 @@ class Ngpf(Base):
                         }
                     ],
                 }
+                for href in hrefs
             ]
         }
         url = "%s/operations/select?xpath=true" % self.api._ixnetwork.href
         results = self.api._ixnetwork._connection._execute(url, payload)
-        try:
-            return results[0]
-        except Exception:
-            raise Exception("Problem to select %s" % href)
+        if results is None or len(results) != len(hrefs):
+            raise Exception("Problem to select %s" % ", ".join(hrefs))
+        return results
 
     def imports(self, imports):
         self.logger.debug("imports of portion of config")
@@ -0,0 +1,211 @@
+import json
+import threading
+import time
+from snappi_ixnetwork.logger import get_ixnet_logger
+
+
+class MetricsSnapshot(object):
+    """The response of one metrics request at a point in time
+
+    Args
+    ----
+    - version (int): incremented every time the request is refreshed
+    - timestamp (float): time.time() when the response was fetched
+    - rows (list(dict)): the serialized metrics of the response
+    """
+
+    def __init__(self, version, timestamp, rows):
+        self.version = version
+        self.timestamp = timestamp
+        self.rows = rows
+
+    @property
+    def age(self):
+        return time.time() - self.timestamp
+
+
+class MetricsPoller(object):
+    """Refreshes metrics requests in a background thread
+
+    Every metrics request served by get_metrics is registered with the
+    poller and refreshed every interval seconds into a versioned snapshot.
+    get_metrics is answered from the latest snapshot as long as it is not
+    older than max_age seconds, otherwise the request is fetched right away.
+    The metrics fetches, foreground or background, are serialized through
+    one lock so that concurrent consumers of get_metrics waiting for the
+    same request share one fetch instead of each polling the API server.
+
+    Args
+    ----
+    - ixnetworkapi (Api): instance of the Api class
+    - interval (float): seconds between two refreshes of every request
+    - max_age (float): maximum age in seconds of a snapshot served from cache
+    """
+
+    # the properties identifying a metric between two snapshots, flow
+    # metrics of one name differ by their ports
+    _IDENTITY = ["name", "port_tx", "port_rx"]
+
+    def __init__(self, ixnetworkapi, interval=1, max_age=2):
+        self._api = ixnetworkapi
+        self._interval = interval
+        self._max_age = max_age
+        self._lock = threading.RLock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._requests = {}
+        self._snapshots = {}
+        self._previous = {}
+        self.logger = get_ixnet_logger(__name__)
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="snappi-ixn-metrics-poller"
+        )
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._thread = None
+
+    def clear(self):
+        """Drop all the registered requests and their snapshots, e.g. once
+        the configuration has changed"""
+        with self._lock:
+            self._requests = {}
+            self._snapshots = {}
+            self._previous = {}
+
+    def get(self, request):
+        """Returns the metrics response of request from the cache, a request
+        seen for the first time is fetched and registered for refreshes.
+        Returns None if the choice of request is not supported"""
+        key = request.serialize()
+        snapshot = self._snapshots.get(key)
+        if snapshot is None or snapshot.age > self._max_age:
+            snapshot = self._refresh(key, request, self._max_age)
+        if snapshot is None:
+            return None
+        return self._response(request, snapshot)
+
+    def get_snapshot(self, request):
+        """Returns the latest MetricsSnapshot of request or None"""
+        return self._snapshots.get(request.serialize())
+
+    def get_deltas(self, request):
+        """Returns the change of every counter of request between the last
+        two snapshots, one dict per metric holding its identity (name and
+        ports), the <counter>_delta and the <counter>_rate per second"""
+        key = request.serialize()
+        with self._lock:
+            current = self._snapshots.get(key)
+            previous = self._previous.get(key)
+        if current is None or previous is None:
+            return []
+        elapsed = current.timestamp - previous.timestamp
+        previous_rows = {self._get_row_key(row): row for row in previous.rows}
+        deltas = []
+        for row in current.rows:
+            previous_row = previous_rows.get(self._get_row_key(row))
+            if previous_row is None:
+                continue
+            delta = {name: row[name] for name in self._IDENTITY if name in row}
+            for name, value in row.items():
+                value = self._counter(value)
+                previous_value = self._counter(previous_row.get(name))
+                if value is None or previous_value is None:
+                    continue
+                delta[name + "_delta"] = value - previous_value
+                if elapsed > 0:
+                    delta[name + "_rate"] = delta[name + "_delta"] / elapsed
+            deltas.append(delta)
+        return deltas
+
+    def _get_row_key(self, row):
+        """The identity of a metrics row, the tagged metrics of a flow row
+        are told apart by their tags"""
+        key = [row.get(name) for name in self._IDENTITY]
+        for tagged_metric in row.get("tagged_metrics") or []:
+            key.append(json.dumps(tagged_metric.get("tags"), sort_keys=True))
+        return tuple(key)
+
+    def _counter(self, value):
+        # 64 bit counters are serialized as strings
+        if isinstance(value, bool):
+            return None
+        if isinstance(value, int):
+            return value
+        if isinstance(value, str) and value.isdigit():
+            return int(value)
+        return None
+
+    def _refresh(self, key, request, max_age=None):
+        with self._lock:
+            snapshot = self._snapshots.get(key)
+            # another consumer may have refreshed it while waiting the lock
+            if (
+                max_age is not None
+                and snapshot is not None
+                and snapshot.age <= max_age
+            ):
+                return snapshot
+            response = self._api._get_metrics(request)
+            if response is None:
+                return None
+            rows = self._serialize_rows(response, request)
+            version = 1 if snapshot is None else snapshot.version + 1
+            snapshot = MetricsSnapshot(version, time.time(), rows)
+            if key in self._snapshots:
+                self._previous[key] = self._snapshots[key]
+            self._snapshots[key] = snapshot
+            if key not in self._requests:
+                # a copy, the caller may change and reuse its request
+                self._requests[key] = self._api.metrics_request().deserialize(
+                    key
+                )
+        return snapshot
+
+    def _serialize_rows(self, response, request):
+        metrics = getattr(response, self._metrics_name(request))
+        return [metric.serialize(metric.DICT) for metric in metrics]
+
+    def _response(self, request, snapshot):
+        response = self._api.metrics_response()
+        metrics = getattr(response, self._metrics_name(request))
+        metrics.deserialize(snapshot.rows)
+        return response
+
+    def _metrics_name(self, request):
+        choice = request.choice
+        if choice == "rocev2_flow":
+            return "rocev2_flow_per_qp_metrics"
+        if choice in ["rocev2_ipv4", "rocev2_ipv6"]:
+            return choice + "_per_peer_metrics"
+        return choice + "_metrics"
+
+    def _run(self):
+        while not self._stop_event.wait(self._interval):
+            for key, request in list(self._requests.items()):
+                if self._stop_event.is_set():
+                    break
+                try:
+                    with self._lock:
+                        # the request was dropped by clear meanwhile
+                        if key not in self._requests:
+                            continue
+                        self._refresh(key, request)
+                except Exception as err:
+                    self.logger.debug(
+                        "Could not refresh %s metrics: %s"
+                        % (request.choice, err)
+                    )
@@ -1,3 +1,4 @@
+from collections import Counter
 from snappi_ixnetwork.logger import get_ixnet_logger
 
 
@@ -51,7 +52,9 @@ class IxNetObjects(object):
     def set_scalable(self, ixnobject):
         names = ixnobject.get("name")
         self.logger.debug("set_scalable names : %s" % names)
-        set_names = []
+        set_names = set()
+        name_counts = Counter(names)
+        keys = sorted(ixnobject)
         for index, name in enumerate(names):
             if name is None or name in set_names:
                 continue
@@ -59,15 +62,14 @@ class IxNetObjects(object):
                 continue
             # Same name may present within different object structure
             old_keys = sorted(self._ixnet_infos[name].ixnobject)
-            keys = sorted(ixnobject)
             if old_keys != keys:
                 continue
-            set_names.append(name)
+            set_names.add(name)
             self._ixnet_infos[name] = IxNetInfo(
                 ixnobject,
                 self.get_working_dg(names[0]),
                 index=index,
-                multiplier=names.count(name),
+                multiplier=name_counts[name],
                 names=names,
             )
 
@@ -0,0 +1,241 @@
+import io
+import mmap
+import struct
+import zlib
+from array import array
+
+
+class PcapIndex(object):
+    """Offset index of the packets of a pcap or pcapng capture
+
+    One pass over the memory mapped capture records the file offset, the
+    timestamp, the captured length and a hash of selected header fields of
+    every packet, without copying nor parsing the packets. Queries on the
+    index then only touch the packets they return, as memoryview slices of
+    the mapped file, which are only valid until the index is closed.
+
+    Args
+    ----
+    - capture (Union[str, bytes, io.BytesIO]): the path of the capture file
+      or its content, e.g. the byte stream returned by get_capture
+    - key_fields (list(tuple)): the (offset, length) in the packet of the
+      header fields hashed into the key of every packet, by default the
+      IPv4 protocol, addresses and L4 ports of an untagged ethernet frame
+    """
+
+    IPV4_FIVE_TUPLE = [(23, 1), (26, 8), (34, 4)]
+
+    _PCAP_MAGIC = {
+        b"\xd4\xc3\xb2\xa1": ("<", 1e-6),
+        b"\xa1\xb2\xc3\xd4": (">", 1e-6),
+        b"\x4d\x3c\xb2\xa1": ("<", 1e-9),
+        b"\xa1\xb2\x3c\x4d": (">", 1e-9),
+    }
+    _PCAPNG_SHB = 0x0A0D0D0A
+    _PCAPNG_IDB = 0x00000001
+    _PCAPNG_SPB = 0x00000003
+    _PCAPNG_EPB = 0x00000006
+
+    def __init__(self, capture, key_fields=None):
+        self._key_fields = (
+            PcapIndex.IPV4_FIVE_TUPLE if key_fields is None else key_fields
+        )
+        self._file = None
+        self._mmap = None
+        if isinstance(capture, str):
+            self._file = open(capture, "rb")
+            self._mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ
+            )
+            self._data = self._mmap
+        elif isinstance(capture, io.BytesIO):
+            self._data = capture.getbuffer()
+        else:
+            self._data = memoryview(capture)
+        self._buffer = memoryview(self._data)
+        self._offsets = array("Q")
+        self._lengths = array("I")
+        self._timestamps = array("d")
+        self._keys = array("I")
+        if bytes(self._data[0:4]) in PcapIndex._PCAP_MAGIC:
+            self._index_pcap()
+        else:
+            self._index_pcapng()
+
+    def close(self):
+        """Unmaps the capture, the packets returned must be released"""
+        self._buffer.release()
+        if isinstance(self._data, memoryview):
+            self._data.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        """A packet or, for a slice, a list of packets of the capture"""
+        if isinstance(index, slice):
+            return [self._packet(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        return self._packet(index)
+
+    def key(self, packet):
+        """The key of a packet, e.g. of a packet built for a flow"""
+        return zlib.crc32(
+            b"".join(
+                bytes(packet[offset : offset + length])
+                for offset, length in sorted(self._key_fields)
+            )
+        )
+
+    def timestamp(self, index):
+        return self._timestamps[index]
+
+    def packets(self, key=None, start=None, end=None):
+        """Yields the (timestamp, packet) of the packets matching the key
+        and captured within [start, end), lazily"""
+        for index in self.indices(key, start, end):
+            yield self._timestamps[index], self._packet(index)
+
+    def indices(self, key=None, start=None, end=None):
+        """Yields the index of the packets matching the key and captured
+        within [start, end)"""
+        first, last = 0, len(self)
+        if start is not None:
+            first = self._bisect(start)
+        if end is not None:
+            last = self._bisect(end)
+        keys = self._keys
+        for index in range(first, last):
+            if key is None or keys[index] == key:
+                yield index
+
+    def count(self, key=None, start=None, end=None):
+        return sum(1 for _ in self.indices(key, start, end))
+
+    def _packet(self, index):
+        offset = self._offsets[index]
+        return self._buffer[offset : offset + self._lengths[index]]
+
+    def _bisect(self, timestamp):
+        # the packets of a capture are recorded in time order
+        low, high = 0, len(self._timestamps)
+        while low < high:
+            middle = (low + high) // 2
+            if self._timestamps[middle] < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _get_adder(self, data):
+        """Returns a function recording the packet at an offset of data,
+        the hot path of the indexing pass"""
+        offsets = self._offsets.append
+        lengths = self._lengths.append
+        timestamps = self._timestamps.append
+        keys = self._keys.append
+        crc32 = zlib.crc32
+        # the key fields of a packet are extracted by one struct unpack
+        key_format = "<"
+        key_end = 0
+        for offset, length in sorted(self._key_fields):
+            if offset < key_end:
+                key_format = None
+                break
+            key_format += "%dx%ds" % (offset - key_end, length)
+            key_end = offset + length
+        if key_format is not None:
+            unpack_key = struct.Struct(key_format).unpack_from
+        key = self.key
+
+        def add(offset, length, timestamp):
+            offsets(offset)
+            lengths(length)
+            timestamps(timestamp)
+            if key_format is not None and length >= key_end:
+                keys(crc32(b"".join(unpack_key(data, offset))))
+            else:
+                keys(key(data[offset : offset + length]))
+
+        return add
+
+    def _index_pcap(self):
+        data = self._data
+        add = self._get_adder(data)
+        endian, resolution = PcapIndex._PCAP_MAGIC[bytes(data[0:4])]
+        record = struct.Struct(endian + "IIII")
+        unpack_from = record.unpack_from
+        offset = 24
+        size = len(data) - record.size
+        while offset <= size:
+            seconds, fraction, length, _ = unpack_from(data, offset)
+            offset += record.size
+            add(offset, length, seconds + fraction * resolution)
+            offset += length
+
+    def _index_pcapng(self):
+        data = self._data
+        add = self._get_adder(data)
+        size = len(data)
+        offset = 0
+        resolutions = []
+        header = struct.Struct("<II")
+        epb = struct.Struct("<IIIIII")
+        while offset + 12 <= size:
+            block_type, block_length = header.unpack_from(data, offset)
+            if block_type == PcapIndex._PCAPNG_SHB:
+                magic = data[offset + 8 : offset + 12]
+                endian = "<" if magic == b"\x4d\x3c\x2b\x1a" else ">"
+                header = struct.Struct(endian + "II")
+                epb = struct.Struct(endian + "IIIIII")
+                block_type, block_length = header.unpack_from(data, offset)
+                resolutions = []
+            if block_length < 12:
+                raise ValueError("Invalid pcapng block at offset %d" % offset)
+            if block_type == PcapIndex._PCAPNG_EPB:
+                _, _, interface, high, low, length = epb.unpack_from(
+                    data, offset
+                )
+                resolution = (
+                    resolutions[interface]
+                    if interface < len(resolutions)
+                    else 1e-6
+                )
+                add(offset + 28, length, ((high << 32) | low) * resolution)
+            elif block_type == PcapIndex._PCAPNG_IDB:
+                resolutions.append(
+                    self._get_resolution(data, offset, header.format[0])
+                )
+            elif block_type == PcapIndex._PCAPNG_SPB:
+                (length,) = struct.unpack_from(
+                    header.format[0] + "I", data, offset + 8
+                )
+                add(offset + 12, min(length, block_length - 16), 0.0)
+            offset += block_length
+
+    def _get_resolution(self, buffer, offset, endian):
+        """The timestamp resolution of an interface description block"""
+        block_length = struct.unpack_from(endian + "I", buffer, offset + 4)[0]
+        end = offset + block_length - 4
+        option = offset + 16
+        while option + 4 <= end:
+            code, length = struct.unpack_from(endian + "HH", buffer, option)
+            if code == 0:
+                break
+            if code == 9 and length == 1:
+                value = buffer[option + 4]
+                if value & 0x80:
+                    return 2.0 ** -(value & 0x7F)
+                return 10.0**-value
+            option += 4 + (length + 3) // 4 * 4
+        return 1e-6
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from snappi_ixnetwork.timer import Timer
 
 
@@ -14,70 +15,89 @@ class Ping(object):
 
     Notes
     -----
+    The interfaces are resolved from the objects recorded while
+    configuring the devices, without any request. The requests of one
+    source interface are sent one after the other, different source
+    interfaces are pinged concurrently by up to max_workers threads.
     """
 
     def __init__(self, ixnetworkapi):
         self._api = ixnetworkapi
+        self.max_workers = 8
 
     def results(self, ping_request, req_type=None):
-        responses = []
-        v4_names = []
-        for device in self._api._config.devices:
-            for eth in device.ethernets:
-                for ip in eth.ipv4_addresses:
-                    v4_names.append(ip.name)
-        v6_names = []
-        for device in self._api._config.devices:
-            for eth in device.ethernets:
-                for ip in eth.ipv6_addresses:
-                    v6_names.append(ip.name)
         if req_type == None:
             raise Exception(
                 "req_type variable is mandatory to decide ipv4 or ipv6"
             )
-        else:
-            with Timer(self._api, "Ping requests completed in"):
-                for endpoint in ping_request.requests:
-                    response = {}
-                    src_name = endpoint.get("src_name")
-                    dst_ip = endpoint.get("dst_ip")
-                    if req_type == "ipv4":
-                        if src_name not in v4_names:
-                            msg = (
-                                src_name
-                                + """ is not available in the configured v4 interface names """
-                                + str(v4_names)
-                            )
-                            raise Exception(msg)
-                        ip_obj = (
-                            self._api._ixnetwork.Topology.find()
-                            .DeviceGroup.find()
-                            .Ethernet.find()
-                            .Ipv4.find(Name=src_name)
-                        )
-                    elif req_type == "ipv6":
-                        if src_name not in v6_names:
-                            msg = (
-                                src_name
-                                + """ is not available in the configured v6 interface names """
-                                + str(v6_names)
-                            )
-                            raise Exception(msg)
-                        ip_obj = (
-                            self._api._ixnetwork.Topology.find()
-                            .DeviceGroup.find()
-                            .Ethernet.find()
-                            .Ipv6.find(Name=src_name)
-                        )
-                    self._api.info("Sending ping to %s" % dst_ip)
-                    ping_status = ip_obj.SendPing(DestIP=dst_ip)
-                    for reply in ping_status:
-                        if dst_ip in reply["arg3"]:
-                            if reply["arg2"]:
-                                response["result"] = "succeeded"
-                            else:
-                                response["result"] = "failed"
-                    response["src_name"] = src_name
-                    response["dst_ip"] = dst_ip
-                    responses.append(response)
-                return responses
+        attr = "ipv4_addresses" if req_type == "ipv4" else "ipv6_addresses"
+        ip_names = []
+        for device in self._api._config.devices:
+            for eth in device.ethernets:
+                for ip in getattr(eth, attr):
+                    ip_names.append(ip.name)
+        configured = set(ip_names)
+        requests = []
+        sources = {}
+        for endpoint in ping_request.requests:
+            src_name = endpoint.get("src_name")
+            dst_ip = endpoint.get("dst_ip")
+            if src_name not in configured:
+                msg = (
+                    "%s is not available in the configured %s interface "
+                    "names %s" % (src_name, req_type[-2:], ip_names)
+                )
+                raise Exception(msg)
+            requests.append((src_name, dst_ip))
+            # the same ping is only sent once
+            sources.setdefault(src_name, {})[dst_ip] = None
+        with Timer(self._api, "Ping requests completed in"):
+            results = {}
+            if len(sources) > 0:
+                workers = min(self.max_workers, len(sources))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = [
+                        executor.submit(self._send_pings, src_name, dst_ips)
+                        for src_name, dst_ips in sources.items()
+                    ]
+                    for future in futures:
+                        results.update(future.result())
+            responses = []
+            for src_name, dst_ip in requests:
+                response = {}
+                result = results[(src_name, dst_ip)]
+                if result is not None:
+                    response["result"] = result
+                response["src_name"] = src_name
+                response["dst_ip"] = dst_ip
+                responses.append(response)
+            return responses
+
+    def _send_pings(self, src_name, dst_ips):
+        """Pings every destination from one source interface in turn"""
+        url, payload = self._get_ping_payload(src_name)
+        results = {}
+        for dst_ip in dst_ips:
+            self._api.info("Sending ping to %s" % dst_ip)
+            payload["arg2"] = dst_ip
+            ping_status = self._api._ixnetwork._connection._execute(
+                url, payload
+            )
+            result = None
+            for reply in ping_status or []:
+                if dst_ip in reply["arg3"]:
+                    result = "succeeded" if reply["arg2"] else "failed"
+            results[(src_name, dst_ip)] = result
+        return results
+
+    def _get_ping_payload(self, src_name):
+        ixn_info = self._api.ixn_objects.get(src_name)
+        href = "%s%s" % (
+            self._api._ixnetwork.href.rstrip("/"),
+            ixn_info.xpath.replace("[", "/").replace("]", ""),
+        )
+        payload = {"arg1": href}
+        if len(ixn_info.names) > 0:
+            # a compacted interface is one session of the ixnetwork object
+            payload["arg3"] = [ixn_info.index + 1]
+        return "%s/operations/sendping" % href, payload
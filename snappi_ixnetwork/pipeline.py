@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from collections import OrderedDict
+from snappi_ixnetwork.timer import Timer
+from snappi_ixnetwork.logger import get_ixnet_logger
+
+
+class Pipeline(object):
+    """Runs configuration stages as a dependency graph
+
+    Every stage is started in a worker thread as soon as all the stages it
+    depends on are complete, so that stages which do not depend on each
+    other (e.g. converting the flows while the port locations are being
+    connected) overlap. If a stage fails no further stages are started and
+    the first exception is raised once the running stages have finished.
+    The stages share one restpy session, stages sending requests must
+    depend on each other so that they are not run at the same time.
+
+    Args
+    ----
+    - ixnetworkapi (Api): instance of the Api class
+    - max_workers (int): maximum number of stages running at the same time
+    """
+
+    def __init__(self, ixnetworkapi, max_workers=3):
+        self._api = ixnetworkapi
+        self._max_workers = max_workers
+        self._stages = OrderedDict()
+        self.logger = get_ixnet_logger(__name__)
+
+    def add(self, name, func, depends_on=None):
+        """Add a stage which will run func after the depends_on stages"""
+        if depends_on is None:
+            depends_on = []
+        for dependency in depends_on:
+            if dependency not in self._stages:
+                raise ValueError(
+                    "Stage %s depends on unknown stage %s" % (name, dependency)
+                )
+        self._stages[name] = (func, depends_on)
+
+    def run(self):
+        done = set()
+        running = {}
+        error = None
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            while len(done) < len(self._stages):
+                if error is None:
+                    for name, (func, depends_on) in self._stages.items():
+                        if name in done or name in running.values():
+                            continue
+                        if all(dep in done for dep in depends_on):
+                            self.logger.debug("Starting stage %s" % name)
+                            future = executor.submit(self._run, name, func)
+                            running[future] = name
+                if len(running) == 0:
+                    break
+                completed, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in completed:
+                    name = running.pop(future)
+                    if future.exception() is not None and error is None:
+                        error = future.exception()
+                    done.add(name)
+        if error is not None:
+            raise error
+
+    def _run(self, name, func):
+        with Timer(self._api, "Stage %s :" % name):
+            return func()
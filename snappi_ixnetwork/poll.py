@@ -0,0 +1,75 @@
+import time
+import random
+from collections import OrderedDict, namedtuple
+from snappi_ixnetwork.logger import get_ixnet_logger
+
+PollMetrics = namedtuple("PollMetrics", ["attempts", "elapsed", "timed_out"])
+
+poll_data = OrderedDict()
+# the oldest polls are dropped from poll_data beyond this number of names
+POLL_DATA_SIZE = 256
+
+logger = get_ixnet_logger(__name__)
+
+
+def poll(
+    func,
+    name,
+    timeout,
+    interval=0.1,
+    max_interval=2.0,
+    backoff=2.0,
+    jitter=0.1,
+    deadline=None,
+    error=None,
+):
+    """Calls func until it returns a truthy value and returns that value
+
+    The wait between two calls starts at interval seconds and is multiplied
+    by backoff up to max_interval, every wait is randomized by +/- jitter
+    so that concurrent pollers do not query the API server in lockstep.
+    Polling stops after timeout seconds or at the absolute time.time()
+    deadline of an enclosing operation, whichever comes first. On timeout
+    error is raised if given, otherwise the last result of func is returned.
+    The attempts and elapsed time of the latest poll of every name are
+    recorded in poll_data, which holds up to POLL_DATA_SIZE names.
+
+    Args
+    ----
+    - func (callable): the condition, called without arguments
+    - name (str): the name of the poll in poll_data and in the log
+    - timeout (float): maximum number of seconds to poll
+    - deadline (float): absolute time.time() by which polling must end
+    - error (Exception): raised when the timeout is reached
+    """
+    start = time.time()
+    end = start + timeout
+    if deadline is not None:
+        end = min(end, deadline)
+    attempts = 0
+    wait = interval
+    while True:
+        attempts += 1
+        result = func()
+        now = time.time()
+        if result or now >= end:
+            timed_out = not result
+            poll_data.pop(name, None)
+            poll_data[name] = PollMetrics(attempts, now - start, timed_out)
+            while len(poll_data) > POLL_DATA_SIZE:
+                poll_data.popitem(last=False)
+            logger.debug(
+                "Poll %s: %d attempts in %.3fs%s"
+                % (
+                    name,
+                    attempts,
+                    now - start,
+                    " timed out" if timed_out else "",
+                )
+            )
+            if timed_out and error is not None:
+                raise error
+            return result
+        sleep = wait * random.uniform(1 - jitter, 1 + jitter)
+        time.sleep(max(0, min(sleep, end - now)))
+        wait = min(wait * backoff, max_interval)
@@ -1,4 +1,7 @@
+import re
 from snappi_ixnetwork.timer import Timer
+from snappi_ixnetwork.poll import poll
+from snappi_ixnetwork.statview import StatViewReader
 import time
 
 
@@ -17,6 +20,8 @@ class ProtocolMetrics(object):
         "isis",
     ]
 
+    _DEVICE_GROUP_HREF = re.compile(r"(/topology/\d+(?:/deviceGroup/\d+)+)")
+
     _TOPO_STATS = {
         "name": "name",
         "total": "sessions_total",
@@ -249,6 +254,8 @@ class ProtocolMetrics(object):
         self.device_names = []
         self.metric_timeout = 90
         self.interval = 1
+        self._protocol_views = {}
+        self._device_group_names = None
 
     def _get_search_payload(self, parent, child, properties, filters):
         payload = {
@@ -277,16 +284,6 @@ class ProtocolMetrics(object):
         result = self.ixn._connection._execute(url, payload)[0]
         return result.get("view")
 
-    def _wait_for(self, func, exp_msg, interval, timeout):
-        end_time = round(time.time()) + timeout
-        while True:
-            res = func()
-            if round(time.time()) >= end_time:
-                raise Exception(exp_msg)
-            if res is not None:
-                return res
-            time.sleep(interval)
-
     def get_supported_protocols(self):
         """
         Return the protocols that are supported currently
@@ -304,11 +301,12 @@ class ProtocolMetrics(object):
                 "regex": "^%s$" % protocol_name["per_port"],
             }
         ]
-        view = self._wait_for(
+        view = poll(
             lambda: self._select_view(filter),
-            "could not retrieve the view for %s" % protocol,
-            self.interval,
+            "View %s" % protocol_name["per_port"],
             self.metric_timeout,
+            max_interval=self.interval,
+            error=Exception("could not retrieve the view for %s" % protocol),
         )
         res = self._get_column_values(view[0]["href"], "Port")
         if res is None or len(res) == 0:
@@ -330,15 +328,17 @@ class ProtocolMetrics(object):
         return res.get("result")
 
     def _check_if_page_ready(self, view):
-        count = 0
-        while True:
+        def is_ready():
             view.Refresh()
-            if view.Data.IsReady:
-                break
-            if count >= self.metric_timeout:
-                raise Exception("View Page is not ready")
-            time.sleep(0.5)
-            count += 1
+            return view.Data.IsReady
+
+        poll(
+            is_ready,
+            "View page ready",
+            self.metric_timeout,
+            max_interval=self.interval,
+            error=Exception("View Page is not ready"),
+        )
 
     def _port_names_from_devices(self):
         config = self._api.snappi_config
@@ -357,7 +357,7 @@ class ProtocolMetrics(object):
                     port_list.append(eth.get("connection").get("port_name"))
         return port_list
 
-    def _do_drill_down(self, view, per_port, row_index, drill_option):
+    def _get_drill_down_href(self, view):
         url, payload = self._get_search_payload(
             view["href"],
             "drillDown",
@@ -367,12 +367,18 @@ class ProtocolMetrics(object):
         result = self.ixn._connection._execute(url, payload)[0]
         if result.get("drillDown") is None:
             raise Exception("Could not fetch drill down node")
+        return result["drillDown"]["href"]
 
+    def _do_drill_down(
+        self, view, per_port, row_index, drill_option, drill_href=None
+    ):
+        if drill_href is None:
+            drill_href = self._get_drill_down_href(view)
         payload = {
             "targetDrillDownOption": drill_option,
             "targetRowIndex": row_index,
         }
-        url = result["drillDown"]["href"]
+        url = drill_href
         count = 0
         while count < 5:
             # retrying as the linux api server throws error for first 2
@@ -390,11 +396,20 @@ class ProtocolMetrics(object):
         url = "{}/statistics/view/drillDown/operations/dodrilldown".format(
             self.ixn.href
         )
-        payload = {"arg1": result["drillDown"]["href"]}
+        payload = {"arg1": drill_href}
         self._api._request("POST", url, payload)
         return
 
     def _get_per_device_group_stats(self, protocol):
+        if self._api._protocol_views is True:
+            try:
+                return self._get_protocol_view_stats(protocol)
+            except Exception as e:
+                self._api.warning(
+                    "Could not read the %s statistics view, falling back to "
+                    "drill downs: %s" % (protocol, e)
+                )
+                self.clear_views()
         ports, v = self._port_list_in_per_port(protocol)
         config_ports = self._port_names_from_devices()
         indices = set(
@@ -407,11 +422,16 @@ class ProtocolMetrics(object):
         per_port = self._PROTO_NAME_MAP_[protocol]["per_port"]
         column_names = self._RESULT_COLUMNS.get(protocol, [])
         row_lst = list()
+        # the drill down node and view are looked up once for all the ports
+        drill_href = self._get_drill_down_href(v) if len(indices) > 0 else None
+        drill = None
         for i in indices:
             try:
-                drill = self.ixn.Statistics.View.find(Caption=drill_name)
                 for option in drill_options:
-                    self._do_drill_down(v, per_port, i, option)
+                    self._do_drill_down(v, per_port, i, option, drill_href)
+                if drill is None or len(drill) == 0:
+                    # the drill down view exists after the first drill down
+                    drill = self.ixn.Statistics.View.find(Caption=drill_name)
                 self._check_if_page_ready(drill)
             except Exception as e:
                 msg = """
@@ -423,38 +443,102 @@ class ProtocolMetrics(object):
             columns = drill.Data.ColumnCaptions
             drill.Data.PageSize = drill.Data.TotalRows
             values = drill.Data.PageValues
-            for value in values:
-                row_dt = dict()
-                data = dict(zip(columns, value[0]))
-                for col in column_names:
-                    sn, ixn, typ = col[:3]
-                    skip = False if len(col) <= 3 else col[-1]
-                    self._set_result_value(row_dt, data, sn, ixn, typ, skip)
-                if row_dt != {}:
-                    row_lst.append(row_dt)
+            self._convert_rows(
+                columns, [value[0] for value in values], column_names, row_lst
+            )
+        return row_lst
+
+    def _convert_rows(self, columns, values, column_names, row_lst):
+        device_names = self._get_device_name_set()
+        for value in values:
+            data = self._update_actual_dev_name(dict(zip(columns, value)))
+            if data["Device Group"] not in device_names:
+                continue
+            row_dt = dict()
+            for col in column_names:
+                sn, ixn, typ = col[:3]
+                skip = False if len(col) <= 3 else col[-1]
+                self._set_result_value(row_dt, data, sn, ixn, typ, skip)
+            if row_dt != {}:
+                row_lst.append(row_dt)
+
+    def _get_protocol_view_stats(self, protocol):
+        """Reads the per session statistics of all the ports from one
+        custom view instead of drilling down into every port"""
+        caption = self._get_protocol_view(protocol)
+        column_names = self._RESULT_COLUMNS.get(protocol, [])
+        rows = StatViewReader(self._api, caption).rows()
+        row_lst = list()
+        for row in rows:
+            values = [row[column] for column in row.Columns]
+            self._convert_rows(row.Columns, [values], column_names, row_lst)
         return row_lst
 
+    def _get_protocol_view(self, protocol):
+        """Creates the custom view of the per session statistics of the
+        protocol once per configuration, returns its caption"""
+        if protocol in self._protocol_views:
+            return self._protocol_views[protocol]
+        caption = "snappi %s" % protocol
+        statistics = self.ixn.Statistics
+        view = statistics.View.find(Caption="^%s$" % caption)
+        if len(view) > 0:
+            view.remove()
+        drill_option = self._PROTO_NAME_MAP_[protocol][
+            "drill_down_options"
+        ][-1]
+        protocol_name, grouping = drill_option.split(":")
+        with Timer(self._api, "Create %s statistics view" % protocol):
+            view = statistics.View.add(
+                Caption=caption, Type="layer23NextGenProtocol", Visible=True
+            )
+            ngp_filter = view.Layer23NextGenProtocolFilter.find()
+            cv_filter = view.AdvancedCVFilters.add(
+                Caption=caption, Protocol=protocol_name, Grouping=grouping
+            )
+            ngp_filter.update(
+                AdvancedFilterName="No Filter",
+                AdvancedCVFilter=cv_filter.href,
+                PortFilterIds=[
+                    port_filter.href
+                    for port_filter in view.AvailablePortFilter.find()
+                ],
+            )
+            for statistic in view.Statistic.find():
+                statistic.Enabled = True
+            view.Enabled = True
+        self._protocol_views[protocol] = caption
+        return caption
+
+    def clear_views(self):
+        """Removes the custom views, e.g. once the configuration changed"""
+        if len(self._protocol_views) > 0 and self.ixn is not None:
+            for caption in self._protocol_views.values():
+                view = self.ixn.Statistics.View.find(Caption="^%s$" % caption)
+                if len(view) > 0:
+                    view.remove()
+        self._protocol_views = {}
+
     def _update_actual_dev_name(self, data):
-        keys = self._api.dev_compacted.keys()
-        if data["Device Group"] in keys:
-            for k, v in self._api.dev_compacted.items():
-                if (
-                    data["Device Group"] == v["dev_name"]
-                    and int(data["Device#"]) == v["index"] + 1
-                ):
-                    data["Device Group"] = k
+        dev_compacted_index = self._api.dev_compacted_index
+        if len(dev_compacted_index) > 0 and "Device#" in data:
+            name = dev_compacted_index.get(
+                (data["Device Group"], int(data["Device#"]))
+            )
+            if name is not None:
+                data["Device Group"] = name
         return data
 
-    def _set_result_value(
-        self, row_dt, data, stat_name, ix_name, stat_type=str, skip=False
-    ):
-        data = self._update_actual_dev_name(data)
+    def _get_device_name_set(self):
         if self.device_names == []:
             self.device_names = [
                 d.name for d in self._api.snappi_config.devices
             ]
-        if data["Device Group"] not in self.device_names:
-            return
+        return set(self.device_names)
+
+    def _set_result_value(
+        self, row_dt, data, stat_name, ix_name, stat_type=str, skip=False
+    ):
         if skip:
             warn = stat_name in self.columns
             (
@@ -482,43 +566,48 @@ class ProtocolMetrics(object):
     def _topo_stats(self, protocol):
         url = "%s/operations/gettopologystatus" % self.ixn.href
         res = self._api._request("POST", url)
-        stats_map = {}
+        dg_names = self._get_device_group_names()
+        device_names = set(self.device_names)
+        rows = []
         for d in res["result"]:
             if self._PROTO_NAME_MAP_[protocol]["ixn_name"] not in d["arg1"]:
                 continue
-            stats_map[d["arg1"]] = {
-                self._TOPO_STATS[i["arg1"]]: i["arg2"] for i in d["arg2"]
-            }
-        myfilter = [
-            {
-                "property": "name",
-                "regex": (
-                    ".*"
-                    if len(self.device_names) == 0
-                    else "^%s$"
-                    % "|".join(self._api.special_char(self.device_names))
-                ),
-            }
-        ]
+            row = {self._TOPO_STATS[i["arg1"]]: i["arg2"] for i in d["arg2"]}
+            name = dg_names.get(self._get_device_group_href(d["arg1"]))
+            if name is not None:
+                row["name"] = name
+            if len(device_names) == 0 or row.get("name") in device_names:
+                rows.append(row)
+        return rows
+
+    def _get_device_group_href(self, href):
+        """The href of the innermost device group of an href, without the
+        session prefix so that both sides of the join match"""
+        match = self._DEVICE_GROUP_HREF.search(href)
+        return None if match is None else match.group(1)
+
+    def _get_device_group_names(self):
+        """Device group names by href, selected once per configuration"""
+        if self._device_group_names is not None:
+            return self._device_group_names
         url, payload = self._get_search_payload(
-            "/topology", "(?i)^(deviceGroup)$", ["name"], myfilter
+            "/topology", "(?i)^(deviceGroup)$", ["name"], []
         )
-        result = self.ixn._connection._execute(url, payload)
-        for t in result:
-            if t.get("deviceGroup") is None:
-                continue
-            for d in t["deviceGroup"]:
-                for p in stats_map:
-                    if d["href"] not in p:
-                        continue
-                    stats_map[p]["name"] = d["name"]
-        if self.device_names == []:
-            return [stats_map[p] for p in stats_map]
-        return [
-            stats_map[p]
-            for p in stats_map
-            if stats_map["name"] in self.device_names
-        ]
+        dg_names = {}
+        dgs = []
+        for t in self.ixn._connection._execute(url, payload):
+            dgs.extend(t.get("deviceGroup", []))
+        while len(dgs) > 0:
+            d = dgs.pop()
+            dg_names[self._get_device_group_href(d["href"])] = d["name"]
+            dgs.extend(d.get("deviceGroup", []))
+        self._device_group_names = dg_names
+        return dg_names
+
+    def clear_cache(self):
+        """Drops the views and device groups of the previous configuration"""
+        self._device_group_names = None
+        self.clear_views()
 
     def _filter_stats(self, protocol):
         self.ixn = self._api.assistant._ixnetwork
@@ -1,6 +1,5 @@
 import json
 import re
-import time
 import logging
 from collections import namedtuple
 
@@ -9,11 +8,15 @@ from ixnetwork_restpy import TestPlatform, SessionAssistant
 
 from snappi_ixnetwork.logger import setup_ixnet_logger
 from snappi_ixnetwork.capture import Capture
+from snappi_ixnetwork.connectionpool import ConnectionPool
 from snappi_ixnetwork.device.ngpf import Ngpf
 from snappi_ixnetwork.exceptions import SnappiIxnException
 from snappi_ixnetwork.lag import Lag
+from snappi_ixnetwork.metricspoller import MetricsPoller
 from snappi_ixnetwork.objectdb import IxNetObjects
 from snappi_ixnetwork.ping import Ping
+from snappi_ixnetwork.pipeline import Pipeline
+from snappi_ixnetwork.poll import poll
 from snappi_ixnetwork.protocolmetrics import ProtocolMetrics
 from snappi_ixnetwork.resourcegroup import ResourceGroup
 from snappi_ixnetwork.timer import Timer
@@ -65,6 +68,12 @@ class Api(snappi.Api):
         - port (str): The rest port of the TestPlatform to connect to.
         - username (str): The username to be used for authentication
         - password (str): The password to be used for authentication
+        - pool_size (int): maximum number of HTTP connections kept open
+        - keep_alive (bool): keep the HTTP connections open between requests
+        - retries (int): retries of idempotent requests failing on a
+        connection error or a 502, 503 or 504 status
+        - backoff_factor (float): backoff factor of the retries
+        - gzip (bool): gzip the json body of large requests
         """
         super(Api, self).__init__()
         location = kwargs.get("location")
@@ -84,6 +93,14 @@ class Api(snappi.Api):
         self._license_servers = (
             [] if license_servers is None else license_servers
         )
+        self._connection_pool = ConnectionPool(
+            pool_size=kwargs.get("pool_size", 10),
+            keep_alive=kwargs.get("keep_alive", True),
+            retries=kwargs.get("retries", 0),
+            backoff_factor=kwargs.get("backoff_factor", 0.5),
+            gzip=kwargs.get("gzip", False),
+        )
+        self._request_headers = None
         self._running_config = None
         self._config = None
         self._assistant = None
@@ -111,10 +128,22 @@ class Api(snappi.Api):
         self.resource_group = ResourceGroup(self)
         self.do_compact = False
         self._dev_compacted = {}
+        self._dev_compacted_index = {}
+        # traffic item hrefs keyed by name, collected from the selects
+        self._traffic_item_hrefs = {}
+        self._href_chunk_size = 1000
         self._previous_errors = []
         self._initial_flows_config = None
+        self._initial_flows = None
         self._flow_tracking = False
+        self._incremental_flows = False
+        self._incremental_devices = False
+        self._pipelined_config = False
+        self._protocol_views = False
+        self._validation_memo = False
+        self._metrics_poller = MetricsPoller(self)
         self._convergence_timeout = 3
+        self._operation_timeout = 90
         self._event_info = None
         self._ixnet_specific_config = None
         self._mka = Mka(self)
@@ -151,6 +180,40 @@ class Api(snappi.Api):
     def _enable_port_compaction(self, _port_compaction=False):
         self._port_compaction = _port_compaction
 
+    def _enable_incremental_flows(self, _incremental_flows=False):
+        """Only push the flows that changed since the last set_config"""
+        self._incremental_flows = _incremental_flows
+
+    def _enable_incremental_devices(self, _incremental_devices=False):
+        """Only push the topologies that changed since the last set_config"""
+        self._incremental_devices = _incremental_devices
+
+    def _enable_pipelined_config(self, _pipelined_config=False):
+        """Overlap device and flow conversion with the port configuration"""
+        self._pipelined_config = _pipelined_config
+
+    def _enable_protocol_views(self, _protocol_views=False):
+        """Read the protocol metrics of all the ports from one custom view
+        instead of drilling down into every port"""
+        self._protocol_views = _protocol_views
+
+    def _enable_validation_memo(self, _validation_memo=False):
+        """Skip validating the objects left unchanged since the previous
+        set_config"""
+        self._validation_memo = _validation_memo
+
+    def _enable_metrics_poller(
+        self, _metrics_poller=False, interval=1, max_age=2
+    ):
+        """Serve get_metrics from snapshots refreshed in the background
+        every interval seconds, snapshots older than max_age are fetched
+        again when requested"""
+        self._metrics_poller.stop()
+        self._metrics_poller.clear()
+        if _metrics_poller is True:
+            self._metrics_poller = MetricsPoller(self, interval, max_age)
+            self._metrics_poller.start()
+
     @property
     def snappi_config(self):
         return self._config
@@ -204,6 +267,12 @@ class Api(snappi.Api):
     def dev_compacted(self):
         return self._dev_compacted
 
+    @property
+    def dev_compacted_index(self):
+        """Original device names keyed by the (compacted device group
+        name, device number) reported in the statistics"""
+        return self._dev_compacted_index
+
     @property
     def ixnet_specific_config(self):
         if self._ixnet_specific_config is None:
@@ -214,6 +283,7 @@ class Api(snappi.Api):
     def set_dev_compacted(self, dev_name, name_list):
         for index, name in enumerate(name_list):
             self._dev_compacted[name] = {"dev_name": dev_name, "index": index}
+            self._dev_compacted_index[(dev_name, index + 1)] = name
 
     def _dict_to_obj(self, source):
         """Returns an object given a dict"""
@@ -357,12 +427,18 @@ class Api(snappi.Api):
         return bad_requests
 
     def config_ixnetwork(self, config):
+        # the metrics of the previous configuration are stale
+        self._metrics_poller.clear()
+        self.protocol_metrics.clear_cache()
         self._config_objects = {}
         self._device_encap = {}
         self._device_traffic_endpoint = {}
         self.ixn_objects = IxNetObjects(self)
         self.ixn_routes = IxNetObjects(self)
         self._dev_compacted = {}
+        self._dev_compacted_index = {}
+        # the traffic items may be removed or re-created
+        self._traffic_item_hrefs = {}
         self._connect()
         self.capture.reset_capture_request()
         self._config = self._validate_instance(config)
@@ -371,6 +447,8 @@ class Api(snappi.Api):
         self._ixnetwork.Traffic.UseRfc5952 = True
         if len(self._config._properties) == 0:
             self._ixnetwork.NewConfig()
+        elif self._pipelined_config is True:
+            self._pipelined_config_ixnetwork()
         else:
             self.vport.config()
             self.lag.config()
@@ -378,6 +456,8 @@ class Api(snappi.Api):
                 self.ngpf.config()
             self.traffic_item.config()
         self._running_config = self._config
+        # the selects while configuring may have seen removed traffic items
+        self._traffic_item_hrefs = {}
         self._apply_change()
         with Timer(self, "Start interfaces"):
             # Start all protocols is workaround for pCPU crash reported by
@@ -407,6 +487,30 @@ class Api(snappi.Api):
                     )
                     self._ixnetwork.Lag.find(Name=lag.name).Stop()
 
+    def _pipelined_config_ixnetwork(self):
+        """Same stages as the sequential config_ixnetwork but every stage
+        only waits for the stages it depends on. The stages sending
+        requests share one session and run one after the other in the
+        sequential order, the flow conversion does not send any and
+        overlaps with them.
+        """
+        pipeline = Pipeline(self)
+        pipeline.add("ports", self.vport.config_ports)
+        pipeline.add("location", self.vport.config_location, ["ports"])
+        pipeline.add("lags", self.lag.config, ["location"])
+        # the device conversion clears the topologies and may read the
+        # globals, so it runs once the ports and lags are configured
+        pipeline.add("device conversion", self.ngpf.convert, ["lags"])
+        pipeline.add(
+            "flow conversion", lambda: self.traffic_item.prepare(self._config)
+        )
+        pipeline.add("devices", self.ngpf.push, ["device conversion"])
+        pipeline.add(
+            "flows", self.traffic_item.config, ["devices", "flow conversion"]
+        )
+        with Timer(self, "Pipelined configuration"):
+            pipeline.run()
+
     def _protocols_exists(self):
         total_dev = len(self._ixnetwork.GetTopologyStatus())
         topos = self._ixnetwork.Topology.find()
@@ -550,6 +654,58 @@ class Api(snappi.Api):
             raise SnappiIxnException(err)
         return self.capture.results(request)
 
+    def get_captures(self, port_names, output_dir=None, max_workers=4):
+        """
+        Gets the capture files of many ports at once.
+
+        The captures of all the ports are stopped and saved together and the
+        files are downloaded concurrently.
+
+        Args
+        ----
+        - port_names (list(str)): the names of the capture ports
+        - output_dir (str): the directory the files are written to, the
+          captures are returned as byte streams when None
+        - max_workers (int): maximum number of concurrent downloads
+
+        Returns a dict of the byte stream or the file path keyed by port name
+        """
+        try:
+            if not isinstance(port_names, list) or len(port_names) == 0:
+                raise TypeError("port_names must be a non empty list")
+            self._connect()
+        except Exception as err:
+            raise SnappiIxnException(err)
+        return self.capture.results_batch(port_names, output_dir, max_workers)
+
+    def stream_capture(self, request, output=None, offset=0, resume=False):
+        """
+        Downloads a capture file in chunks instead of holding it in memory.
+
+        Args
+        ----
+        - request (Union[CaptureRequest, str]): A request for a capture.
+        - output (Union[str, file]): the file path or the binary file object
+          the capture is written to, an iterator of the chunks of the
+          capture is returned when None
+        - offset (int): the byte offset of the capture to start from
+        - resume (bool): continue the download of a partial file path
+        """
+        try:
+            if (
+                isinstance(request, (type(self._capture_request), str))
+                is False
+            ):
+                raise TypeError(
+                    "The content must be of type Union[CaptureRequest, str]"
+                )
+            if isinstance(request, str) is True:
+                request = self._capture_request.deserialize(request)
+            self._connect()
+        except Exception as err:
+            raise SnappiIxnException(err)
+        return self.capture.stream(request, output, offset, resume)
+
     def get_states(self, request):
         try:
             states_request = self.states_request()
@@ -588,63 +744,11 @@ class Api(snappi.Api):
                 )
             if isinstance(request, str) is True:
                 request = metric_req.deserialize(request)
-            # Need to change the code style when the choice Enum grows big
-            if request.get("choice") == "port":
-                response = self.vport.results(request.port)
-                metric_res = self.metrics_response()
-                metric_res.port_metrics.deserialize(response)
-                return metric_res
-            if request.get("choice") == "flow":
-                response = self.traffic_item.results(request.flow)
-                metric_res = self.metrics_response()
-                metric_res.flow_metrics.deserialize(response)
-                return metric_res
-            if request.get("choice") == "egress_only_tracking":
-                response = self.traffic_item.results_egress_only_tracking(
-                    request.egress_only_tracking
-                )
-                metric_res = self.metrics_response()
-                metric_res.egress_only_tracking_metrics.deserialize(response)
-                return metric_res
-            if request.get("choice") == "lag":
-                response = self.traffic_item.results(request.lag)
-                metric_res = self.metrics_response()
-                metric_res.lag_metrics.deserialize(response)
-                return metric_res
-            if request.get("choice") == "lacp":
-                response = self.traffic_item.results(request.lacp)
-                metric_res = self.metrics_response()
-                metric_res.lacp_metrics.deserialize(response)
-                return metric_res
-            if request.get("choice") == "convergence":
-                response = self._result(request.convergence)
-                metric_res = self.metrics_response()
-                metric_res.convergence_metrics.deserialize(response)
-                return metric_res
-            if request.get("choice") == "rocev2_flow":
-                response = self.traffic_item.rocev2_flow_results(
-                    request.rocev2_flow
-                )  # noqa
-                metric_res = self.metrics_response()
-                metric_res.rocev2_flow_per_qp_metrics.deserialize(response)
-                return metric_res
-            if (
-                request.get("choice")
-                in self.protocol_metrics.get_supported_protocols()
-            ):
-                response = self.protocol_metrics.results(request)
-                metric_res = self.metrics_response()
-                if (
-                    request.choice == "rocev2_ipv4"
-                    or request.choice == "rocev2_ipv6"
-                ):
-                    getattr(
-                        metric_res, request.choice + "_per_peer" + "_metrics"
-                    ).deserialize(response)
-                else:
-                    getattr(
-                        metric_res, request.choice + "_metrics"
-                    ).deserialize(response)
+            if self._metrics_poller.running:
+                metric_res = self._metrics_poller.get(request)
+            else:
+                metric_res = self._get_metrics(request)
+            if metric_res is not None:
                 return metric_res
         except Exception as err:
             raise SnappiIxnException(err)
@@ -656,6 +760,126 @@ class Api(snappi.Api):
             )
             raise SnappiIxnException(400, msg)
 
+    def _get_metrics(self, request):
+        """Fetches the metrics of request, returns None if the choice of
+        request is not supported"""
+        # Need to change the code style when the choice Enum grows big
+        if request.get("choice") == "port":
+            response = self.vport.results(request.port)
+            metric_res = self.metrics_response()
+            metric_res.port_metrics.deserialize(response)
+            return metric_res
+        if request.get("choice") == "flow":
+            response = self.traffic_item.results(request.flow)
+            metric_res = self.metrics_response()
+            metric_res.flow_metrics.deserialize(response)
+            return metric_res
+        if request.get("choice") == "egress_only_tracking":
+            response = self.traffic_item.results_egress_only_tracking(
+                request.egress_only_tracking
+            )
+            metric_res = self.metrics_response()
+            metric_res.egress_only_tracking_metrics.deserialize(response)
+            return metric_res
+        if request.get("choice") == "lag":
+            response = self.traffic_item.results(request.lag)
+            metric_res = self.metrics_response()
+            metric_res.lag_metrics.deserialize(response)
+            return metric_res
+        if request.get("choice") == "lacp":
+            response = self.traffic_item.results(request.lacp)
+            metric_res = self.metrics_response()
+            metric_res.lacp_metrics.deserialize(response)
+            return metric_res
+        if request.get("choice") == "convergence":
+            response = self._result(request.convergence)
+            metric_res = self.metrics_response()
+            metric_res.convergence_metrics.deserialize(response)
+            return metric_res
+        if request.get("choice") == "rocev2_flow":
+            response = self.traffic_item.rocev2_flow_results(
+                request.rocev2_flow
+            )  # noqa
+            metric_res = self.metrics_response()
+            metric_res.rocev2_flow_per_qp_metrics.deserialize(response)
+            return metric_res
+        if (
+            request.get("choice")
+            in self.protocol_metrics.get_supported_protocols()
+        ):
+            response = self.protocol_metrics.results(request)
+            metric_res = self.metrics_response()
+            if (
+                request.choice == "rocev2_ipv4"
+                or request.choice == "rocev2_ipv6"
+            ):
+                getattr(
+                    metric_res, request.choice + "_per_peer" + "_metrics"
+                ).deserialize(response)
+            else:
+                getattr(
+                    metric_res, request.choice + "_metrics"
+                ).deserialize(response)
+            return metric_res
+        return None
+
+    def get_metrics_deltas(self, request):
+        """
+        Returns the change of every counter of a metrics request between the
+        last two snapshots of the background metrics poller, along with the
+        rate per second of the change. The request must have been served
+        by get_metrics at least twice while the poller is enabled.
+
+        Args
+        ----
+        - request (Union[MetricsRequest, str]): A request for metrics.
+        """
+        if isinstance(request, str) is True:
+            request = self.metrics_request().deserialize(request)
+        return self._metrics_poller.get_deltas(request)
+
+    def iter_metrics(self, request):
+        """
+        Yields flow or egress only tracking metrics one at a time.
+
+        Same as get_metrics but the statistics view is read page by page and
+        every metric is yielded as soon as its page is read, instead of
+        holding all the rows in memory.
+
+        Args
+        ----
+        - request (Union[MetricsRequest, str]): A request for flow or
+          egress_only_tracking metrics.
+        """
+        try:
+            self._connect()
+            metric_req = self.metrics_request()
+            if isinstance(request, (type(metric_req), str)) is False:
+                raise TypeError(
+                    "The content must be of type Union[MetricsRequest, str]"
+                )
+            if isinstance(request, str) is True:
+                request = metric_req.deserialize(request)
+            if request.get("choice") == "flow":
+                for row in self.traffic_item.iter_results(request.flow):
+                    yield snappi.FlowMetric().deserialize(row)
+                return
+            if request.get("choice") == "egress_only_tracking":
+                rows = self.traffic_item.iter_results_egress_only_tracking(
+                    request.egress_only_tracking
+                )
+                for row in rows:
+                    yield snappi.EgressOnlyTrackingMetric().deserialize(row)
+                return
+        except Exception as err:
+            raise SnappiIxnException(err)
+        msg = "{} is not a supported choice for iter_metrics; \
+        the supported choices are \
+        ['flow', 'egress_only_tracking']".format(
+            request.choice
+        )
+        raise SnappiIxnException(400, msg)
+
     def update_flows(self, payload):
         """
         Update Flows for property size and rate
@@ -880,23 +1104,17 @@ class Api(snappi.Api):
                 row[column_type] = column_value
 
     def _get_traffic_rows(self, traffic_stat, drill_down_option):
-        count = 0
-        sleep_time = 0.5
-        while True:
-            drill_down_options = traffic_stat.DrillDownOptions()
-            if drill_down_option in drill_down_options:
-                break
-            if count * sleep_time > self._convergence_timeout:
-                raise Exception(
-                    "Somehow 'Drill down per Dest Endpoint' not available"
-                )
-            time.sleep(sleep_time)
-            count += 1
+        poll(
+            lambda: drill_down_option in traffic_stat.DrillDownOptions(),
+            "Drill down options",
+            self._convergence_timeout,
+            error=Exception(
+                "Somehow 'Drill down per Dest Endpoint' not available"
+            ),
+        )
         return traffic_stat.Rows
 
     def _get_flow_rows(self, flow_names):
-        count = 0
-        sleep_time = 0.5
         flow_stat = self.assistant.StatViewAssistant("Flow Statistics")
 
         if self._TRIGGERED_EVENT == "link":
@@ -915,34 +1133,29 @@ class Api(snappi.Api):
                     flow_stat.TargetRowFilters()[drilldown_index],
                 )
                 flow_stat = self.assistant.StatViewAssistant("Flow Statistics")
-        has_flow = False
-        while True:
-            flow_rows = flow_stat.Rows
-            has_event = False
+        state = {"has_flow": False, "flow_rows": None}
+
+        def has_event():
+            state["flow_rows"] = flow_stat.Rows
             ixn_cpdpconvergence = self._traffic.Statistics.CpdpConvergence
-            for row in flow_rows:
+            for row in state["flow_rows"]:
                 if row["Traffic Item"] in flow_names:
-                    has_flow = True
+                    state["has_flow"] = True
                     if (
                         ixn_cpdpconvergence.EnableDataPlaneEventsRateMonitor
                         and ixn_cpdpconvergence.EnableControlPlaneEvents
                     ):  # noqa
                         if row["Event Name"] != "":
-                            has_event = True
-                            break
-            if has_event is True:
-                break
-            if count * sleep_time > self._convergence_timeout:
-                if has_flow is not True:
-                    raise Exception(
-                        "flow_names must present within in config.flows"
-                    )
-                else:
-                    self.info("event is not reflected in stat")
-                    break
-            time.sleep(sleep_time)
-            count += 1
-        return flow_rows
+                            return True
+            return False
+
+        if not poll(has_event, "Flow events", self._convergence_timeout):
+            if state["has_flow"] is not True:
+                raise Exception(
+                    "flow_names must present within in config.flows"
+                )
+            self.info("event is not reflected in stat")
+        return state["flow_rows"]
 
     def add_error(self, error):
         """Add an error to the global errors"""
@@ -1020,6 +1233,8 @@ class Api(snappi.Api):
         if self._assistant is None:
             platform = TestPlatform(self._address, rest_port=self._port)
             platform.Authenticate(self._username, self._password)
+            # the session of the platform becomes the shared connection pool
+            self._connection_pool.mount(platform._connection)
             url = "%s://%s:%s/ixnetworkweb/api/v1/usersettings/ixnrest" % (
                 platform.Scheme,
                 platform.Hostname,
@@ -1038,6 +1253,11 @@ class Api(snappi.Api):
                 Password=self._password,
                 LogLevel=self._get_restpy_trace(self._log_level),
             )
+            self._connection_pool.mount(
+                self._assistant.TestPlatform._connection,
+                self._assistant.Session._connection,
+            )
+            self._request_headers = None
             self._ixnetwork = self._assistant.Session.Ixnetwork
             self._vport = self._ixnetwork.Vport
             self._lag = self._ixnetwork.Lag
@@ -1093,6 +1313,15 @@ class Api(snappi.Api):
         if len(app_errors) > 0:
             self._ixn_errors = app_errors[0].Error.find()
 
+    def _get_initial_flows(self):
+        """Returns the flows given to set_config as dicts keyed by name"""
+        if self._initial_flows is None and self._initial_flows_config:
+            self._initial_flows = {
+                flow["name"]: flow
+                for flow in json.loads(self._initial_flows_config)
+            }
+        return self._initial_flows or {}
+
     def _validate_instance(self, config):
         """Validate current IxNetwork instance:
         1. Stop everything if local config is None
@@ -1114,9 +1343,11 @@ class Api(snappi.Api):
                 )
                 self.add_error(msg)
                 self.warning(msg)
-        self._initial_flows_config = self.config().flows.deserialize(
+        # an immutable snapshot, only decoded if update_flows needs it
+        self._initial_flows_config = json.dumps(
             config.flows.serialize(config.flows.DICT)
         )
+        self._initial_flows = None
 
         if "UHD" in self._ixnetwork.Globals.ProductVersion:
             chassis_info = "localuhd"
@@ -1171,26 +1402,47 @@ class Api(snappi.Api):
 
     def _request(self, method, url, payload=None):
         self.debug("Request and Response ...")
-        connection, url = self._assistant.Session._connection._normalize_url(
-            url
-        )
-        headers = {
-            "Content-Type": "application/json",
-            "x-api-key": self._assistant.Session._connection.x_api_key,
-        }
-        if payload is not None:
-            payload = json.dumps(payload)
+        ixn_connection = self._assistant.Session._connection
+        connection, url = ixn_connection._normalize_url(url)
         self.debug("%s %s %s" % (method, url, payload))
-        response = self._assistant.Session._connection._session.request(
-            method, url, headers=headers, data=payload, verify=False
+        data, headers = self._connection_pool.encode(
+            payload, self._get_request_headers()
+        )
+        response = ixn_connection._session.request(
+            method, url, headers=headers, data=data, verify=False
         )
         response.raise_for_status()
         self.debug("Response %s" % response)
         if response.status_code == 202:
-            content = response.json()
-            while content["state"] == "IN_PROGRESS":
-                time.sleep(0.2)
-                response = self._request("GET", content["url"])
+            # the operation is asynchronous, poll its state until it is done
+            state = {"content": response.json()}
+
+            def is_done():
+                if state["content"]["state"] != "IN_PROGRESS":
+                    return True
+                state["content"] = self._request(
+                    "GET", state["content"]["url"]
+                )
+                return state["content"]["state"] != "IN_PROGRESS"
+
+            # the url holds the ids of the objects, the name of the poll
+            # is the operation so that poll_data does not grow with them
+            operation = url.split("?")[0].rstrip("/").split("/")[-1]
+            poll(
+                is_done,
+                "Operation %s" % operation,
+                self._operation_timeout,
+                error=Exception(
+                    "Operation %s is not complete in %s seconds"
+                    % (url, self._operation_timeout)
+                ),
+            )
+            content = state["content"]
+            if content["state"] != "SUCCESS":
+                raise Exception(
+                    "Operation %s failed: %s" % (url, content.get("message"))
+                )
+            return content
         if response.headers.get("Content-Type"):
             if response.headers["Content-Type"] == "application/json":
                 return response.json()
@@ -1200,24 +1452,45 @@ class Api(snappi.Api):
                 return response.content
         return response
 
+    def _get_request_headers(self):
+        if self._request_headers is None:
+            self._request_headers = self._connection_pool.headers(
+                self._assistant.Session._connection
+            )
+        return self._request_headers
+
+    def _request_stream(self, url, offset=0):
+        """GET url as a streamed response starting at byte offset"""
+        ixn_connection = self._assistant.Session._connection
+        connection, url = ixn_connection._normalize_url(url)
+        headers = self._get_request_headers()
+        if offset > 0:
+            headers = dict(headers)
+            headers["Range"] = "bytes=%d-" % offset
+        self.debug("GET %s stream from %s" % (url, offset))
+        response = ixn_connection._session.request(
+            "GET", url, headers=headers, verify=False, stream=True
+        )
+        response.raise_for_status()
+        return response
+
     def _remove(self, ixn_obj, items):
         """Remove any ixnetwork objects that are not found in the items list.
         If the items list does not exist remove everything.
         """
-        valid_names = []
+        valid_names = set()
         for item in items:
             if isinstance(item, dict):
                 name = item.get("name")
             else:
                 name = item.name
             if name is not None:
-                valid_names.append(name)
-        invalid_names = []
-        for item in ixn_obj.find():
-            if item.Name not in valid_names:
-                invalid_names.append(item.Name)
-        self.debug("Removing these %s" % invalid_names)
-        if len(invalid_names) > 0:
+                valid_names.add(name)
+        invalid_items = [
+            item for item in ixn_obj.find() if item.Name not in valid_names
+        ]
+        self.debug("Removing these %s" % [item.Name for item in invalid_items])
+        if len(invalid_items) > 0:
             if ixn_obj._SDM_NAME == "trafficItem":
                 # can't remove traffic items that are started
                 start_states = [
@@ -1228,27 +1501,39 @@ class Api(snappi.Api):
                     "startedWaitingForStreams",
                     "stoppedWaitingForStats",
                 ]
-                for item in ixn_obj.find(
-                    Name="^(%s)$" % "|".join(self.special_char(invalid_names))
-                ):
-                    if item.State in start_states:
-                        item.StopStatelessTraffic()
-                if len(ixn_obj) > 0:
-                    poll = True
-                    while poll:
-                        poll = False
-                        for v in self.select_traffic_items().values():
-                            if v["state"] not in [
-                                "error",
-                                "stopped",
-                                "unapplied",
-                            ]:
-                                poll = True
-            ixn_obj.find(
-                Name="^(%s)$" % "|".join(self.special_char(invalid_names))
-            )
-            if len(ixn_obj) > 0:
-                ixn_obj.remove()
+                started = [
+                    item.href
+                    for item in invalid_items
+                    if item.State in start_states
+                ]
+                if len(started) > 0:
+                    url = "%s/traffic/trafficItem/operations/%s" % (
+                        self._ixnetwork.href,
+                        "stopstatelesstraffic",
+                    )
+                    for hrefs in self._href_chunks(started):
+                        self._ixnetwork._connection._execute(
+                            url, {"arg1": hrefs}
+                        )
+                    poll(
+                        lambda: all(
+                            v["state"] in ["error", "stopped", "unapplied"]
+                            for v in self.select_traffic_items().values()
+                        ),
+                        "Traffic items stopped",
+                        self._operation_timeout,
+                        error=Exception(
+                            "Traffic items are not stopped in %s seconds"
+                            % self._operation_timeout
+                        ),
+                    )
+            for item in invalid_items:
+                self._request("DELETE", item.href)
+
+    def _href_chunks(self, hrefs):
+        """Splits a list of hrefs into lists small enough for one request"""
+        for index in range(0, len(hrefs), self._href_chunk_size):
+            yield hrefs[index : index + self._href_chunk_size]
 
     # def _get_topology_name(self, port_name):
     #     return "Topology %s" % port_name
@@ -1386,7 +1671,7 @@ class Api(snappi.Api):
                 vports[vport["name"]] = vport
         return vports
 
-    def select_traffic_items(self, traffic_item_filters=[]):
+    def select_traffic_items(self, traffic_item_filters=[], names=None):
         """Select all traffic items.
         Return them in a dict keyed by traffic item name.
 
@@ -1394,7 +1679,41 @@ class Api(snappi.Api):
         ----
         - filters (list(dict(property:'', 'regex':''))): A list of filters for the select.
             A filter is a dict with a property name and a regex match
+        - names (list(str)): Only return the traffic items with these names.
+            The traffic items are selected by href when all of them are known
         """
+        children = [
+            {
+                "child": "highLevelStream",
+                "properties": [
+                    "txPortName",
+                    "rxPortNames",
+                    "state",
+                    "name",
+                ],
+                "filters": [],
+            },
+            {
+                "child": "tracking",
+                "properties": ["trackBy"],
+                "filters": [],
+            },
+        ]
+        properties = ["name", "state", "enabled", "suspend"]
+        url = "%s/operations/select?xpath=true" % self._ixnetwork.href
+        if names is not None and all(
+            name in self._traffic_item_hrefs for name in names
+        ):
+            try:
+                return self._select_traffic_item_hrefs(
+                    [self._traffic_item_hrefs[name] for name in names],
+                    properties,
+                    children,
+                )
+            except Exception as err:
+                # a traffic item was removed meanwhile
+                self.debug("Selecting traffic items by href failed %s" % err)
+                self._traffic_item_hrefs = {}
         payload = {
             "selects": [
                 {
@@ -1403,37 +1722,55 @@ class Api(snappi.Api):
                     "children": [
                         {
                             "child": "trafficItem",
-                            "properties": ["name", "state", "enabled"],
+                            "properties": properties,
                             "filters": traffic_item_filters,
-                        },
-                        {
-                            "child": "highLevelStream",
-                            "properties": [
-                                "txPortName",
-                                "rxPortNames",
-                                "state",
-                                "name",
-                            ],
-                            "filters": [],
-                        },
-                        {
-                            "child": "tracking",
-                            "properties": ["trackBy"],
-                            "filters": [],
-                        },
-                    ],
+                        }
+                    ]
+                    + children,
                     "inlines": [],
                 }
             ]
         }
-        url = "%s/operations/select?xpath=true" % self._ixnetwork.href
         results = self._ixnetwork._connection._execute(url, payload)
         traffic_items = {}
         try:
             for traffic_item in results[0]["trafficItem"]:
                 traffic_items[traffic_item["name"]] = traffic_item
+                self._traffic_item_hrefs[traffic_item["name"]] = traffic_item[
+                    "href"
+                ]
         except Exception:
             pass
+        if names is not None:
+            names = set(names)
+            traffic_items = dict(
+                (name, traffic_item)
+                for name, traffic_item in traffic_items.items()
+                if name in names
+            )
+        return traffic_items
+
+    def _select_traffic_item_hrefs(self, hrefs, properties, children):
+        """Select the traffic items of hrefs, chunked into several selects
+        when needed"""
+        url = "%s/operations/select?xpath=true" % self._ixnetwork.href
+        traffic_items = {}
+        for chunk in self._href_chunks(hrefs):
+            payload = {
+                "selects": [
+                    {
+                        "from": href,
+                        "properties": properties,
+                        "children": children,
+                        "inlines": [],
+                    }
+                    for href in chunk
+                ]
+            }
+            results = self._ixnetwork._connection._execute(url, payload)
+            for href, traffic_item in zip(chunk, results):
+                traffic_item.setdefault("href", href)
+                traffic_items[traffic_item["name"]] = traffic_item
         return traffic_items
 
     def select_chassis_card_port(self, location):
@@ -1508,15 +1845,15 @@ class Api(snappi.Api):
         return self._config
 
     def check_protocol_statistics(self):
-        start = time.time()
         url = "%s/operations/gettopologystatus" % self._ixnetwork.href
-        check = True
-        while check is True and time.time() - start < 90:
-            check = False
-            results = self._ixnetwork._connection._execute(url, None)
-            for result in results:
-                if result["arg2"][0]["arg2"] != result["arg2"][3]["arg2"]:
-                    check = True
+        poll(
+            lambda: all(
+                result["arg2"][0]["arg2"] == result["arg2"][3]["arg2"]
+                for result in self._ixnetwork._connection._execute(url, None)
+            ),
+            "Topology status",
+            90,
+        )
 
     def info(self, message):
         self.logger.info(message)
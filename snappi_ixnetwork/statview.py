@@ -0,0 +1,113 @@
+import time
+from ixnetwork_restpy.assistants.statistics.row import Row
+from snappi_ixnetwork.logger import get_ixnet_logger
+from snappi_ixnetwork.poll import poll
+
+
+class StatViewReader(object):
+    """Reads the rows of a statistics view one page at a time
+
+    The rows are the same Row objects returned by StatViewAssistant.Rows
+    but only a single page of the view is held in memory, the next page is
+    requested once all the rows of the current page have been consumed.
+
+    Args
+    ----
+    - ixnetworkapi (Api): instance of the Api class
+    - caption (str): caption of the statistics view
+    - page_size (int): number of rows requested per page
+    """
+
+    def __init__(self, ixnetworkapi, caption, page_size=500):
+        self._api = ixnetworkapi
+        self._caption = caption
+        self._page_size = page_size
+        self._interval = 0.5
+        self._timeout = 90
+        self.logger = get_ixnet_logger(__name__)
+
+    def _get_view_href(self, deadline=None):
+        view = self._api._ixnetwork.Statistics.View
+        poll(
+            lambda: len(view.find(Caption="^%s$" % self._caption)) == 1,
+            "View %s" % self._caption,
+            self._timeout,
+            max_interval=self._interval,
+            deadline=deadline,
+            error=Exception(
+                "After %s seconds the %s view does not exist"
+                % (self._timeout, self._caption)
+            ),
+        )
+        return view.href
+
+    def _get_page(self, data_href, page, deadline=None):
+        def is_ready():
+            data = self._api._request("GET", data_href)
+            if data["isReady"] is True and (
+                page is None
+                or data["currentPage"] == page
+                or data["totalPages"] == 0
+            ):
+                return data
+            return None
+
+        return poll(
+            is_ready,
+            "View %s page" % self._caption,
+            self._timeout,
+            max_interval=self._interval,
+            deadline=deadline,
+            error=Exception(
+                "After %s seconds page %s of the %s view is not ready"
+                % (self._timeout, page, self._caption)
+            ),
+        )
+
+    def rows(self):
+        """Yields every row of the view
+
+        The page size and current page of the view are changed while
+        reading and restored once all rows are read or the generator is
+        closed, as the view is shared with every other reader.
+        """
+        deadline = time.time() + self._timeout
+        data_href = "%s/data" % self._get_view_href(deadline)
+        data = self._get_page(data_href, None, deadline)
+        restore = {
+            "pageSize": data["pageSize"],
+            "currentPage": data["currentPage"],
+        }
+        page = data["currentPage"]
+        try:
+            if data["pageSize"] != self._page_size or data["currentPage"] != 1:
+                self._api._request(
+                    "PATCH",
+                    data_href,
+                    {"pageSize": self._page_size, "currentPage": 1},
+                )
+                data = self._get_page(data_href, 1)
+            page = 1
+            while True:
+                self.logger.debug(
+                    "Reading page %s of %s from %s"
+                    % (page, data["totalPages"], self._caption)
+                )
+                page_rows = []
+                for value in data["pageValues"] or []:
+                    # every row may have sub rows e.g. egress tracking
+                    page_rows.extend(value)
+                columns = data["columnCaptions"]
+                for row in Row(self._caption, columns, page_rows):
+                    yield row
+                if page >= data["totalPages"]:
+                    break
+                page += 1
+                self._api._request("PATCH", data_href, {"currentPage": page})
+                data = self._get_page(data_href, page)
+        finally:
+            if (
+                restore["pageSize"] != self._page_size
+                or restore["currentPage"] != page
+            ):
+                self._api._request("PATCH", data_href, restore)
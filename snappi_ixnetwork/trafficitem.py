@@ -1,6 +1,8 @@
 import json
+import hashlib
 import snappi
 from snappi_ixnetwork.timer import Timer
+from snappi_ixnetwork.statview import StatViewReader
 from snappi_ixnetwork.logger import get_ixnet_logger
 from snappi_ixnetwork.exceptions import SnappiIxnException
 from snappi_ixnetwork.customfield import CustomField
@@ -152,6 +154,19 @@ class TrafficItem(CustomField):
 
     _LATENCY = {"cut_through": "cutThrough", "store_forward": "storeForward"}
 
+    # flow properties which are applied through the second importconfig pass
+    # only, a change in these is patched on the existing traffic item
+    _PATCHABLE_FLOW_PROPERTIES = ["rate", "size", "duration", "payload"]
+
+    _START_STATES = [
+        "txStopWatchExpected",
+        "locked",
+        "started",
+        "startedWaitingForStats",
+        "startedWaitingForStreams",
+        "stoppedWaitingForStats",
+    ]
+
     _PFCPAUSE = {
         "dst": "pfcPause.header.header.dstAddress",
         "src": "pfcPause.header.header.srcAddress",
@@ -462,6 +477,9 @@ class TrafficItem(CustomField):
         self.port_egress_only_tracking = {}
         self.logger = get_ixnet_logger(__name__)
         self._rocev2 = RoCEv2(self)
+        self._applied_flows = None
+        self._applied_context = None
+        self._prepared_config = None
 
     def _get_search_payload(self, parent, child, properties, filters):
         self.logger.debug(
@@ -589,7 +607,11 @@ class TrafficItem(CustomField):
         self.logger.debug("Device Information : %s" % paths)
         return paths
 
-    def get_ixn_config(self, config):
+    def get_ixn_config(self, config, flow_names=None):
+        """Create traffic items for config.flows and select them back
+
+        flow_names restricts the creation to the named flows only, all
+        traffic items present in IxNetwork are returned by the select."""
         self.logger.debug("getting ixn config")
         ixn = self._api.assistant._ixnetwork
         myfilter = [{"property": "name", "regex": ".*"}]
@@ -610,10 +632,11 @@ class TrafficItem(CustomField):
             myfilter,
         )
         self.ixn_config = None
-        tr = self.create_traffic(config)
-        imports = {}
-        imports["traffic"] = tr
-        self._importconfig(imports)
+        tr = self.create_traffic(config, flow_names)
+        if len(tr["trafficItem"]) > 0 or "egressOnlyTracking" in tr:
+            imports = {}
+            imports["traffic"] = tr
+            self._importconfig(imports)
         result = ixn._connection._execute(url, payload)
         # importconfig may not create configElement on some IxNetwork versions.
         # Call Generate() for any traffic item missing configElement, then
@@ -692,7 +715,7 @@ class TrafficItem(CustomField):
         self.logger.debug("endpoints : %s" % endpoints)
         self.logger.debug("scalable_endpoints : %s" % scalable_endpoints)
 
-    def create_traffic(self, config):
+    def create_traffic(self, config, flow_names=None):
         self.logger.debug("Creating Traffic")
         flows = config.flows
         tr = {"xpath": "/traffic", "trafficItem": []}
@@ -701,6 +724,8 @@ class TrafficItem(CustomField):
         portCount = len(config.ports)
         devices = self.get_device_info(config)
         for index, flow in enumerate(flows):
+            if flow_names is not None and flow.name not in flow_names:
+                continue
             flow_name = flow._properties.get("name")
             self.logger.debug("Creating Traffic Item %s" % flow_name)
             if flow_name is None:
@@ -1363,16 +1388,31 @@ class TrafficItem(CustomField):
                 )
 
     def copy_flow_packet(self, config):
-        self._flows_packet = []
-        for flow in config.flows:
-            flow_packet = []
-            for pkt in flow.packet:
-                parent = pkt.parent.__deepcopy__(None)
-                head = parent.get(parent.choice)
-                head._parent = parent
-                flow_packet.append(head)
-            self._flows_packet.append(flow_packet)
-        return
+        # the conversion only reads the headers, so they are referenced
+        # instead of copying every header of every flow
+        self._flows_packet = [list(flow.packet) for flow in config.flows]
+
+    def prepare(self, config):
+        """Do the conversion work of config which does not depend on
+        IxNetwork, so that it can run while the ports are configured"""
+        self.copy_flow_packet(config)
+        self._flow_fingerprints = None
+        self._flow_context = None
+        if self._is_incremental():
+            self._flow_fingerprints = {
+                flow.name: self._get_flow_fingerprint(flow)
+                for flow in config.flows
+            }
+            self._flow_context = self._get_flow_context(config)
+        self._prepared_config = config
+
+    def _is_incremental(self):
+        # port compaction spreads device endpoints across ports in flow
+        # order, so skipping unchanged flows would change the endpoints
+        return (
+            self._api._incremental_flows is True
+            and self._api._port_compaction is not True
+        )
 
     def config(self):
         """Configure config.flows onto Ixnetwork.Traffic.TrafficItem
@@ -1382,15 +1422,42 @@ class TrafficItem(CustomField):
         - DELETE any TrafficItem.Name that does not exist in config.flows
         - CREATE TrafficItem for any config.flows[*].name that does not exist
         - UPDATE TrafficItem for any config.flows[*].name that exists
+
+        By default every TrafficItem is deleted and re-created. With
+        incremental flows enabled the flows are compared against the last
+        applied flows and only the differing TrafficItems are deleted,
+        re-created or patched.
         """
         with Timer(self._api, "Flows configuration"):
             self._config = self._api.snappi_config
+            applied_flows = self._applied_flows
+            applied_context = self._applied_context
+            self._applied_flows = None
+            self._applied_context = None
             if len(self._config.flows) == 0:
                 self.remove_ixn_traffic()
                 return
-            self.remove_ixn_traffic()
-            self.copy_flow_packet(self._config)
-            ixn_traffic_item = self.get_ixn_config(self._config)[0]
+            if self._prepared_config is not self._config:
+                self.prepare(self._config)
+            self._prepared_config = None
+            flow_fingerprints = self._flow_fingerprints
+            context = self._flow_context
+            create_names, configure_names = None, None
+            if (
+                self._is_incremental()
+                and applied_flows is not None
+                and applied_context == context
+            ):
+                diff = self._remove_changed_traffic(
+                    applied_flows, flow_fingerprints
+                )
+                if diff is not None:
+                    create_names, configure_names = diff
+            if create_names is None:
+                self.remove_ixn_traffic()
+            ixn_traffic_item = self.get_ixn_config(
+                self._config, create_names
+            )[0]
             self.flows_has_latency = []
             self.flows_has_timestamp = []
             self.flows_has_loss = []
@@ -1398,11 +1465,30 @@ class TrafficItem(CustomField):
             if ixn_traffic_item.get("trafficItem") is None:
                 # TODO raise Exception
                 return
-            ixn_traffic_item = ixn_traffic_item.get("trafficItem")
+            ixn_traffic_items = {
+                ti["name"]: ti for ti in ixn_traffic_item.get("trafficItem")
+            }
             tr_json = {"traffic": {"xpath": "/traffic", "trafficItem": []}}
             for i, flow in enumerate(self._config.flows):
-                tr_item = {"xpath": ixn_traffic_item[i]["xpath"]}
-                if ixn_traffic_item[i].get("configElement") is None:
+                metrics = flow.get("metrics")
+                if metrics is not None and metrics.enable is True:
+                    latency = metrics.get("latency")
+                    if latency is not None and latency.enable is True:
+                        self.flows_has_latency.append(flow.name)
+                        self._process_latency(latency)
+                    timestamps = metrics.get("timestamps")
+                    if timestamps is True:
+                        self.flows_has_timestamp.append(flow.name)
+                    loss = metrics.get("loss")
+                    if loss is True:
+                        self.flows_has_loss.append(flow.name)
+                if configure_names is not None and (
+                    flow.name not in configure_names
+                ):
+                    continue
+                ixn_ti = ixn_traffic_items[flow.name]
+                tr_item = {"xpath": ixn_ti["xpath"]}
+                if ixn_ti.get("configElement") is None:
                     if flow.tx_rx.choice != "port":
                         raise Exception(
                             "Endpoints are not properly configured in IxNetwork"
@@ -1410,12 +1496,13 @@ class TrafficItem(CustomField):
                     # Generate() should have created configElement; if query
                     # still returns None, construct the xpath from the traffic
                     # item xpath so the second import can still proceed.
-                    ti_xpath = ixn_traffic_item[i]["xpath"]
-                    ce_xpaths = [{"xpath": "%s/configElement[1]" % ti_xpath}]
+                    ce_xpaths = [
+                        {"xpath": "%s/configElement[1]" % ixn_ti["xpath"]}
+                    ]
                 else:
                     ce_xpaths = [
                         {"xpath": ce["xpath"]}
-                        for ce in ixn_traffic_item[i]["configElement"]
+                        for ce in ixn_ti["configElement"]
                     ]
                 tr_item["configElement"] = ce_xpaths
                 self._configure_size(
@@ -1429,22 +1516,18 @@ class TrafficItem(CustomField):
                 )
                 # TODO: ixNetwork is not creating flow groups for vxlan, remove
                 # hard coding of setting to 1 once the issue is fixed in ixn
-                if "highLevelStream" not in ixn_traffic_item[i].keys():
+                if "highLevelStream" not in ixn_ti.keys():
                     hl_stream_count = 1
                 else:
-                    hl_stream_count = len(
-                        ixn_traffic_item[i]["highLevelStream"]
-                    )
+                    hl_stream_count = len(ixn_ti["highLevelStream"])
                 self._configure_duration(
                     tr_item["configElement"],
                     hl_stream_count,
                     flow.get("duration", True),
                 )
-                # tr_type = ixn_traffic_item[i]["trafficType"]
+                # tr_type = ixn_ti["trafficType"]
                 if flow.tx_rx.choice == "device":
-                    for ind, ce in enumerate(
-                        ixn_traffic_item[i]["configElement"]
-                    ):
+                    for ind, ce in enumerate(ixn_ti["configElement"]):
                         stack = self._configure_packet(
                             ce["stack"], self._flows_packet[i]
                         )
@@ -1452,36 +1535,121 @@ class TrafficItem(CustomField):
                 elif flow.tx_rx.choice == "port" and self._flows_packet[i]:
                     # After Generate() the configElement has a default
                     # Ethernet-only stack.  Rebuild with the user's headers.
-                    ti_xpath = ixn_traffic_item[i]["xpath"]
-                    raw_ce = self.config_raw_stack(ti_xpath, self._flows_packet[i])
+                    raw_ce = self.config_raw_stack(
+                        ixn_ti["xpath"], self._flows_packet[i]
+                    )
                     tr_item["configElement"][0]["stack"] = raw_ce[0]["stack"]
 
-                metrics = flow.get("metrics")
                 if metrics is not None and metrics.enable is True:
-                    tr_item.update(
-                        self._configure_tracking(ixn_traffic_item[i])
-                    )
-                    latency = metrics.get("latency")
-                    if latency is not None and latency.enable is True:
-                        self.flows_has_latency.append(flow.name)
-                        self._process_latency(latency)
-                    timestamps = metrics.get("timestamps")
-                    if timestamps is True:
-                        self.flows_has_timestamp.append(flow.name)
-                    loss = metrics.get("loss")
-                    if loss is True:
-                        self.flows_has_loss.append(flow.name)
+                    tr_item.update(self._configure_tracking(ixn_ti))
                 tr_json["traffic"]["trafficItem"].append(tr_item)
 
-            self._importconfig(tr_json)
-            self._fix_srh_encapsulated_fields()
+            if len(tr_json["traffic"]["trafficItem"]) > 0:
+                self._importconfig(tr_json)
+                self._fix_srh_encapsulated_fields(configure_names)
 
             self._configure_options()
             self._configure_latency()
+            self._applied_flows = flow_fingerprints
+            self._applied_context = context
+
+    def _get_flow_fingerprint(self, flow):
+        """Returns a (structure, patch) digest pair of a flow
+
+        The patch digest covers the properties which can be updated on an
+        existing traffic item, the structure digest covers everything else.
+        """
+        flow_dict = flow.serialize(flow.DICT)
+        patch = {}
+        for key in TrafficItem._PATCHABLE_FLOW_PROPERTIES:
+            patch[key] = flow_dict.pop(key, None)
+        return (
+            hashlib.sha1(
+                json.dumps(flow_dict, sort_keys=True).encode()
+            ).hexdigest(),
+            hashlib.sha1(
+                json.dumps(patch, sort_keys=True).encode()
+            ).hexdigest(),
+        )
+
+    def _get_flow_context(self, config):
+        """Returns a digest of the config objects flows are built upon
+
+        Traffic items can only be kept in place if their endpoints did not
+        change in between two configs.
+        """
+        context = {
+            "ports": [port.name for port in config.ports],
+            "lags": config.lags.serialize(config.lags.DICT),
+            "devices": config.devices.serialize(config.devices.DICT),
+            "egress_only_tracking": config.egress_only_tracking.serialize(
+                config.egress_only_tracking.DICT
+            ),
+        }
+        return hashlib.sha1(
+            json.dumps(context, sort_keys=True).encode()
+        ).hexdigest()
+
+    def _remove_changed_traffic(self, applied_flows, flow_fingerprints):
+        """Remove traffic items which are stale compared to applied_flows
 
-    def _fix_srh_encapsulated_fields(self):
+        Returns a tuple of flow names to be created and flow names to be
+        configured through the second import or None when the traffic items
+        in IxNetwork are out of sync and everything needs to be re-created.
+        """
+        if len(self._config.egress_only_tracking) > 0:
+            return None
+        traffic_items = self._api.select_traffic_items()
+        if set(traffic_items.keys()) != set(applied_flows.keys()):
+            self.logger.debug(
+                "Traffic items are out of sync with the applied flows"
+            )
+            return None
+        device_flows = dict(
+            (
+                flow.name,
+                list(flow.tx_rx.device.tx_names or [])
+                + list(flow.tx_rx.device.rx_names or []),
+            )
+            for flow in self._config.flows
+            if flow.tx_rx.choice == "device"
+        )
+        remove_names, create_names, patch_names = [], set(), set()
+        for name, applied in applied_flows.items():
+            fingerprint = flow_fingerprints.get(name)
+            if fingerprint is None:
+                remove_names.append(name)
+            elif applied[0] != fingerprint[0] or (
+                name in device_flows
+                and self._api.ngpf.is_topology_changed(device_flows[name])
+            ):
+                # device endpoints are re-created along with their topology
+                remove_names.append(name)
+                create_names.add(name)
+            elif applied[1] != fingerprint[1]:
+                patch_names.add(name)
+        for name in flow_fingerprints:
+            if name not in applied_flows:
+                create_names.add(name)
+        self.logger.debug(
+            "Incremental flows remove %s create %s patch %s"
+            % (remove_names, create_names, patch_names)
+        )
+        if len(remove_names) + len(create_names) + len(patch_names) > 0:
+            state = self._api._ixnetwork.Traffic.State
+            if state in TrafficItem._START_STATES:
+                self._api._ixnetwork.Traffic.StopStatelessTrafficBlocking()
+        if len(remove_names) > 0:
+            for name in remove_names:
+                self._api._request("DELETE", traffic_items[name]["href"])
+            self._api._ixnetwork.Traffic.TrafficItem.find().refresh()
+        self.traffic_index = len(traffic_items) - len(remove_names) + 1
+        return (create_names, create_names.union(patch_names))
+
+    def _fix_srh_encapsulated_fields(self, flow_names=None):
         """After importConfig, directly freeze TCP data_offset and UDP length
         for flows whose port-mode packet contains SRH-encapsulated inner stacks.
+        flow_names restricts the fix to the flows which were just imported.
 
         IxNetwork does not reliably honor importConfig overrides for auto-computed
         length/offset fields in stacks behind an SRH encapsulation boundary.
@@ -1490,6 +1658,8 @@ class TrafficItem(CustomField):
         for i, flow in enumerate(self._config.flows):
             if flow.tx_rx.choice != "port" or not self._flows_packet[i]:
                 continue
+            if flow_names is not None and flow.name not in flow_names:
+                continue
             inside_srh = False
             inner_fixes = {}  # stack_type_id -> (field_type_id_substr, str_value)
             for header in self._flows_packet[i]:
@@ -2023,20 +2193,20 @@ class TrafficItem(CustomField):
         1) check set_protocol_state for device protocols
         2) If start then generate and apply traffic
         3) Execute requested transmit action (start|stop|pause|resume)
+
+        The traffic item states are selected once, the transitions are
+        worked out from that snapshot and every action is a single
+        operation on the hrefs of the traffic items it applies to.
         """
-        regex = ""
         flow_names = [flow.name for flow in self._api._config.flows]
         if request and request.flow_names:
             flow_names = request.flow_names
-        if len(flow_names) == 1:
-            regex = "^%s$" % self._api.special_char(flow_names)[0]
-        elif len(flow_names) > 1:
-            regex = "^(%s)$" % "|".join(self._api.special_char(flow_names))
 
         self.logger.debug(
             "These %s flows will go into %s state"
             % (flow_names, request.state)
         )
+        traffic_items = None
         if request.state == "start":
             ##This portion of code is to handle different stateful_traffic flow, currently only rocev2
             for device in self._api._config.devices:
@@ -2063,22 +2233,31 @@ class TrafficItem(CustomField):
                     print("Starting Traffic")
                     self._api._traffic.Start()
                     break
-            if len(self._api._topology.find()) > 0:
+            # the configured devices are the topologies in IxNetwork
+            if len(self._api._config.devices) > 0:
                 glob_topo = self._api._globals.Topology.refresh()
                 if glob_topo.Status == "notStarted":
                     raise Exception(
                         "Please start protocols using set_protocol_state "
                         "before start traffic"
                     )
-            if len(self._api._traffic_item.find()) == 0:
+            traffic_items = self._api.select_traffic_items()
+            if len(traffic_items) == 0:
                 return
-            self._api._traffic_item.find(State="^unapplied$")
-            if len(self._api._traffic_item) > 0:
+            unapplied = self._get_traffic_item_hrefs(
+                traffic_items, states=["unapplied"]
+            )
+            if len(unapplied) > 0:
                 with Timer(self._api, "Flows generate/apply"):
-                    self._api._traffic_item.Generate()
+                    self._traffic_item_operation("generate", unapplied)
                     self._api._traffic.Apply()
-            self._api._traffic_item.find(State="^started$")
-            if len(self._api._traffic_item) == 0:
+                for traffic_item in traffic_items.values():
+                    if traffic_item["state"] == "unapplied":
+                        traffic_item["state"] = "stopped"
+            started = self._get_traffic_item_hrefs(
+                traffic_items, states=["started"]
+            )
+            if len(started) == 0:
                 with Timer(self._api, "Flows clear statistics"):
                     self._api._ixnetwork.ClearStats(
                         [
@@ -2087,7 +2266,6 @@ class TrafficItem(CustomField):
                         ]
                     )
             self._api.capture._start_capture()
-        self._api._traffic_item.find(Name=regex)
         for device in self._api._config.devices:
             if (
                 device.get("rocev2")
@@ -2097,28 +2275,75 @@ class TrafficItem(CustomField):
                 print("Stopping RoCEv2 Traffic")
                 self._api._traffic.Stop()
                 break
-        if len(self._api._traffic_item) > 0:
-            if request.state == "start":
-                self._api._traffic_item.find(
-                    Name=regex, Suspend=True, State="^started$"
-                )
-                if len(self._api._traffic_item) > 0:
-                    with Timer(self._api, "Flows resume"):
-                        self._api._traffic_item.PauseStatelessTraffic(False)
-                self._api._traffic_item.find(Name=regex, State="^stopped$")
-                if len(self._api._traffic_item) > 0:
-                    with Timer(self._api, "Flows start"):
-                        self._api._traffic_item.StartStatelessTrafficBlocking()
-            elif request.state == "stop":
-                self._api._traffic_item.find(Name=regex, State="^started$")
-                if len(self._api._traffic_item) > 0:
-                    with Timer(self._api, "Flows stop"):
-                        self._api._traffic_item.StopStatelessTrafficBlocking()
-            elif request.state == "pause":
-                self._api._traffic_item.find(Name=regex, State="^started$")
-                if len(self._api._traffic_item) > 0:
-                    with Timer(self._api, "Flows pause"):
-                        self._api._traffic_item.PauseStatelessTraffic(True)
+        if request.state not in ["start", "stop", "pause"]:
+            return
+        if traffic_items is None:
+            traffic_items = self._api.select_traffic_items(
+                names=flow_names if len(flow_names) > 0 else None
+            )
+        names = set(flow_names)
+        if len(names) > 0:
+            traffic_items = dict(
+                (name, traffic_item)
+                for name, traffic_item in traffic_items.items()
+                if name in names
+            )
+        if request.state == "start":
+            resume = self._get_traffic_item_hrefs(
+                traffic_items, states=["started"], suspend=True
+            )
+            if len(resume) > 0:
+                with Timer(self._api, "Flows resume"):
+                    self._traffic_item_operation(
+                        "pauseStatelessTraffic", resume, False
+                    )
+            stopped = self._get_traffic_item_hrefs(
+                traffic_items, states=["stopped"]
+            )
+            if len(stopped) > 0:
+                with Timer(self._api, "Flows start"):
+                    self._traffic_item_operation(
+                        "startStatelessTrafficBlocking", stopped
+                    )
+        else:
+            started = self._get_traffic_item_hrefs(
+                traffic_items, states=["started"]
+            )
+            if len(started) == 0:
+                return
+            if request.state == "stop":
+                with Timer(self._api, "Flows stop"):
+                    self._traffic_item_operation(
+                        "stopStatelessTrafficBlocking", started
+                    )
+            else:
+                with Timer(self._api, "Flows pause"):
+                    self._traffic_item_operation(
+                        "pauseStatelessTraffic", started, True
+                    )
+
+    def _get_traffic_item_hrefs(self, traffic_items, states, suspend=None):
+        """Returns the hrefs of the selected traffic items in one of the
+        states, optionally restricted to suspended traffic items"""
+        return [
+            traffic_item["href"]
+            for traffic_item in traffic_items.values()
+            if traffic_item["state"] in states
+            and (suspend is None or traffic_item.get("suspend") is suspend)
+        ]
+
+    def _traffic_item_operation(self, operation, hrefs, *args):
+        """Executes a traffic item operation on all the hrefs at once,
+        chunked when the list is too long for one request"""
+        url = "%s/traffic/trafficItem/operations/%s" % (
+            self._api._ixnetwork.href,
+            operation.lower(),
+        )
+        for chunk in self._api._href_chunks(hrefs):
+            payload = {"arg1": chunk}
+            for index, arg in enumerate(args):
+                payload["arg%d" % (index + 2)] = arg
+            self._api._ixnetwork._connection._execute(url, payload)
 
     def _set_result_value(
         self, row, column_name, column_value, column_type=str
@@ -2157,15 +2382,26 @@ class TrafficItem(CustomField):
 
     def results(self, request):
         """Return flow results"""
+        flow_states, flow_rows = self._init_flow_rows(request)
+        for _ in self._update_flow_rows(flow_states, flow_rows):
+            pass
+        return list(flow_rows.values())
 
-        start_states = [
-            "txStopWatchExpected",
-            "locked",
-            "started",
-            "startedWaitingForStats",
-            "startedWaitingForStreams",
-            "stoppedWaitingForStats",
-        ]
+    def iter_results(self, request):
+        """Yield flow results while the statistics view is read page by page.
+        Flows without statistics are yielded last with zero values."""
+        flow_states, flow_rows = self._init_flow_rows(request)
+        updated = set()
+        for key in self._update_flow_rows(flow_states, flow_rows):
+            updated.add(key)
+            yield flow_rows[key]
+        for key, flow_row in flow_rows.items():
+            if key not in updated:
+                yield flow_row
+
+    def _init_flow_rows(self, request):
+        """Validate the request and return the state of the requested
+        traffic items and their result rows initialized to zero"""
         # setup parameters
         self._column_names = request.get("metric_names")
         if self._column_names is None:
@@ -2188,7 +2424,6 @@ class TrafficItem(CustomField):
                 req_flow_names
             )
             raise Exception(msg)
-        req_flow_names = self._api.special_char(req_flow_names)
         # initialize result values
         self.logger.debug(
             "Fetching these column %s for flows %s"
@@ -2196,11 +2431,9 @@ class TrafficItem(CustomField):
         )
         flow_names = []
         flow_rows = {}
-        regfilter = {"property": "name", "regex": ".*"}
-        if len(req_flow_names) > 0:
-            regfilter["regex"] = "^(%s)$" % "|".join(req_flow_names)
+        flow_states = {}
         traffic_items = self._api.select_traffic_items(
-            traffic_item_filters=[regfilter]
+            names=req_flow_names if len(req_flow_names) > 0 else None
         )
         if len(traffic_items) == 0:
             raise Exception(
@@ -2213,6 +2446,7 @@ class TrafficItem(CustomField):
             if len(track_by) == 0 or "trackingenabled0" not in track_by:
                 continue
             flow_names.append(name)
+            flow_states[name] = traffic_item["state"]
             for stream in traffic_item["highLevelStream"]:
                 for rx_port_name in stream["rxPortNames"]:
                     flow_row = {}
@@ -2260,37 +2494,25 @@ class TrafficItem(CustomField):
                     "".join(list(diff))
                 )
             )
+        return (flow_states, flow_rows)
 
-        flow_count = len(flow_names)
-        ixn_page = self._api._ixnetwork.Statistics.View.find(
-            Caption="Flow Statistics"
-        ).Page
-        if ixn_page.PageSize < flow_count:
-            ixn_page.PageSize = flow_count
+    def _update_flow_rows(self, flow_states, flow_rows):
+        """Update flow_rows from the statistics view and yield the key of
+        every updated row"""
         self.logger.debug("These are the current flow stats:")
+        result_columns = self._get_result_columns()
         if self._api._flow_tracking:
-            table = self._api.assistant.StatViewAssistant("Flow Statistics")
-            for row in table.Rows:
+            # whole pages keep the columns of a row from one refresh
+            table = StatViewReader(self._api, "Flow Statistics")
+            for row in table.rows():
                 name = row["Traffic Item"]
-                if (
-                    len(flow_names) > 0
-                    and row["Traffic Item"] not in flow_names
-                ):
+                if name not in flow_states:
                     continue
                 self.logger.debug(str(row))
-                if (
-                    row["Traffic Item"] + row["Tx Port"] + row["Rx Port"]
-                    in flow_rows
-                ):
-                    flow_row = flow_rows[
-                        row["Traffic Item"] + row["Tx Port"] + row["Rx Port"]
-                    ]
-                    if (
-                        self._api._ixnetwork.Traffic.TrafficItem.find(
-                            Name="^" + flow_row["name"] + "$"
-                        ).State
-                        in start_states
-                    ):
+                key = name + row["Tx Port"] + row["Rx Port"]
+                if key in flow_rows:
+                    flow_row = flow_rows[key]
+                    if flow_states[name] in TrafficItem._START_STATES:
                         flow_row["transmit"] = "started"
                     else:
                         flow_row["transmit"] = "stopped"
@@ -2298,7 +2520,7 @@ class TrafficItem(CustomField):
                         external_name,
                         internal_name,
                         external_type,
-                    ) in self._RESULT_COLUMNS:
+                    ) in result_columns:
                         # keep plugging values for next columns even if the
                         # current one raises exception
                         try:
@@ -2316,14 +2538,13 @@ class TrafficItem(CustomField):
                     if name in self.flows_has_timestamp:
                         self._construct_timestamp(flow_row, row)
                     if name not in self.flows_has_loss:
-                        flow_row.pop("loss")
+                        flow_row.pop("loss", None)
+                    yield key
         else:
-            flow_stat = self._api.assistant.StatViewAssistant(
-                "Traffic Item Statistics"
-            )
-            for row in flow_stat.Rows:
+            flow_stat = StatViewReader(self._api, "Traffic Item Statistics")
+            for row in flow_stat.rows():
                 name = row["Traffic Item"]
-                if len(flow_names) > 0 and name not in flow_names:
+                if name not in flow_states:
                     continue
                 self.logger.debug(str(row))
                 if name in flow_rows:
@@ -2339,7 +2560,7 @@ class TrafficItem(CustomField):
                         external_name,
                         internal_name,
                         external_type,
-                    ) in self._RESULT_COLUMNS:
+                    ) in result_columns:
                         # keep plugging values for next columns even if the
                         # current one raises exception
                         try:
@@ -2360,12 +2581,40 @@ class TrafficItem(CustomField):
                         name not in self.flows_has_loss
                         and len(self.flows_has_loss) > 0
                     ):
-                        flow_row.pop("loss")
-        return list(flow_rows.values())
+                        flow_row.pop("loss", None)
+                    yield name
+
+    def _get_result_columns(self):
+        """Returns the _RESULT_COLUMNS requested through metric_names"""
+        if len(self._column_names) == 0:
+            return self._RESULT_COLUMNS
+        return [
+            column
+            for column in self._RESULT_COLUMNS
+            if column[0] in self._column_names
+        ]
 
     def results_egress_only_tracking(self, request):
         """Return flow results"""
+        flow_rows = {}
+        for port_rx, tagged_metric_row in self._egress_only_tracking_rows(
+            request
+        ):
+            if port_rx not in flow_rows:
+                flow_rows[port_rx] = {"port_rx": port_rx, "tagged_metrics": []}
+            flow_rows[port_rx]["tagged_metrics"].append(tagged_metric_row)
+        return list(flow_rows.values())
+
+    def iter_results_egress_only_tracking(self, request):
+        """Yield one result per tagged metric while the statistics view is
+        read page by page"""
+        for port_rx, tagged_metric_row in self._egress_only_tracking_rows(
+            request
+        ):
+            yield {"port_rx": port_rx, "tagged_metrics": [tagged_metric_row]}
 
+    def _egress_only_tracking_rows(self, request):
+        """Yield the rx port name and tagged metric of every row"""
         # setup parameters
         req_port_names = request.get("port_names")
         if req_port_names is None or len(req_port_names) == 0:
@@ -2378,7 +2627,6 @@ class TrafficItem(CustomField):
                 req_port_names
             )
             raise Exception(msg)
-        req_port_names = self._api.special_char(req_port_names)
         if len(req_port_names) == 0:
             msg = "No port has egress only tracking configuration"
             raise Exception(msg)
@@ -2421,18 +2669,9 @@ class TrafficItem(CustomField):
             """
             raise Exception(msg.strip())
 
-        flow_count = len(flow_names)
-
-        ixn_page = self._api._ixnetwork.Statistics.View.find(
-            Caption="Flow Statistics"
-        ).Page
-        if ixn_page.PageSize < flow_count:
-            ixn_page.PageSize = flow_count
         self.logger.debug("These are the current flow stats:")
-
-        table = self._api.assistant.StatViewAssistant("Flow Statistics")
-        flow_rows = {}
-        for row in table.Rows:
+        table = StatViewReader(self._api, "Flow Statistics")
+        for row in table.rows():
             name = row["Traffic Item"]
             self.logger.debug(str(row))
             port_rx = row["Rx Port"]
@@ -2448,7 +2687,6 @@ class TrafficItem(CustomField):
                     # skip empty row
                     continue
                 result_flow_row = None
-                tagged_metric_rows = []
                 tagged_metric_row = {}
                 tx_metric_row = {}
 
@@ -2509,18 +2747,8 @@ class TrafficItem(CustomField):
                     self._construct_pgid_tags(tagged_metric_row, row)
                     if per_port_mt_dict_result["enable_timestamps"] is True:
                         self._construct_timestamp(tagged_metric_row, row)
-                    try:
-                        flow_row = flow_rows[port_rx]
-                    except KeyError:
-                        flow_rows[port_rx] = {}
-                        flow_row = flow_rows[port_rx]
-                        flow_row["port_rx"] = port_rx
-                        pass
                     tagged_metric_row["tx_metrics"] = tx_metric_row
-                    tagged_metric_rows.append(tagged_metric_row)
-                    flow_row["tagged_metrics"] = tagged_metric_rows
-
-        return list(flow_rows.values())
+                    yield (port_rx, tagged_metric_row)
 
     def _construct_latency(self, flow_row, row):
         if self.latency_mode == "store_forward":
@@ -2626,38 +2854,85 @@ class TrafficItem(CustomField):
     def update_flows(self, update_flows_config):
         """
         Update the flows with property size & rate
+
+        The high level streams of all the flows are selected at once and
+        all the changes are applied with one import.
         """
         self._validate_update_flows_config(update_flows_config)
-        for flow in update_flows_config.flows:
-            hl = self._api._ixnetwork.Traffic.TrafficItem.find(
-                Name=flow.name
-            ).HighLevelStream.find()
-            self._update_size(hl, flow.size)
-            self._update_rate(hl, flow.rate)
+        flows = {flow.name: flow for flow in update_flows_config.flows}
+        if len(flows) == 0:
+            return
+        for flow in flows.values():
+            self._validate_update_size(flow.get("size", True))
+        traffic_items = []
+        for ixn_ti in self._get_high_level_streams(flows):
+            flow = flows[ixn_ti["name"]]
+            hl_streams = [
+                {"xpath": hl_stream["xpath"]}
+                for hl_stream in ixn_ti.get("highLevelStream", [])
+            ]
+            self._configure_size(hl_streams, flow.get("size", True))
+            self._configure_rate(hl_streams, flow.get("rate", True))
+            traffic_items.append(
+                {"xpath": ixn_ti["xpath"], "highLevelStream": hl_streams}
+            )
+        if len(traffic_items) > 0:
+            with Timer(self._api, "Flows update"):
+                self._importconfig(
+                    {
+                        "traffic": {
+                            "xpath": "/traffic",
+                            "trafficItem": traffic_items,
+                        }
+                    }
+                )
+        if self._applied_flows is not None:
+            for flow in flows.values():
+                self._applied_flows[flow.name] = self._get_flow_fingerprint(
+                    flow
+                )
+
+    def _get_high_level_streams(self, flow_names):
+        """Returns the traffic items of the flows with their high level
+        streams, selected at once"""
+        url, payload = self._get_search_payload(
+            "/traffic",
+            "(?i)^(trafficItem|highLevelStream)$",
+            ["name"],
+            [{"property": "name", "regex": ".*"}],
+        )
+        result = self._api.assistant._ixnetwork._connection._execute(
+            url, payload
+        )[0]
+        return [
+            ixn_ti
+            for ixn_ti in result.get("trafficItem", [])
+            if ixn_ti["name"] in flow_names
+        ]
 
     def _validate_update_flows_config(self, update_flows_config):
         errors = []
+        initial_flows = self._api._get_initial_flows()
+        config_flows = set(flow.name for flow in self._api._config.flows)
         for flow in update_flows_config.flows:
-            if flow not in self._api._config.flows._items:
+            if flow.name not in config_flows:
                 errors.append(
                     "Adding a new flow {} is not allowed in update operation".format(
                         flow.name
                     )
                 )
-            else:
-                for i_flow in self._api._initial_flows_config._items:
-                    if i_flow.name == flow.name:
-                        d1 = flow.serialize(flow.DICT)
-                        d2 = i_flow.serialize(i_flow.DICT)
-                        error = self._compare_property(d1, d2)
-                        errors.extend(error)
+            elif flow.name in initial_flows:
+                d1 = flow.serialize(flow.DICT)
+                d2 = initial_flows[flow.name]
+                error = self._compare_property(d1, d2)
+                errors.extend(error)
         if errors:
             raise SnappiIxnException(400, "{}".format(("\n").join(errors)))
 
     def _compare_property(self, d1, d2):
         property_errors = []
         for key in d1.keys():
-            if d1[key] != d2[key]:
+            if d1[key] != d2.get(key):
                 property_errors.append(key)
         property_errors = [
             property_err
@@ -2667,55 +2942,14 @@ class TrafficItem(CustomField):
         ]
         return property_errors
 
-    def _update_size(self, ixn_hl_stream, size):
-        if size.choice is not None:
-            if size.choice != "fixed":
-                raise SnappiIxnException(
-                    400,
-                    "Frame size update on a started flow is not supported for {} choice".format(
-                        size.choice
-                    ),
-                )
-            ixn_hl_stream.FrameSize.FixedSize = size.fixed
-
-    def _update_rate(self, ixn_hl_stream, rate):
-        if rate.choice is None:
-            return
-        ixn_frame_rate = ixn_hl_stream.FrameRate
-        args = {}
-        value = None
-        if rate.choice == "percentage":
-            args["Type"] = "percentLineRate"
-            value = rate.percentage
-        elif rate.choice == "pps":
-            args["Type"] = "framesPerSecond"
-            value = rate.pps
-        else:
-            args["Type"] = "bitsPerSecond"
-            args["BitRateUnitsType"] = TrafficItem._BIT_RATE_UNITS_TYPE[
-                rate.choice
-            ]
-            value = getattr(rate, rate.choice)
-        args["Rate"] = value
-        self._update(ixn_frame_rate, **args)
-
-    def _update(self, ixn_object, **kwargs):
-        from ixnetwork_restpy.base import Base
-
-        update = False
-        for name, value in kwargs.items():
-            if (
-                isinstance(value, list)
-                and len(value) > 0
-                and isinstance(value[0], Base)
-            ):
-                value = [item.href for item in value]
-            elif isinstance(value, Base):
-                value = value.href
-            if getattr(ixn_object, name) != value:
-                update = True
-        if update is True:
-            ixn_object.update(**kwargs)
+    def _validate_update_size(self, size):
+        if size.choice is not None and size.choice != "fixed":
+            raise SnappiIxnException(
+                400,
+                "Frame size update on a started flow is not supported for {} choice".format(
+                    size.choice
+                ),
+            )
 
     def rocev2_flow_results(self, request):
         """Return RoCEv2 flow results"""
@@ -2783,6 +3017,8 @@ class TrafficItem(CustomField):
 
         for delcfg in delete_flows_config.config_delete_list:
             for flow in delcfg.flows:
+                if self._applied_flows is not None:
+                    self._applied_flows.pop(flow, None)
                 ti = self._api._ixnetwork.Traffic.TrafficItem.find(Name=flow)
                 if len(self._api._ixnetwork.Traffic.TrafficItem.find()) > 1:
                     ti.remove()
@@ -2951,6 +3187,10 @@ class TrafficItem(CustomField):
 
                 self._configure_options()
                 self._configure_latency()
+                if self._applied_flows is not None:
+                    self._applied_flows[flow.name] = (
+                        self._get_flow_fingerprint(flow)
+                    )
 
     def _append_flows_config(self, appcgfs):
         config = self._config
@@ -1,8 +1,16 @@
+from snappi.snappi import OpenApiIter, OpenApiObject
+
+
 class Validation(object):
     """Validate the configuration
 
     Ensures entire configuration has unique names
 
+    The configuration is walked iteratively, every object once. With the
+    memo enabled an object whose own properties are identical to an object
+    validated by the previous set_config is not validated again, its name
+    is still checked for uniqueness.
+
     Args
     ----
     - ixnetworkapi (Api): instance of the ixnetworkapi class
@@ -10,23 +18,58 @@ class Validation(object):
 
     def __init__(self, ixnetworkapi):
         self._api = ixnetworkapi
+        self._validated = set()
 
     def validate_config(self):
         self._unique_name_errors = []
-        self.__check_config_objects(self._api.snappi_config, item_ids=[])
+        memo = self._api._validation_memo is True
+        validated = set()
+        item_ids = set()
+        stack = [self._api.snappi_config]
+        while len(stack) > 0:
+            config_item = stack.pop()
+            if config_item is None:
+                continue
+            children = self.__check_config_object(
+                config_item, item_ids, validated if memo else None
+            )
+            # reversed so that the objects are checked in config order
+            stack.extend(reversed(children))
+        self._validated = validated
         if len(self._unique_name_errors) > 0:
             raise NameError(", ".join(self._unique_name_errors))
 
-    def __check_config_objects(self, config_item, item_ids):
-        if config_item is None:
-            return
-        config_item.validate()
+    def _get_memo_key(self, config_item):
+        """The class and the properties of an object, excluding the content
+        of its children which are keyed on their own"""
+        key = [config_item.__class__]
+        for attr_name, attr_value in config_item._properties.items():
+            if isinstance(attr_value, (OpenApiObject, OpenApiIter)):
+                attr_value = attr_value.__class__
+            elif isinstance(attr_value, list):
+                attr_value = tuple(attr_value)
+            key.append((attr_name, attr_value))
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def __check_config_object(self, config_item, item_ids, validated):
+        """Validates one object and returns its children"""
+        key = None if validated is None else self._get_memo_key(config_item)
+        if key is None or key not in self._validated:
+            config_item.validate()
+        if key is not None:
+            validated.add(key)
 
+        children = []
         if (
             hasattr(config_item, "choice") is True
             and getattr(config_item, "choice") is None
         ):
-            return
+            return children
 
         for attr_name in config_item._properties:
             if attr_name.startswith("_") or attr_name == "parent":
@@ -47,19 +90,16 @@ class Validation(object):
                     # self._unique_name_errors.append('%s.name: "None" is not allowed' % (config_item.__class__.__name__))
                 else:
                     self._api._config_objects[attr_value] = config_item
-            elif "__module__" in dir(attr_value):
-                if attr_value.__module__.startswith("snappi"):
-                    if "__next__" in dir(attr_value):
-                        for item in attr_value:
-                            item_id = id(item)
-                            if item_id in item_ids:
-                                continue
-                            if getattr(item, "parent", None) is not None:
-                                item_ids.append(item_id)
-                                self.__check_config_objects(
-                                    item.parent, item_ids
-                                )
-                            else:
-                                self.__check_config_objects(item, item_ids)
+            elif isinstance(attr_value, OpenApiIter):
+                for item in attr_value:
+                    item_id = id(item)
+                    if item_id in item_ids:
+                        continue
+                    if getattr(item, "parent", None) is not None:
+                        item_ids.add(item_id)
+                        children.append(item.parent)
                     else:
-                        self.__check_config_objects(attr_value, item_ids)
+                        children.append(item)
+            elif isinstance(attr_value, OpenApiObject):
+                children.append(attr_value)
+        return children
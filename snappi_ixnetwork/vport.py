@@ -1,7 +1,7 @@
 import json
-import time
 import re
 from snappi_ixnetwork.timer import Timer
+from snappi_ixnetwork.poll import poll
 from snappi_ixnetwork.logger import get_ixnet_logger
 from ixnetwork_restpy import BatchFind, BatchAdd
 
@@ -131,6 +131,9 @@ class Vport(object):
         self._layer1_check = []
         self._interval = 1
         self._timeout = 10
+        # the ports signature of the last config which was located
+        self._applied_ports = None
+        self._ports_signature = None
         self.logger = get_ixnet_logger(__name__)
 
     def config(self):
@@ -141,38 +144,62 @@ class Vport(object):
         4) set /vport/l1Config/... properties using the corrected /vport -type
         5) connectPorts to use new l1Config settings and clearownership
         """
+        self.config_ports()
+        self.config_location()
+
+    def config_ports(self):
+        """Create the vports and their captures, steps 1) and 2) of config"""
         self.logger.debug("Configuring Vports")
         self._resource_manager = self._api._ixnetwork.ResourceManager
         self._ixn_vport = self._api._vport
         self._layer1_check = []
-        self._api._ixnetwork.StopAllProtocols(arg1="sync")
-        self._wait_for(
-            lambda: self.is_protocols_stopped(),
-            """"Protocols are not stopped in {} seconds""".format(
-                self._interval * self._timeout
-            ),
-            self._interval,
-            self._timeout,
-        )
+        self._ports_signature = self._get_ports_signature()
+        applied_ports = self._applied_ports
+        self._applied_ports = None
+        if (
+            self._api._incremental_devices is not True
+            or self._ports_signature != applied_ports
+        ):
+            # with incremental devices and unchanged ports only the
+            # topologies which change are stopped when the devices are pushed
+            self._api._ixnetwork.StopAllProtocols(arg1="sync")
+            poll(
+                self.is_protocols_stopped,
+                "Protocols stopped",
+                self._timeout,
+                max_interval=self._interval,
+                error=Exception(
+                    "Protocols are not stopped in {} seconds".format(
+                        self._timeout
+                    )
+                ),
+            )
         with Timer(self._api, "Ports configuration"):
             self._delete_vports()
             self._create_vports()
         with Timer(self._api, "Captures configuration"):
             self._api.capture.config()
+
+    def config_location(self):
+        """Connect the vport locations and set the layer1 properties"""
         with Timer(self._api, "Location configuration"):
             self._set_location()
         with Timer(self._api, "Layer1 configuration"):
             self._set_layer1()
-
-    def _wait_for(self, func, exp_msg, interval, timeout):
-        end_time = round(time.time()) + timeout
-        while True:
-            res = func()
-            if round(time.time()) >= end_time:
-                raise Exception(exp_msg)
-            if res:
-                return res
-            time.sleep(interval)
+        self._applied_ports = self._ports_signature
+
+    def _get_ports_signature(self):
+        """The ports with their locations, the layer1 and the lags of the
+        config, protocols can only keep running while these are unchanged"""
+        config = self._api.snappi_config
+        return json.dumps(
+            [
+                config.ports.serialize(config.ports.DICT),
+                config.layer1.serialize(config.layer1.DICT),
+                config.lags.serialize(config.lags.DICT),
+            ],
+            sort_keys=True,
+        )
 
     def is_protocols_stopped(self):
         topos = self._api._ixnetwork.Topology.find()
@@ -277,20 +304,21 @@ class Vport(object):
                 self._api,
                 "Location hosts ready [%s]" % ", ".join(check_addresses),
             ):
-                start_time = time.time()
-                while True:
-                    chassis.find(
-                        Hostname="^(%s)$" % "|".join(check_addresses),
-                        State="^ready$",
-                    )
-                    if len(chassis) == len(check_addresses):
-                        break
-                    if time.time() - start_time > HostReadyTimeout:
-                        raise RuntimeError(
-                            "After %s seconds, not all location hosts [%s] are reachable"
-                            % (HostReadyTimeout, ", ".join(check_addresses))
+                poll(
+                    lambda: len(
+                        chassis.find(
+                            Hostname="^(%s)$" % "|".join(check_addresses),
+                            State="^ready$",
                         )
-                    time.sleep(2)
+                    )
+                    == len(check_addresses),
+                    "Location hosts ready",
+                    HostReadyTimeout,
+                    error=RuntimeError(
+                        "After %s seconds, not all location hosts [%s] are reachable"
+                        % (HostReadyTimeout, ", ".join(check_addresses))
+                    ),
+                )
 
     def _add_chassischain(self):
         chassis_chains = self._api.ixnet_specific_config.chassis_chains
@@ -379,35 +407,35 @@ class Vport(object):
             self._api._vport.find(ConnectionState="^(?!connectedLink).*$")
             if len(self._api._vport) > 0:
                 self._api._vport.ConnectPorts()
-            start = time.time()
             timeout = 10
-            while True:
-                self._api._vport.find(
-                    Name="^(%s)$"
-                    % "|".join(self._api.special_char(locations)),
-                    ConnectionState="^connectedLink",
-                )
-                if len(self._api._vport) == len(locations):
-                    break
-                if time.time() - start > timeout:
-                    unreachable = []
+            connected = poll(
+                lambda: len(
                     self._api._vport.find(
-                        ConnectionState="^(?!connectedLink).*$"
+                        Name="^(%s)$"
+                        % "|".join(self._api.special_char(locations)),
+                        ConnectionState="^connectedLink",
                     )
-                    for vport in self._api._vport:
-                        unreachable.append(
-                            "%s [%s: %s]"
-                            % (
-                                vport.Name,
-                                vport.ConnectionState,
-                                vport.ConnectionStatus,
-                            )
+                )
+                == len(locations),
+                "Location connected",
+                timeout,
+            )
+            if not connected:
+                unreachable = []
+                self._api._vport.find(ConnectionState="^(?!connectedLink).*$")
+                for vport in self._api._vport:
+                    unreachable.append(
+                        "%s [%s: %s]"
+                        % (
+                            vport.Name,
+                            vport.ConnectionState,
+                            vport.ConnectionStatus,
                         )
-                    raise RuntimeError(
-                        "After %s seconds, %s are unreachable"
-                        % (timeout, ", ".join(unreachable))
                     )
-                time.sleep(2)
+                raise RuntimeError(
+                    "After %s seconds, %s are unreachable"
+                    % (timeout, ", ".join(unreachable))
+                )
             for vport in self._api._vport.find(
                 ConnectionState="^(?!connectedLinkUp).*$"
             ):
@@ -819,14 +847,12 @@ class Vport(object):
             "Extracting %s stats for these ports %s"
             % (self._column_names, port_names)
         )
-        port_filter = {"property": "name", "regex": ".*"}
-        port_filter["regex"] = "^(%s)$" % "|".join(
-            self._api.special_char(port_names)
-        )
-
+        names = set(port_names)
         port_rows = dict()
-        vports = self._api.select_vports(port_name_filters=[port_filter])
+        vports = self._api.select_vports()
         for vport in vports.values():
+            if vport["name"] not in names:
+                continue
             port_row = dict()
             self._set_result_value(port_row, "name", vport.get("name"))
             location = vport.get("location")
@@ -858,14 +884,22 @@ class Vport(object):
 
             port_rows[vport["name"]] = port_row
 
+        result_columns = self._RESULT_COLUMNS
+        if len(self._column_names) > 0:
+            result_columns = [
+                column
+                for column in self._RESULT_COLUMNS
+                if column[0] in self._column_names
+            ]
         try:
             table = self._api.assistant.StatViewAssistant("Port Statistics")
+            rows = table.Rows
         except Exception:
             self._api.warning("Could not retrive the port statistics viewer")
             return list(port_rows.values())
 
         self.logger.debug("These are port results:")
-        for row in table.Rows:
+        for row in rows:
             vport_name = row["Port Name"]
             if vport_name is None:
                 raise Exception("Could not retrive 'Port Name' from stats")
@@ -873,7 +907,7 @@ class Vport(object):
             self.logger.debug(str(port_row))
             if port_row is None:
                 continue
-            for ext_name, int_name, typ in self._RESULT_COLUMNS:
+            for ext_name, int_name, typ in result_columns:
                 try:
                     row_val = row[int_name]
                     self._set_result_value(port_row, ext_name, row_val, typ)
@@ -0,0 +1,84 @@
+import threading
+import time
+from mock import MagicMock
+from snappi_ixnetwork.capture import Capture
+
+PORTS = ["p%d" % i for i in range(1, 9)]
+
+
+def _vport(name, state):
+    return {
+        "name": name,
+        "href": "/api/v1/sessions/1/ixnetwork/vport/%s" % name[1:],
+        "capture": {
+            "href": "/api/v1/sessions/1/ixnetwork/vport/%s/capture" % name[1:],
+            "hardwareEnabled": True,
+            "softwareEnabled": False,
+            "dataCaptureState": state,
+            "controlCaptureState": "ready",
+        },
+    }
+
+
+def _capture_api():
+    api = MagicMock()
+    api.special_char = lambda names: names
+    api._ixnetwork.href = "/api/v1/sessions/1/ixnetwork"
+    api._ixnetwork.Globals.PersistencePath = "/persist"
+    selects = []
+
+    def execute(url, payload):
+        selects.append(payload)
+        # the captures become ready at the second poll
+        state = "notReady" if len(selects) < 3 else "ready"
+        return [{"vport": [_vport(name, state) for name in PORTS]}]
+
+    api._ixnetwork._connection._execute.side_effect = execute
+    api.active = []
+    api.max_active = [0]
+    lock = threading.Lock()
+
+    def request(method, url, payload=None):
+        if method == "GET":
+            with lock:
+                api.active.append(url)
+                api.max_active[0] = max(api.max_active[0], len(api.active))
+            time.sleep(0.05)
+            with lock:
+                api.active.remove(url)
+            return url.split("filename=")[1].encode()
+        return None
+
+    api._request.side_effect = request
+    return api, selects
+
+
+def test_capture_batch():
+    api, selects = _capture_api()
+    captures = Capture(api).results_batch(PORTS, max_workers=3)
+    assert sorted(captures) == PORTS
+    assert captures["p2"].read() == b"/persist/capture/p2.cap"
+    api._ixnetwork.SaveCaptureFiles.assert_called_once()
+    posts = [
+        c.args for c in api._request.call_args_list if c.args[0] == "POST"
+    ]
+    # one stop and one release for all the ports
+    assert [p[1].rsplit("/", 1)[1] for p in posts] == [
+        "stop",
+        "releaseCapturePorts",
+    ]
+    assert len(posts[0][2]["arg1"]) == len(PORTS)
+    assert len(posts[1][2]["arg1"]) == len(PORTS)
+    assert len(selects) == 3
+    assert 1 < api.max_active[0] <= 3
+
+
+def test_capture_batch_to_files(tmpdir):
+    api, _ = _capture_api()
+    response = MagicMock()
+    response.status_code = 200
+    response.iter_content.return_value = [b"pcap"]
+    api._request_stream.return_value = response
+    captures = Capture(api).results_batch(PORTS[:2], output_dir=str(tmpdir))
+    assert captures["p1"] == str(tmpdir.join("p1.cap"))
+    assert tmpdir.join("p1.cap").read_binary() == b"pcap"
@@ -0,0 +1,71 @@
+from mock import MagicMock
+from snappi_ixnetwork.capture import Capture
+
+PCAP = bytes(range(256)) * 40
+
+
+class Response(object):
+    def __init__(self, status_code, content):
+        self.status_code = status_code
+        self.content = content
+        self.closed = False
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self.content), 1000):
+            yield self.content[i : i + 1000]
+
+    def close(self):
+        self.closed = True
+
+
+def _capture(honor_range=True):
+    api = MagicMock()
+    responses = []
+
+    def request_stream(url, offset=0):
+        if "merged" in url:
+            raise Exception("404 merged capture not found")
+        if offset > 0 and honor_range:
+            response = Response(206, PCAP[offset:])
+        else:
+            response = Response(200, PCAP)
+        responses.append(response)
+        return response
+
+    api._request_stream.side_effect = request_stream
+    capture = Capture(api)
+    capture._get_capture_urls = MagicMock(
+        return_value=["merged.cap", "hw.cap", "sw.cap"]
+    )
+    request = MagicMock()
+    request.port_name = "p1"
+    return capture, request, responses
+
+
+def test_capture_stream_iterator():
+    capture, request, responses = _capture()
+    chunks = capture.stream(request)
+    assert b"".join(chunks) == PCAP
+    # falls back to the hardware capture and closes the response
+    assert responses[0].closed is True
+
+
+def test_capture_stream_resume(tmpdir):
+    path = str(tmpdir.join("p1.cap"))
+    with open(path, "wb") as fp:
+        fp.write(PCAP[:4500])
+    capture, request, responses = _capture()
+    assert capture.stream(request, path, resume=True) == path
+    with open(path, "rb") as fp:
+        assert fp.read() == PCAP
+    assert responses[0].status_code == 206
+
+
+def test_capture_stream_resume_without_range(tmpdir):
+    path = str(tmpdir.join("p1.cap"))
+    with open(path, "wb") as fp:
+        fp.write(PCAP[:4500])
+    capture, request, responses = _capture(honor_range=False)
+    capture.stream(request, path, resume=True)
+    with open(path, "rb") as fp:
+        assert fp.read() == PCAP
@@ -0,0 +1,61 @@
+import io
+import dpkt
+import pytest
+from snappi_ixnetwork.pcapindex import PcapIndex
+
+
+def _packet(src_port, dst_port):
+    tcp = dpkt.tcp.TCP(sport=src_port, dport=dst_port)
+    ip = dpkt.ip.IP(
+        src=b"\x01\x01\x01\x01",
+        dst=b"\x02\x02\x02\x02",
+        p=dpkt.ip.IP_PROTO_TCP,
+        data=tcp,
+    )
+    eth = dpkt.ethernet.Ethernet(
+        src=b"\x00\x00\x00\x00\x00\x01",
+        dst=b"\x00\x00\x00\x00\x00\x02",
+        data=ip,
+    )
+    return bytes(eth)
+
+
+def _capture(writer_class):
+    fp = io.BytesIO()
+    writer = writer_class(fp)
+    for i in range(100):
+        writer.writepkt(_packet(1000 + i % 4, 179), ts=1000 + i * 0.5)
+    return fp.getvalue()
+
+
+@pytest.mark.parametrize(
+    "writer_class", [dpkt.pcap.Writer, dpkt.pcapng.Writer]
+)
+def test_pcap_index_filter(writer_class):
+    with PcapIndex(io.BytesIO(_capture(writer_class))) as index:
+        assert len(index) == 100
+        key = index.key(_packet(1001, 179))
+        packets = list(index.packets(key=key))
+        assert len(packets) == 25
+        timestamp, packet = packets[0]
+        assert timestamp == pytest.approx(1000.5)
+        assert bytes(packet) == _packet(1001, 179)
+        # time window [1010, 1020) holds packets 20 to 39
+        assert list(index.indices(start=1010, end=1020)) == list(range(20, 40))
+        assert index.count(key=key, start=1010, end=1020) == 5
+        assert [bytes(p) for p in index[-2:]] == [
+            _packet(1002, 179),
+            _packet(1003, 179),
+        ]
+        del packet, packets
+
+
+def test_pcap_index_file(tmpdir):
+    path = str(tmpdir.join("p1.cap"))
+    with open(path, "wb") as fp:
+        fp.write(_capture(dpkt.pcapng.Writer))
+    index = PcapIndex(path, key_fields=[(36, 2)])
+    # keyed on the tcp destination port only
+    assert index.count(key=index.key(_packet(1, 179))) == 100
+    assert index.timestamp(99) == pytest.approx(1049.5)
+    index.close()
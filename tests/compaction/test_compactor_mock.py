@@ -0,0 +1,53 @@
+from mock import MagicMock
+from snappi_ixnetwork.device.base import MultiValue
+from snappi_ixnetwork.device.compactor import Compactor
+
+
+def _device_group(name, mac, vlan_count=0):
+    return {
+        "name": name,
+        "multiplier": 1,
+        "ethernet": [
+            {
+                "name": "%s.eth" % name,
+                "mac": MultiValue(mac),
+                "vlanCount": vlan_count,
+            }
+        ],
+    }
+
+
+def test_compact_similar_device_groups():
+    compactor = Compactor(MagicMock())
+    roots = [
+        _device_group("d1", "00:00:00:00:00:01"),
+        _device_group("d2", "00:00:00:00:00:02", vlan_count=1),
+        _device_group("d3", "00:00:00:00:00:03"),
+        _device_group("d4", "00:00:00:00:00:04", vlan_count=1),
+        _device_group("d5", "00:00:00:00:00:05"),
+    ]
+    compactor.compact(roots)
+    assert len(roots) == 2
+    assert roots[0]["name"] == ["d1", "d3", "d5"]
+    assert roots[0]["multiplier"] == 3
+    assert roots[0]["ethernet"][0]["mac"].value == [
+        "00:00:00:00:00:01",
+        "00:00:00:00:00:03",
+        "00:00:00:00:00:05",
+    ]
+    assert roots[1]["name"] == ["d2", "d4"]
+    assert roots[1]["multiplier"] == 2
+
+
+def test_compact_different_structure():
+    compactor = Compactor(MagicMock())
+    roots = [
+        _device_group("d1", "00:00:00:00:00:01"),
+        _device_group("d2", "00:00:00:00:00:02"),
+    ]
+    roots[1]["ethernet"][0]["ipv4"] = [{"name": "ip"}]
+    assert compactor._get_signature(roots[0]) != compactor._get_signature(
+        roots[1]
+    )
+    compactor.compact(roots)
+    assert len(roots) == 2
@@ -0,0 +1,145 @@
+import time
+import threading
+from mock import MagicMock
+from snappi_ixnetwork.snappi_api import Api as ixn_api
+
+
+def _port_metrics_api(frames_tx):
+    api = ixn_api()
+    api._connect = MagicMock()
+    calls = []
+
+    def results(request):
+        calls.append(request)
+        time.sleep(0.05)
+        return [{"name": "p1", "frames_tx": frames_tx[0]}]
+
+    api.vport = MagicMock()
+    api.vport.results.side_effect = results
+    return api, calls
+
+
+def test_metrics_poller_cache():
+    frames_tx = [100]
+    api, calls = _port_metrics_api(frames_tx)
+    api._enable_metrics_poller(True, interval=60, max_age=60)
+    try:
+        request = api.metrics_request()
+        request.port.port_names = ["p1"]
+        responses = []
+        consumers = [
+            threading.Thread(
+                target=lambda: responses.append(api.get_metrics(request))
+            )
+            for _ in range(5)
+        ]
+        for consumer in consumers:
+            consumer.start()
+        for consumer in consumers:
+            consumer.join()
+        # concurrent consumers share one fetch
+        assert len(calls) == 1
+        assert [r.port_metrics[0].frames_tx for r in responses] == [100] * 5
+        snapshot = api._metrics_poller.get_snapshot(request)
+        assert snapshot.version == 1
+    finally:
+        api._enable_metrics_poller(False)
+    assert api._metrics_poller.running is False
+
+
+def test_metrics_poller_refresh_and_deltas():
+    frames_tx = [100]
+    api, calls = _port_metrics_api(frames_tx)
+    # every fetch sees 100 more frames
+    api.vport.results.side_effect = lambda request: [
+        {"name": "p1", "frames_tx": 100 * (len(api.vport.results.mock_calls))}
+    ]
+    api._enable_metrics_poller(True, interval=0.1, max_age=60)
+    try:
+        request = api.metrics_request()
+        request.port.port_names = ["p1"]
+        assert api.get_metrics(request).port_metrics[0].frames_tx == 100
+        start = time.time()
+        while api._metrics_poller.get_snapshot(request).version < 2:
+            assert time.time() - start < 5
+            time.sleep(0.05)
+        # served from the snapshot refreshed in the background
+        assert api.get_metrics(request).port_metrics[0].frames_tx >= 200
+        deltas = api.get_metrics_deltas(request)
+        assert deltas[0]["name"] == "p1"
+        assert deltas[0]["frames_tx_delta"] == 100
+        assert deltas[0]["frames_tx_rate"] > 0
+    finally:
+        api._enable_metrics_poller(False)
+
+
+def test_metrics_poller_staleness():
+    frames_tx = [100]
+    api, calls = _port_metrics_api(frames_tx)
+    # the background refresh never runs, stale snapshots are fetched again
+    api._enable_metrics_poller(True, interval=60, max_age=0)
+    try:
+        request = api.metrics_request()
+        request.port.port_names = ["p1"]
+        api.get_metrics(request)
+        frames_tx[0] = 200
+        assert api.get_metrics(request).port_metrics[0].frames_tx == 200
+        assert len(calls) == 2
+    finally:
+        api._enable_metrics_poller(False)
+
+
+def test_metrics_poller_reused_request():
+    api, calls = _port_metrics_api([100])
+    api._enable_metrics_poller(True, interval=60, max_age=60)
+    try:
+        request = api.metrics_request()
+        request.port.port_names = ["p1"]
+        key = request.serialize()
+        api.get_metrics(request)
+        # the caller changes its request to ask for other ports
+        request.port.port_names = ["p2"]
+        assert api._metrics_poller._requests[key].serialize() == key
+    finally:
+        api._enable_metrics_poller(False)
+
+
+def test_metrics_poller_flow_deltas():
+    api = ixn_api()
+    api._connect = MagicMock()
+    api.traffic_item = MagicMock()
+    fetches = []
+
+    def results(request):
+        fetches.append(request)
+        count = len(fetches)
+        return [
+            {
+                "name": "f1",
+                "port_tx": "p1",
+                "port_rx": "p2",
+                "frames_rx": 10 * count,
+            },
+            {
+                "name": "f1",
+                "port_tx": "p1",
+                "port_rx": "p3",
+                "frames_rx": 20 * count,
+            },
+        ]
+
+    api.traffic_item.results.side_effect = results
+    api._enable_metrics_poller(True, interval=60, max_age=0)
+    try:
+        request = api.metrics_request()
+        request.flow.flow_names = ["f1"]
+        api.get_metrics(request)
+        api.get_metrics(request)
+        deltas = api.get_metrics_deltas(request)
+        # the rows of one flow are told apart by their ports
+        assert [(d["port_rx"], d["frames_rx_delta"]) for d in deltas] == [
+            ("p2", 10),
+            ("p3", 20),
+        ]
+    finally:
+        api._enable_metrics_poller(False)
@@ -0,0 +1,35 @@
+from mock import MagicMock
+from ixnetwork_restpy.assistants.statistics.row import Row
+from snappi_ixnetwork.vport import Vport
+
+COLUMNS = ["Port Name", "Frames Tx.", "Valid Frames Rx.", "Bytes Tx."]
+ROWS = [["p1", "10", "20", "640"], ["p2", "30", "40", "1920"]]
+
+
+def _port_stats_api():
+    api = MagicMock()
+    api.select_vports.return_value = {
+        name: {
+            "name": name,
+            "location": "",
+            "connectionState": "connectedLinkUp",
+        }
+        for name in ["p1", "p2", "p3"]
+    }
+    table = api.assistant.StatViewAssistant.return_value
+    table.Rows = Row("Port Statistics", COLUMNS, ROWS)
+    return api
+
+
+def test_port_results_column_projection():
+    api = _port_stats_api()
+    results = Vport(api).results(
+        {"port_names": ["p1", "p2"], "column_names": ["name", "frames_rx"]}
+    )
+    assert results == [
+        {"name": "p1", "frames_rx": 20},
+        {"name": "p2", "frames_rx": 40},
+    ]
+    # the rows are read from one refresh of the view
+    api.assistant.StatViewAssistant.assert_called_once_with("Port Statistics")
+    api._request.assert_not_called()
@@ -0,0 +1,164 @@
+from ixnetwork_restpy.assistants.statistics.row import Row
+from mock import MagicMock
+from snappi_ixnetwork import protocolmetrics
+from snappi_ixnetwork.protocolmetrics import ProtocolMetrics
+
+COLUMNS = ["Device Group", "Status", "Routes Rx"]
+PORTS = ["p1", "p2", "p3"]
+
+
+def _protocol_metrics(protocol_views=False):
+    api = MagicMock()
+    api._protocol_views = protocol_views
+    api.dev_compacted = {}
+    metrics = ProtocolMetrics(api)
+    metrics.ixn = MagicMock()
+    metrics.device_names = ["d1", "d2", "d3"]
+    metrics.columns = ["name", "session_state", "routes_received"]
+    metrics._port_list_in_per_port = MagicMock(
+        return_value=(PORTS, {"href": "/statistics/view/1"})
+    )
+    metrics._port_names_from_devices = MagicMock(return_value=PORTS)
+    metrics.ixn._connection._execute.return_value = [
+        {"drillDown": {"href": "/statistics/view/1/drillDown"}}
+    ]
+    drill = MagicMock()
+    drill.__len__.return_value = 1
+    drill.Data.IsReady = True
+    drill.Data.ColumnCaptions = COLUMNS
+    drill.Data.PageValues = [[["d1", "up", "10"]]]
+    metrics.ixn.Statistics.View.find.return_value = drill
+    return metrics, api
+
+
+def test_drill_down_per_port():
+    metrics, api = _protocol_metrics()
+    rows = metrics._get_per_device_group_stats("bgpv4")
+    assert len(rows) == len(PORTS)
+    assert rows[0] == {
+        "name": "d1",
+        "session_state": "up",
+        "routes_received": 10,
+    }
+    # the drill down node and view are looked up once for all the ports
+    assert metrics.ixn._connection._execute.call_count == 1
+    metrics.ixn.Statistics.View.find.assert_called_once_with(
+        Caption="BGP Peer Drill Down"
+    )
+    drill_downs = [
+        c.args for c in api._request.call_args_list if c.args[0] == "POST"
+    ]
+    assert len(drill_downs) == len(PORTS) * 2
+
+
+def test_protocol_view(monkeypatch):
+    metrics, api = _protocol_metrics(protocol_views=True)
+    metrics.ixn.Statistics.View.find.return_value = []
+    captions = []
+
+    class Reader(object):
+        def __init__(self, ixnetworkapi, caption):
+            captions.append(caption)
+
+        def rows(self):
+            return Row(
+                "snappi bgpv4",
+                COLUMNS,
+                [["d1", "up", "10"], ["d2", "down", "0"], ["d4", "up", "1"]],
+            )
+
+    monkeypatch.setattr(protocolmetrics, "StatViewReader", Reader)
+    for _ in range(2):
+        rows = metrics._get_per_device_group_stats("bgpv4")
+        assert [r["name"] for r in rows] == ["d1", "d2"]
+    # the custom view is created once per configuration
+    view = metrics.ixn.Statistics.View.add.return_value
+    metrics.ixn.Statistics.View.add.assert_called_once()
+    view.AdvancedCVFilters.add.assert_called_once_with(
+        Caption="snappi bgpv4", Protocol="BGP Peer", Grouping="Per Session"
+    )
+    assert captions == ["snappi bgpv4", "snappi bgpv4"]
+    api._request.assert_not_called()
+    metrics.clear_views()
+    assert metrics._protocol_views == {}
+
+
+def test_protocol_view_fallback():
+    metrics, api = _protocol_metrics(protocol_views=True)
+    metrics.ixn.Statistics.View.add.side_effect = Exception("not supported")
+    rows = metrics._get_per_device_group_stats("bgpv4")
+    assert len(rows) == len(PORTS)
+    api.warning.assert_called_once()
+
+
+def test_compacted_device_names():
+    metrics, api = _protocol_metrics()
+    api.dev_compacted_index = {
+        ("d1", index + 1): "d1" if index == 0 else "peer%d" % index
+        for index in range(8000)
+    }
+    metrics.device_names = ["peer7999", "d1", "d2"]
+    values = [["d1", "%d" % (i + 1), "up", "1"] for i in range(8000)]
+    values.append(["d2", "1", "down", "0"])
+    rows = []
+    metrics._convert_rows(
+        ["Device Group", "Device#", "Status", "Routes Rx"],
+        values,
+        metrics._RESULT_COLUMNS["bgpv4"],
+        rows,
+    )
+    assert [r["name"] for r in rows] == ["d1", "peer7999", "d2"]
+
+
+def _topology_status(count):
+    prefix = "/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup"
+    return {
+        "result": [
+            {
+                "arg1": "%s/%d/ethernet/1/ipv4/1/bgpIpv4Peer/1" % (prefix, i),
+                "arg2": [
+                    {"arg1": "total", "arg2": 2},
+                    {"arg1": "up", "arg2": 2},
+                    {"arg1": "down", "arg2": 0},
+                    {"arg1": "notStarted", "arg2": 0},
+                ],
+            }
+            for i in range(1, count + 1)
+        ]
+    }
+
+
+def test_topology_stats():
+    metrics, api = _protocol_metrics()
+    metrics.device_names = []
+    api._request.return_value = _topology_status(3000)
+    metrics.ixn._connection._execute.return_value = [
+        {
+            "deviceGroup": [
+                {
+                    "href": "/api/v1/sessions/1/ixnetwork/topology/1/"
+                    "deviceGroup/%d" % i,
+                    "name": "d%d" % i,
+                }
+                for i in range(1, 3001)
+            ]
+        }
+    ]
+    rows = metrics._topo_stats("bgpv4")
+    assert len(rows) == 3000
+    # deviceGroup/1 is not mixed up with deviceGroup/10
+    assert rows[9] == {
+        "name": "d10",
+        "sessions_total": 2,
+        "sessions_up": 2,
+        "sessions_down": 0,
+        "sessions_not_started": 0,
+    }
+    metrics.device_names = ["d2", "d20"]
+    rows = metrics._topo_stats("bgpv4")
+    assert [r["name"] for r in rows] == ["d2", "d20"]
+    # the device groups are selected once per configuration
+    assert metrics.ixn._connection._execute.call_count == 1
+    metrics.clear_cache()
+    metrics._topo_stats("bgpv4")
+    assert metrics.ixn._connection._execute.call_count == 2
@@ -0,0 +1,87 @@
+import threading
+import time
+import snappi
+from mock import MagicMock
+from snappi_ixnetwork.objectdb import IxNetInfo, IxNetObjects
+from snappi_ixnetwork.ping import Ping
+
+
+def _ping_api(count):
+    api = MagicMock()
+    api._ixnetwork.href = "/api/v1/sessions/1/ixnetwork/"
+    api.ixn_objects = IxNetObjects(api)
+    config = snappi.Api().config()
+    for i in range(1, count + 1):
+        eth = config.devices.device(name="d%d" % i)[-1].ethernets.add()
+        eth.name = "eth%d" % i
+        eth.ipv4_addresses.ipv4(name="ip%d" % i, address="10.1.1.%d" % i)
+        xpath = "/topology[%d]/deviceGroup[1]/ethernet[1]/ipv4[1]" % i
+        api.ixn_objects._ixnet_infos["ip%d" % i] = IxNetInfo(
+            {"xpath": xpath}, None
+        )
+    api._config = config
+    api.active = []
+    api.max_active = [0]
+    lock = threading.Lock()
+
+    def execute(url, payload):
+        with lock:
+            api.active.append(url)
+            api.max_active[0] = max(api.max_active[0], len(api.active))
+        time.sleep(0.02)
+        with lock:
+            api.active.remove(url)
+        return [
+            {
+                "arg1": "/api/v1/sessions/1/ixnetwork/vport/1",
+                "arg2": payload["arg2"].endswith(".1"),
+                "arg3": "Ping to %s succeeded" % payload["arg2"],
+            }
+        ]
+
+    api._ixnetwork._connection._execute.side_effect = execute
+    return api
+
+
+def test_ping_sources_concurrently():
+    api = _ping_api(8)
+    request = snappi.Api().control_action().protocol.ipv4.ping
+    for i in range(1, 9):
+        for dst in ["20.1.1.1", "20.1.1.2"]:
+            request.requests.add(src_name="ip%d" % i, dst_ip=dst)
+    request.requests.add(src_name="ip1", dst_ip="20.1.1.1")
+    ping = Ping(api)
+    ping.max_workers = 4
+    responses = ping.results(request, "ipv4")
+    assert len(responses) == 17
+    assert responses[0] == {
+        "src_name": "ip1",
+        "dst_ip": "20.1.1.1",
+        "result": "succeeded",
+    }
+    assert responses[1]["result"] == "failed"
+    assert responses[-1] == responses[0]
+    # the repeated request is not sent again
+    execute = api._ixnetwork._connection._execute
+    assert execute.call_count == 16
+    url, payload = execute.call_args_list[0].args
+    assert url == (
+        "/api/v1/sessions/1/ixnetwork/topology/1/deviceGroup/1"
+        "/ethernet/1/ipv4/1/operations/sendping"
+    )
+    assert 1 < api.max_active[0] <= 4
+
+
+def test_ping_compacted_source():
+    api = _ping_api(1)
+    api.ixn_objects._ixnet_infos["ip1"] = IxNetInfo(
+        {"xpath": "/topology[1]/deviceGroup[1]/ethernet[1]/ipv4[1]"},
+        None,
+        index=4,
+        names=["ip0", "ip1"],
+    )
+    request = snappi.Api().control_action().protocol.ipv4.ping
+    request.requests.add(src_name="ip1", dst_ip="20.1.1.1")
+    Ping(api).results(request, "ipv4")
+    payload = api._ixnetwork._connection._execute.call_args.args[1]
+    assert payload["arg3"] == [5]
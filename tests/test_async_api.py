@@ -0,0 +1,83 @@
+import time
+import asyncio
+import threading
+import pytest
+from snappi_ixnetwork import AsyncApi
+
+
+class BlockingApi(object):
+    """Records the calls running at the same time"""
+
+    def __init__(self):
+        self._assistant = object()
+        self.active = []
+        self.overlaps = []
+        self.lock = threading.Lock()
+
+    def _call(self, name, delay=0.1):
+        with self.lock:
+            self.active.append(name)
+            self.overlaps.append(tuple(sorted(self.active)))
+        time.sleep(delay)
+        with self.lock:
+            self.active.remove(name)
+        return name
+
+    def set_config(self, config):
+        return self._call("set_config")
+
+    def get_metrics(self, request):
+        return self._call("get_metrics " + request)
+
+    def get_states(self, request):
+        return self._call("get_states " + request)
+
+
+def test_async_api_serialized_reads():
+    api = BlockingApi()
+
+    async def run():
+        async with AsyncApi(api) as async_api:
+            return await asyncio.gather(
+                async_api.get_metrics("a"),
+                async_api.get_metrics("b"),
+                async_api.get_states("c"),
+            )
+
+    results = asyncio.run(run())
+    assert results == ["get_metrics a", "get_metrics b", "get_states c"]
+    # the reads share the columns and views of the session
+    assert max(len(overlap) for overlap in api.overlaps) == 1
+
+
+def test_async_api_exclusive_config():
+    api = BlockingApi()
+
+    async def run():
+        async with AsyncApi(api) as async_api:
+            await asyncio.gather(
+                async_api.get_metrics("a"),
+                async_api.set_config("c"),
+                async_api.get_metrics("b"),
+            )
+
+    asyncio.run(run())
+    for overlap in api.overlaps:
+        assert "set_config" not in overlap or overlap == ("set_config",)
+
+
+def test_async_api_cancel():
+    api = BlockingApi()
+
+    async def run():
+        async with AsyncApi(api) as async_api:
+            task = asyncio.ensure_future(async_api.set_config("c"))
+            await asyncio.sleep(0.02)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            # the cancelled call still completes before the next one
+            assert await async_api.get_metrics("a") == "get_metrics a"
+
+    asyncio.run(run())
+    assert ("get_metrics a", "set_config") not in api.overlaps
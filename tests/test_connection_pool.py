@@ -0,0 +1,57 @@
+import gzip
+import json
+from mock import MagicMock
+from requests import Session
+from snappi_ixnetwork.connectionpool import ConnectionPool
+from snappi_ixnetwork.snappi_api import Api as ixn_api
+
+
+class Connection(object):
+    def __init__(self):
+        self._session = Session()
+        self._headers = {"Connection": "keep-alive"}
+        self.x_api_key = "key"
+
+
+def test_connection_pool_mount():
+    pool = ConnectionPool(pool_size=32, retries=3, keep_alive=False)
+    platform, session = Connection(), Connection()
+    pool.mount(platform)
+    pool.mount(session)
+    assert session._session is platform._session
+    adapter = platform._session.get_adapter("https://127.0.0.1:11009")
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 3
+    assert session._headers["Connection"] == "close"
+    assert pool.headers(session)["Connection"] == "close"
+
+
+def test_connection_pool_gzip():
+    pool = ConnectionPool(gzip=True)
+    headers = {"Content-Type": "application/json"}
+    data, small_headers = pool.encode({"a": 1}, headers)
+    assert data == '{"a": 1}'
+    assert small_headers is headers
+    payload = {"names": ["f%d" % i for i in range(500)]}
+    data, large_headers = pool.encode(payload, headers)
+    assert large_headers["Content-Encoding"] == "gzip"
+    assert "Content-Encoding" not in headers
+    assert json.loads(gzip.decompress(data)) == payload
+
+
+def test_request_reuses_headers():
+    api = ixn_api(pool_size=4)
+    api._assistant = MagicMock()
+    connection = api._assistant.Session._connection
+    connection._normalize_url.side_effect = lambda url: ("", url)
+    connection.x_api_key = "key"
+    response = connection._session.request.return_value
+    response.status_code = 200
+    response.headers = {"Content-Type": "application/json"}
+    response.json.return_value = {"result": []}
+    assert api._request("POST", "/api/v1/x", {"a": 1}) == {"result": []}
+    api._request("GET", "/api/v1/y")
+    first, second = connection._session.request.call_args_list
+    assert first.kwargs["headers"] is second.kwargs["headers"]
+    assert first.kwargs["data"] == '{"a": 1}'
+    assert second.kwargs["data"] is None
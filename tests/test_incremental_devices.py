@@ -0,0 +1,163 @@
+import snappi
+from mock import MagicMock
+from snappi_ixnetwork.device.ngpf import Ngpf
+from snappi_ixnetwork.objectdb import IxNetInfo
+
+
+def _topology(index, port_name, mac):
+    xpath = "/topology[%d]" % index
+    return {
+        "xpath": xpath,
+        "name": "Topology %s" % port_name,
+        "ports": ["/vport[%d]" % index],
+        "deviceGroup": [
+            {
+                "xpath": "%s/deviceGroup[1]" % xpath,
+                "name": "d%d" % index,
+                "ethernet": [
+                    {
+                        "xpath": "%s/deviceGroup[1]/ethernet[1]" % xpath,
+                        "mac": {
+                            "xpath": "/multivalue[@source = '%s/deviceGroup"
+                            "[1]/ethernet[1] mac']" % xpath,
+                            "singleValue": {"value": mac},
+                        },
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def _ixn_topology(name):
+    ixn_topo = MagicMock()
+    ixn_topo.Name = name
+    ixn_topo.Status = "started"
+    return ixn_topo
+
+
+def test_incremental_devices_keep_unchanged():
+    api = MagicMock()
+    ngpf = Ngpf(api)
+    ngpf._applied_topologies = [
+        (topo["name"], ngpf._get_topology_signature(topo))
+        for topo in [
+            _topology(1, "p1", "00:00:00:00:00:01"),
+            _topology(2, "p2", "00:00:00:00:00:02"),
+            _topology(3, "p3", "00:00:00:00:00:03"),
+        ]
+    ]
+    ixn_topos = [_ixn_topology("Topology p%d" % i) for i in range(1, 4)]
+    api._topology.find.return_value = ixn_topos
+    # p1 changed, p2 unchanged, p3 removed and p4 added
+    ngpf._ixn_config = {
+        "xpath": "/",
+        "topology": [
+            _topology(1, "p1", "00:00:00:00:00:11"),
+            _topology(2, "p2", "00:00:00:00:00:02"),
+            _topology(3, "p4", "00:00:00:00:00:04"),
+        ],
+    }
+    changed = ngpf._remove_changed_topologies()
+    assert [t["name"] for t in changed] == ["Topology p1", "Topology p4"]
+    ixn_topos[0].Stop.assert_called_once()
+    ixn_topos[1].Stop.assert_not_called()
+    ixn_topos[2].Stop.assert_called_once()
+    kept = api._remove.call_args.args[1]
+    assert kept == [{"name": "Topology p2"}]
+    topologies = ngpf._ixn_config["topology"]
+    assert [t["xpath"] for t in topologies] == [
+        "/topology[1]",
+        "/topology[2]",
+        "/topology[3]",
+    ]
+    assert topologies[0]["name"] == "Topology p2"
+    mac = topologies[1]["deviceGroup"][0]["ethernet"][0]["mac"]
+    assert mac["xpath"].startswith("/multivalue[@source = '/topology[2]/")
+    # only p1 and p4 are (re-)created, at their new positions
+    assert ngpf._changed_topologies == {"/topology[2]", "/topology[3]"}
+    api.ixn_objects._ixnet_infos = {
+        "d1": IxNetInfo({"xpath": "/topology[2]/deviceGroup[1]"}, None),
+        "d2": IxNetInfo({"xpath": "/topology[1]/deviceGroup[1]"}, None),
+    }
+    api.ixn_routes._ixnet_infos = {}
+    assert ngpf.is_topology_changed(["d2"]) is False
+    assert ngpf.is_topology_changed(["d2", "d1"]) is True
+    # an unknown name is assumed to be re-created
+    assert ngpf.is_topology_changed(["d5"]) is True
+
+
+def test_incremental_devices_out_of_sync():
+    api = MagicMock()
+    ngpf = Ngpf(api)
+    topo = _topology(1, "p1", "00:00:00:00:00:01")
+    ngpf._applied_topologies = [
+        (topo["name"], ngpf._get_topology_signature(topo))
+    ]
+    ngpf._ixn_config = {"xpath": "/", "topology": [topo]}
+    api._topology.find.return_value = []
+    assert ngpf._remove_changed_topologies() is None
+    api._topology.find.return_value = [_ixn_topology("Topology p1")]
+    assert ngpf._remove_changed_topologies() == []
+    assert ngpf._changed_topologies == set()
+    api._remove.assert_called_once()
+
+
+def test_incremental_devices_protocols_not_stopped():
+    from snappi_ixnetwork.vport import Vport
+
+    api = MagicMock()
+    api._incremental_devices = True
+    api.snappi_config = snappi.Api().config()
+    api.snappi_config.ports.port(name="p1", location="localhost;1;1")
+    vport = Vport(api)
+    vport._applied_ports = vport._get_ports_signature()
+    vport.config_ports()
+    api._ixnetwork.StopAllProtocols.assert_not_called()
+
+    ngpf = Ngpf(api)
+    topo = _topology(1, "p1", "00:00:00:00:00:01")
+    ngpf._applied_topologies = [
+        (topo["name"], ngpf._get_topology_signature(topo))
+    ]
+    ngpf._ixn_config = {"xpath": "/", "topology": [topo]}
+    ixn_topo = _ixn_topology("Topology p1")
+    api._topology.find.return_value = [ixn_topo]
+    api.get_errors.return_value = []
+    ngpf._resource_manager = MagicMock()
+    ngpf._pushixnconfig()
+    ixn_topo.Stop.assert_not_called()
+    api._ixnetwork.StopAllProtocols.assert_not_called()
+    ngpf._resource_manager.ImportConfig.assert_not_called()
+
+
+def test_full_push_clears_before_conversion():
+    api = MagicMock()
+    api._incremental_devices = False
+    api.snappi_config.devices = []
+    ngpf = Ngpf(api)
+    ngpf._ixn_config = {"xpath": "/"}
+    ngpf._chain_parent_dgs = []
+    ngpf.loopback_parent_dgs = []
+    ngpf._configure_topology()
+    api._remove.assert_called_once_with(api._topology, [])
+    api.get_errors.return_value = []
+    ngpf._resource_manager = MagicMock()
+    ngpf._pushixnconfig()
+    # the topologies are not removed a second time
+    api._remove.assert_called_once()
+
+
+def test_incremental_devices_ports_changed():
+    from snappi_ixnetwork.vport import Vport
+
+    api = MagicMock()
+    api._incremental_devices = True
+    api.snappi_config = snappi.Api().config()
+    port = api.snappi_config.ports.port(name="p1", location="localhost;1;1")
+    vport = Vport(api)
+    vport._applied_ports = vport._get_ports_signature()
+    # the protocols are stopped before a location is changed
+    port[-1].location = "localhost;1;2"
+    vport.config_ports()
+    api._ixnetwork.StopAllProtocols.assert_called_once_with(arg1="sync")
@@ -0,0 +1,112 @@
+import snappi
+from mock import MagicMock
+from snappi_ixnetwork.device.ngpf import Ngpf
+from snappi_ixnetwork.objectdb import IxNetInfo, IxNetObjects
+
+
+def _ethernet(index, sessions):
+    xpath = "/topology[%d]/deviceGroup[1]/ethernet[1]" % index
+    return {
+        "xpath": xpath,
+        "ipv4": [
+            {
+                "xpath": "%s/ipv4[1]" % xpath,
+                "gatewayIp": {
+                    "values": [
+                        "10.%d.%d.2" % (index, i) for i in range(sessions)
+                    ]
+                },
+                "resolvedGatewayMac": ["00:00:00:00:00:%02x" % index]
+                + ["Unresolved"] * (sessions - 1),
+            }
+        ],
+    }
+
+
+def _neighbors_api():
+    api = MagicMock()
+    api._ixnetwork.href = "/api/v1/sessions/1/ixnetwork"
+    api.ixn_objects = IxNetObjects(api)
+    ngpf = Ngpf(api)
+    for index in range(1, 4):
+        api.ixn_objects._ixnet_infos["eth%d" % index] = IxNetInfo(
+            {"xpath": "/topology[%d]/deviceGroup[1]/ethernet[1]" % index},
+            None,
+        )
+        ngpf.ether_v4gateway_map["eth%d" % index] = [
+            "10.%d.0.2" % index,
+            "10.%d.1.2" % index,
+        ]
+    execute = api._ixnetwork._connection._execute
+    execute.side_effect = lambda url, payload: [
+        _ethernet(int(select["from"].split("/")[2]), 2)
+        for select in payload["selects"]
+    ]
+    return api, ngpf
+
+
+def test_get_states_selects_requested_ethernets():
+    api, ngpf = _neighbors_api()
+    request = snappi.Api().states_request()
+    request.ipv4_neighbors.ethernet_names = ["eth3", "eth1"]
+    states = ngpf.get_states(request)
+    assert states["ipv4_neighbors"] == [
+        {
+            "ethernet_name": "eth3",
+            "ipv4_address": "10.3.0.2",
+            "link_layer_address": "00:00:00:00:00:03",
+        },
+        {
+            "ethernet_name": "eth3",
+            "ipv4_address": "10.3.1.2",
+            "link_layer_address": None,
+        },
+        {
+            "ethernet_name": "eth1",
+            "ipv4_address": "10.1.0.2",
+            "link_layer_address": "00:00:00:00:00:01",
+        },
+        {
+            "ethernet_name": "eth1",
+            "ipv4_address": "10.1.1.2",
+            "link_layer_address": None,
+        },
+    ]
+    execute = api._ixnetwork._connection._execute
+    execute.assert_called_once()
+    payload = execute.call_args.args[1]
+    assert [select["from"] for select in payload["selects"]] == [
+        "/topology/3/deviceGroup/1/ethernet/1",
+        "/topology/1/deviceGroup/1/ethernet/1",
+    ]
+    api._ixnetwork.Topology.find.assert_not_called()
+
+
+def test_get_states_restricted_ethernet():
+    api, ngpf = _neighbors_api()
+    ngpf.ether_ip_restriction_map["eth2"] = True
+    # the root of the session with its list of topologies
+    api._ixnetwork._connection._execute.side_effect = lambda url, payload: [
+        {
+            "xpath": "/",
+            "topology": [
+                {
+                    "xpath": "/topology[%d]" % index,
+                    "deviceGroup": [
+                        {
+                            "xpath": "/topology[%d]/deviceGroup[1]" % index,
+                            "ethernet": [_ethernet(index, 2)],
+                        }
+                    ],
+                }
+                for index in range(1, 4)
+            ],
+        }
+    ]
+    request = snappi.Api().states_request()
+    request.ipv4_neighbors.ethernet_names = ["eth2"]
+    states = ngpf.get_states(request)
+    assert len(states["ipv4_neighbors"]) == 2
+    payload = api._ixnetwork._connection._execute.call_args.args[1]
+    assert payload["selects"][0]["from"] == "/"
+    assert "topology" in payload["selects"][0]["children"][0]["child"]
@@ -0,0 +1,76 @@
+import time
+import pytest
+from mock import MagicMock
+from snappi_ixnetwork.pipeline import Pipeline
+from snappi_ixnetwork.snappi_api import Api
+
+
+def test_pipeline_dependency_order():
+    events = []
+
+    def stage(name, delay=0):
+        def run():
+            events.append("start " + name)
+            time.sleep(delay)
+            events.append("end " + name)
+
+        return run
+
+    pipeline = Pipeline(MagicMock())
+    pipeline.add("ports", stage("ports"))
+    pipeline.add("location", stage("location", 0.2), ["ports"])
+    pipeline.add("conversion", stage("conversion"), ["ports"])
+    pipeline.add("devices", stage("devices"), ["location", "conversion"])
+    pipeline.run()
+    assert events[:2] == ["start ports", "end ports"]
+    # conversion overlaps with the location stage
+    assert events.index("end conversion") < events.index("end location")
+    assert events[-2:] == ["start devices", "end devices"]
+
+
+def test_pipeline_error():
+    calls = []
+
+    def fail():
+        raise RuntimeError("location failed")
+
+    pipeline = Pipeline(MagicMock())
+    pipeline.add("location", fail)
+    pipeline.add("devices", lambda: calls.append("devices"), ["location"])
+    with pytest.raises(RuntimeError):
+        pipeline.run()
+    assert calls == []
+    with pytest.raises(ValueError):
+        pipeline.add("flows", lambda: None, ["unknown"])
+
+
+def test_pipelined_config_request_stages():
+    events = []
+
+    def stage(name):
+        def run(*args):
+            events.append("start " + name)
+            time.sleep(0.02)
+            events.append("end " + name)
+
+        return MagicMock(side_effect=run)
+
+    api = Api()
+    api._config = api.config()
+    api.vport = MagicMock(
+        config_ports=stage("ports"), config_location=stage("location")
+    )
+    api.lag = MagicMock(config=stage("lags"))
+    api.ngpf = MagicMock(convert=stage("convert"), push=stage("push"))
+    api.traffic_item = MagicMock(
+        prepare=stage("prepare"), config=stage("flows")
+    )
+    api._pipelined_config_ixnetwork()
+    # the stages sending requests never overlap
+    requests = [event for event in events if event.split(" ")[1] != "prepare"]
+    assert requests == [
+        "%s %s" % (event, name)
+        for name in ["ports", "location", "lags", "convert", "push", "flows"]
+        for event in ["start", "end"]
+    ]
+    assert events.index("start prepare") < events.index("end ports")
@@ -0,0 +1,77 @@
+import time
+import pytest
+from mock import MagicMock
+from snappi_ixnetwork import poll as poll_module
+from snappi_ixnetwork.poll import poll, poll_data
+from snappi_ixnetwork.snappi_api import Api as ixn_api
+
+
+def test_poll_backoff():
+    calls = []
+
+    def condition():
+        calls.append(time.time())
+        return "ready" if len(calls) == 4 else None
+
+    assert poll(condition, "backoff", 5, interval=0.05, jitter=0) == "ready"
+    waits = [b - a for a, b in zip(calls, calls[1:])]
+    # 0.05, 0.1, 0.2
+    assert waits[0] < waits[1] < waits[2]
+    assert poll_data["backoff"].attempts == 4
+    assert poll_data["backoff"].timed_out is False
+
+
+def test_poll_deadline():
+    start = time.time()
+    with pytest.raises(RuntimeError):
+        poll(
+            lambda: False,
+            "deadline",
+            60,
+            interval=0.05,
+            deadline=start + 0.2,
+            error=RuntimeError("not ready"),
+        )
+    assert time.time() - start < 1
+    assert poll_data["deadline"].timed_out is True
+    # without an error the last result is returned
+    assert poll(lambda: [], "empty", 0.1, interval=0.05) == []
+
+
+def test_request_polls_async_operation():
+    api = ixn_api()
+    api._assistant = MagicMock()
+    connection = api._assistant.Session._connection
+    connection._normalize_url.side_effect = lambda url: ("", url)
+    states = ["IN_PROGRESS", "IN_PROGRESS", "SUCCESS"]
+
+    def request(method, url, **kwargs):
+        response = MagicMock()
+        response.headers = {"Content-Type": "application/json"}
+        if method == "POST":
+            response.status_code = 202
+            state = "IN_PROGRESS"
+        else:
+            response.status_code = 200
+            state = states.pop(0)
+        response.json.return_value = {
+            "state": state,
+            "url": "/operation/1",
+            "result": [1, 2],
+        }
+        return response
+
+    connection._session.request.side_effect = request
+    content = api._request("POST", "/operations/getcolumnvalues", {})
+    assert content["result"] == [1, 2]
+    assert states == []
+    assert "Operation getcolumnvalues" in poll_data
+
+
+def test_poll_data_size(monkeypatch):
+    monkeypatch.setattr(poll_module, "POLL_DATA_SIZE", 3)
+    for index in range(5):
+        poll(lambda: True, "size %d" % index, 1)
+    # only the latest polls are kept
+    assert list(poll_data)[-3:] == ["size 2", "size 3", "size 4"]
+    assert len(poll_data) == 3
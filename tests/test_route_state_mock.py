@@ -0,0 +1,70 @@
+import json
+import snappi
+from mock import MagicMock
+from snappi_ixnetwork.device.ngpf import Ngpf
+from snappi_ixnetwork.objectdb import IxNetInfo, IxNetObjects
+
+RANGES = 1000
+
+
+def _route_api():
+    api = MagicMock()
+    api._ixnetwork.href = "/api/v1/sessions/1/ixnetwork"
+    api.ixn_routes = IxNetObjects(api)
+    xpaths = [
+        "/topology[1]/deviceGroup[1]/networkGroup[%d]/ipv4PrefixPools[1]" % i
+        for i in range(1, 3)
+    ]
+    # compacted route ranges, every name owns 2 entries of the multivalue
+    for xpath in xpaths:
+        ixnobject = {"xpath": xpath}
+        for index in range(RANGES):
+            name = "%s r%d" % (xpath[-25:], index)
+            api.ixn_routes._ixnet_infos[name] = IxNetInfo(
+                ixnobject, None, index=index * 2, multiplier=2
+            )
+
+    def execute(url, payload):
+        return [
+            {"active": {"values": ["true"] * (RANGES * 2)}}
+            for _ in payload["selects"]
+        ]
+
+    api._ixnetwork._connection._execute.side_effect = execute
+    return api, xpaths
+
+
+def test_set_route_state_batched():
+    api, xpaths = _route_api()
+    ngpf = Ngpf(api)
+    ngpf._resource_manager = MagicMock()
+    ngpf._resource_manager.ImportConfig.return_value = []
+    route_state = snappi.Api().control_state().protocol.route
+    route_state.state = route_state.WITHDRAW
+    route_state.names = [
+        name for name in api.ixn_routes.names if name.endswith(" r1")
+    ] + [name for name in api.ixn_routes.names if xpaths[1][-25:] in name]
+    names = ngpf.set_route_state(route_state)
+    assert len(names) == RANGES + 1
+    # one select for both route objects
+    api._ixnetwork._connection._execute.assert_called_once()
+    imports = json.loads(ngpf._resource_manager.ImportConfig.call_args.args[0])
+    assert len(imports) == 2
+    imports = sorted(imports, key=lambda ixn_value: ixn_value["xpath"])
+    values = imports[0]["values"]
+    assert values[:4] == ["true", "true", False, False]
+    assert values.count(False) == 2
+    # every range of the second object is withdrawn
+    assert imports[1]["value"] is False
+    api._ixnetwork.Globals.Topology.ApplyOnTheFly.assert_called_once()
+
+
+def test_set_route_state_unchanged():
+    api, _ = _route_api()
+    ngpf = Ngpf(api)
+    ngpf._resource_manager = MagicMock()
+    route_state = snappi.Api().control_state().protocol.route
+    route_state.state = route_state.ADVERTISE
+    ngpf.set_route_state(route_state)
+    # all the routes are already advertised
+    ngpf._resource_manager.ImportConfig.assert_not_called()
@@ -0,0 +1,75 @@
+import pytest
+import snappi
+from mock import MagicMock, patch
+from snappi.snappi import OpenApiObject
+from snappi_ixnetwork.validation import Validation
+
+
+def _config(routes=100, duplicate=False):
+    config = snappi.Api().config()
+    config.ports.port(name="p1", location="localhost;1;1")
+    device = config.devices.device(name="d1")[-1]
+    eth = device.ethernets.add()
+    eth.connection.port_name = "p1"
+    eth.name = "p1" if duplicate else "eth1"
+    eth.mac = "00:00:01:01:01:01"
+    ip = eth.ipv4_addresses.ipv4(
+        name="ip1", address="10.1.1.1", gateway="10.1.1.2"
+    )[-1]
+    bgp = device.bgp
+    bgp.router_id = "10.1.1.1"
+    peer = bgp.ipv4_interfaces.v4interface(ipv4_name=ip.name)[-1].peers.v4peer(
+        name="peer1",
+        peer_address="10.1.1.2",
+        as_type="ibgp",
+        as_number=65001,
+    )[-1]
+    for i in range(routes):
+        route = peer.v4_routes.add(name="route%d" % i)
+        route.addresses.add(address="100.%d.%d.0" % (i // 256, i % 256))
+    flow = config.flows.flow(name="f1")[-1]
+    flow.tx_rx.device.tx_names = ["route0"]
+    flow.tx_rx.device.rx_names = ["ip1"]
+    flow.packet.ethernet().ipv4().tcp()
+    flow.packet[1].src.value = "1.1.1.2"
+    return config
+
+
+def _validation(config, memo=False):
+    api = MagicMock()
+    api.snappi_config = config
+    api._config_objects = {}
+    api._validation_memo = memo
+    return Validation(api), api
+
+
+def test_validation_unique_names():
+    validation, api = _validation(_config())
+    validation.validate_config()
+    assert "route99" in api._config_objects
+    assert api._config_objects["f1"].name == "f1"
+    validation, api = _validation(_config(duplicate=True))
+    with pytest.raises(NameError) as error:
+        validation.validate_config()
+    assert 'name: "p1" is not unique' in str(error.value)
+
+
+def test_validation_memo():
+    validation, api = _validation(_config(), memo=True)
+    validation.validate_config()
+    validate = OpenApiObject.validate
+    calls = []
+
+    def count(config_item):
+        calls.append(config_item)
+        return validate(config_item)
+
+    config = _config()
+    config.flows[0].packet[1].src.value = "1.1.1.1"
+    api.snappi_config = config
+    api._config_objects = {}
+    with patch.object(OpenApiObject, "validate", count):
+        validation.validate_config()
+    # only the changed source pattern of the flow is validated again
+    assert [c.__class__.__name__ for c in calls] == ["PatternFlowIpv4Src"]
+    assert "route99" in api._config_objects
@@ -0,0 +1,137 @@
+import snappi
+from mock import MagicMock
+from snappi_ixnetwork.statview import StatViewReader
+from snappi_ixnetwork.trafficitem import TrafficItem
+
+COLUMNS = ["Traffic Item", "Tx Port", "Rx Port", "Tx Frames", "Rx Frames"]
+
+
+class StatView(object):
+    """Serves the data node of a statistics view page by page"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.page_size = 50
+        self.current_page = 1
+        self.patches = []
+
+    def request(self, method, url, payload=None):
+        if method == "PATCH":
+            self.patches.append(payload)
+            self.page_size = payload.get("pageSize", self.page_size)
+            self.current_page = payload.get("currentPage", self.current_page)
+            return None
+        start = (self.current_page - 1) * self.page_size
+        page_rows = self.rows[start : start + self.page_size]
+        return {
+            "isReady": True,
+            "pageSize": self.page_size,
+            "currentPage": self.current_page,
+            "totalPages": -(-len(self.rows) // self.page_size),
+            "columnCaptions": COLUMNS,
+            "pageValues": [[row] for row in page_rows],
+        }
+
+
+def _stat_view_api(rows):
+    api = MagicMock()
+    view = MagicMock()
+    view.__len__.return_value = 1
+    api._ixnetwork.Statistics.View.find.return_value = view
+    api.stat_view = StatView(rows)
+    api._request = MagicMock(side_effect=api.stat_view.request)
+    return api
+
+
+def _traffic_item(name, state):
+    return {
+        "name": name,
+        "state": state,
+        "tracking": [{"trackBy": ["trackingenabled0"]}],
+        "highLevelStream": [{"txPortName": "p1", "rxPortNames": ["p2"]}],
+    }
+
+
+def _flow_tracking_api(rows):
+    api = _stat_view_api(rows)
+    api._flow_tracking = True
+    api.special_char = lambda names: names
+    api.select_traffic_items = MagicMock(
+        return_value={
+            "f1": _traffic_item("f1", "started"),
+            "f2": _traffic_item("f2", "stopped"),
+        }
+    )
+    return api
+
+
+def _row(name, tx_frames):
+    return [name, "p1", "p2", str(tx_frames), str(tx_frames)]
+
+
+def test_flow_tracking_results_state():
+    api = _flow_tracking_api([_row("f1", 100), _row("f2", 50)])
+    request = snappi.Api().metrics_request().flow
+    request.metric_names = ["frames_tx", "frames_rx"]
+    results = TrafficItem(api).results(request)
+    assert results == [
+        {"transmit": "started", "frames_tx": 100, "frames_rx": 100},
+        {"transmit": "stopped", "frames_tx": 50, "frames_rx": 50},
+    ]
+    # the state comes from the traffic item select, not a find per row
+    api._ixnetwork.Traffic.TrafficItem.find.assert_not_called()
+
+
+def test_flow_results_iterator():
+    api = _flow_tracking_api([_row("f2", 50)])
+    request = snappi.Api().metrics_request().flow
+    request.metric_names = ["frames_tx"]
+    results = TrafficItem(api).iter_results(request)
+    assert next(results) == {"transmit": "stopped", "frames_tx": 50}
+    # f1 has no statistics yet and is yielded last
+    assert next(results) == {"frames_tx": 0}
+
+
+def test_stat_view_reader_pages():
+    api = _stat_view_api([_row("f%d" % i, i) for i in range(5)])
+    reader = StatViewReader(api, "Flow Statistics", page_size=2)
+    names = [row["Traffic Item"] for row in reader.rows()]
+    assert names == ["f0", "f1", "f2", "f3", "f4"]
+    assert api.stat_view.patches == [
+        {"pageSize": 2, "currentPage": 1},
+        {"currentPage": 2},
+        {"currentPage": 3},
+        # the view is restored for other readers
+        {"pageSize": 50, "currentPage": 1},
+    ]
+
+
+def test_stat_view_reader_restore_on_close():
+    api = _stat_view_api([_row("f%d" % i, i) for i in range(5)])
+    api.stat_view.current_page = 2
+    api.stat_view.page_size = 4
+    rows = StatViewReader(api, "Flow Statistics", page_size=2).rows()
+    next(rows)
+    rows.close()
+    assert api.stat_view.patches[-1] == {"pageSize": 4, "currentPage": 2}
+
+
+def test_flow_results_column_projection():
+    api = _flow_tracking_api([_row("f1", 100), _row("f2", 50)])
+    api.stat_view.page_size = 500
+    request = snappi.Api().metrics_request().flow
+    request.metric_names = ["frames_rx"]
+    results = TrafficItem(api).results(request)
+    assert [r["frames_rx"] for r in results] == [100, 50]
+    assert "frames_tx" not in results[0]
+    # the rows come from whole pages of one refresh, not per column
+    methods = [c.args[0] for c in api._request.call_args_list]
+    assert methods == ["GET"]
+
+
+def test_flow_results_all_columns():
+    api = _flow_tracking_api([_row("f1", 100)])
+    request = snappi.Api().metrics_request().flow
+    results = TrafficItem(api).results(request)
+    assert results[0]["frames_tx"] == 100
+    assert results[0]["frames_rx"] == 100
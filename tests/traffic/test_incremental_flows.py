@@ -0,0 +1,98 @@
+import snappi
+from mock import MagicMock
+from snappi_ixnetwork.trafficitem import TrafficItem
+
+
+def _raw_config(names):
+    config = snappi.Api().config()
+    for name in names:
+        f = config.flows.flow(name=name)[-1]
+        f.tx_rx.port.tx_name = "p1"
+        f.tx_rx.port.rx_name = "p2"
+        f.packet.ethernet().ipv4()
+        f.rate.pps = 1000
+    return config
+
+
+def test_incremental_flows_diff():
+    api = MagicMock()
+    api._ixnetwork.Traffic.State = "stopped"
+    tr_obj = TrafficItem(api)
+    config = _raw_config(["f1", "f2", "f3", "f4"])
+    applied = {f.name: tr_obj._get_flow_fingerprint(f) for f in config.flows}
+    api.select_traffic_items = MagicMock(
+        return_value={
+            name: {"name": name, "href": "/traffic/trafficItem/%d" % i}
+            for i, name in enumerate(applied, start=1)
+        }
+    )
+
+    new_config = _raw_config(["f1", "f2", "f3", "f5"])
+    # f2 is patched, f3 is re-created, f4 removed and f5 created
+    new_config.flows[1].rate.pps = 2000
+    new_config.flows[2].packet[1].dst.value = "1.1.1.1"
+    tr_obj._config = new_config
+    fingerprints = {
+        f.name: tr_obj._get_flow_fingerprint(f) for f in new_config.flows
+    }
+    create_names, configure_names = tr_obj._remove_changed_traffic(
+        applied, fingerprints
+    )
+    assert create_names == {"f3", "f5"}
+    assert configure_names == {"f2", "f3", "f5"}
+    deleted = [c.args[1] for c in api._request.call_args_list]
+    assert deleted == ["/traffic/trafficItem/3", "/traffic/trafficItem/4"]
+    assert tr_obj.traffic_index == 3
+
+
+def test_incremental_flows_out_of_sync():
+    api = MagicMock()
+    tr_obj = TrafficItem(api)
+    config = _raw_config(["f1", "f2"])
+    tr_obj._config = config
+    applied = {f.name: tr_obj._get_flow_fingerprint(f) for f in config.flows}
+    api.select_traffic_items = MagicMock(return_value={"f1": {}})
+    assert tr_obj._remove_changed_traffic(applied, applied) is None
+    api._request.assert_not_called()
+
+
+def test_incremental_flows_disabled():
+    api = MagicMock()
+    api._incremental_flows = False
+    tr_obj = TrafficItem(api)
+    tr_obj._get_flow_fingerprint = MagicMock()
+    tr_obj.prepare(_raw_config(["f1"]))
+    tr_obj._get_flow_fingerprint.assert_not_called()
+    assert tr_obj._flow_fingerprints is None
+    # port compaction changes device endpoints of the re-created flows
+    api._incremental_flows = True
+    api._port_compaction = True
+    assert tr_obj._is_incremental() is False
+    api._port_compaction = False
+    tr_obj.prepare(_raw_config(["f1"]))
+    assert list(tr_obj._flow_fingerprints) == ["f1"]
+
+
+def test_incremental_flows_changed_topology():
+    api = MagicMock()
+    api._ixnetwork.Traffic.State = "stopped"
+    tr_obj = TrafficItem(api)
+    config = snappi.Api().config()
+    for name, tx, rx in [("f1", "d1", "d2"), ("f2", "d3", "d4")]:
+        f = config.flows.flow(name=name)[-1]
+        f.tx_rx.device.tx_names = [tx]
+        f.tx_rx.device.rx_names = [rx]
+    tr_obj._config = config
+    applied = {f.name: tr_obj._get_flow_fingerprint(f) for f in config.flows}
+    api.select_traffic_items = MagicMock(
+        return_value={
+            name: {"name": name, "href": "/traffic/trafficItem/%d" % i}
+            for i, name in enumerate(applied, start=1)
+        }
+    )
+    # only the topology of d1 was re-created by the device push
+    api.ngpf.is_topology_changed.side_effect = lambda names: "d1" in names
+    create_names, _ = tr_obj._remove_changed_traffic(applied, applied)
+    assert create_names == {"f1"}
+    deleted = [c.args[1] for c in api._request.call_args_list]
+    assert deleted == ["/traffic/trafficItem/1"]
@@ -354,6 +354,39 @@ def test_create_traffic_raw2():
     assert tr_raw == expected_raw_type
 
 
+@pytest.mark.parametrize(
+    "headers",
+    [
+        ["ethernet", "vlan", "ipv4", "udp"],
+        ["ethernetpause"],
+        ["pfcpause"],
+        ["ethernet", "ipv6", "tcp"],
+        ["ethernet", "ipv4", "custom"],
+    ],
+)
+def test_create_traffic_keeps_flow_headers(headers):
+    config = snappi.Api().config()
+    tr_obj = TrafficItem(MagicMock())
+    ports = {"p1": "/vport[1]", "p2": "/vport[2]"}
+    tr_obj.get_ports_encap = MagicMock(return_value=ports)
+    tr_obj.get_device_encap = MagicMock(return_value={})
+    f1 = config.flows.flow(name="f1")[-1]
+    f1.tx_rx.port.tx_name = "p1"
+    f1.tx_rx.port.rx_name = "p2"
+    for header in headers:
+        getattr(f1.packet.add(), header)
+    if "ipv4" in headers:
+        f1.packet[headers.index("ipv4")].src.increment.start = "1.1.1.1"
+    if "custom" in headers:
+        f1.packet[-1].bytes = "0a0b"
+    before = f1.serialize()
+    tr_obj.copy_flow_packet(config)
+    tr_obj.create_traffic(config)
+    # the headers are not copied, the conversion must not change them
+    assert tr_obj._flows_packet[0][-1] is f1.packet[-1]
+    assert f1.serialize() == before
+
+
 @pytest.mark.parametrize("v4_or_v6", [4, 6])
 def test_create_traffic_device(v4_or_v6):
     config = snappi.Api().config()
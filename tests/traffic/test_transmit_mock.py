@@ -0,0 +1,179 @@
+import snappi
+from mock import MagicMock
+from snappi_ixnetwork.snappi_api import Api
+from snappi_ixnetwork.trafficitem import TrafficItem
+
+HREF = "/api/v1/sessions/1/ixnetwork"
+
+
+def _traffic_item(name, state, suspend=False):
+    return {
+        "name": name,
+        "state": state,
+        "suspend": suspend,
+        "href": "%s/traffic/trafficItem/%s" % (HREF, name[1:]),
+    }
+
+
+def _transmit_api(traffic_items):
+    api = MagicMock()
+    api._ixnetwork.href = HREF
+    api._href_chunks.side_effect = lambda hrefs: [hrefs]
+    config = snappi.Api().config()
+    for name in traffic_items:
+        config.flows.flow(name=name)
+    api._config = config
+    api.select_traffic_items.return_value = dict(
+        (traffic_item["name"], traffic_item)
+        for traffic_item in traffic_items.values()
+    )
+    return api
+
+
+def _operations(api):
+    return [
+        (c.args[0].split("/")[-1], c.args[1])
+        for c in api._ixnetwork._connection._execute.call_args_list
+    ]
+
+
+def test_transmit_start():
+    api = _transmit_api(
+        {
+            "f1": _traffic_item("f1", "unapplied"),
+            "f2": _traffic_item("f2", "started", suspend=True),
+            "f3": _traffic_item("f3", "stopped"),
+            "f4": _traffic_item("f4", "stopped"),
+        }
+    )
+    state = snappi.Api().control_state().traffic.flow_transmit
+    state.state = state.START
+    state.flow_names = ["f1", "f2", "f3"]
+    TrafficItem(api).transmit(state)
+    api.select_traffic_items.assert_called_once_with()
+    assert _operations(api) == [
+        ("generate", {"arg1": ["%s/traffic/trafficItem/1" % HREF]}),
+        (
+            "pausestatelesstraffic",
+            {"arg1": ["%s/traffic/trafficItem/2" % HREF], "arg2": False},
+        ),
+        (
+            "startstatelesstrafficblocking",
+            {
+                "arg1": [
+                    "%s/traffic/trafficItem/1" % HREF,
+                    "%s/traffic/trafficItem/3" % HREF,
+                ]
+            },
+        ),
+    ]
+    api._traffic.Apply.assert_called_once()
+    # f2 is already started, the statistics are not cleared
+    api._ixnetwork.ClearStats.assert_not_called()
+    api._traffic_item.find.assert_not_called()
+
+
+def test_transmit_stop():
+    api = _transmit_api(
+        {
+            "f1": _traffic_item("f1", "started"),
+            "f2": _traffic_item("f2", "stopped"),
+        }
+    )
+    state = snappi.Api().control_state().traffic.flow_transmit
+    state.state = state.STOP
+    TrafficItem(api).transmit(state)
+    assert _operations(api) == [
+        (
+            "stopstatelesstrafficblocking",
+            {"arg1": ["%s/traffic/trafficItem/1" % HREF]},
+        ),
+    ]
+    api.select_traffic_items.assert_called_once_with(names=["f1", "f2"])
+    api.select_traffic_items.return_value["f1"]["state"] = "stopped"
+    api._ixnetwork._connection._execute.reset_mock()
+    state.flow_names = ["f1"]
+    TrafficItem(api).transmit(state)
+    api.select_traffic_items.assert_called_with(names=["f1"])
+    api._ixnetwork._connection._execute.assert_not_called()
+
+
+def test_select_traffic_items_by_href():
+    api = Api()
+    api._ixnetwork = MagicMock()
+    api._ixnetwork.href = HREF
+    api._href_chunk_size = 2
+    execute = api._ixnetwork._connection._execute
+    execute.return_value = [
+        {
+            "trafficItem": [
+                _traffic_item("f%d" % i, "stopped") for i in range(1, 6)
+            ]
+        }
+    ]
+    traffic_items = api.select_traffic_items(names=["f2", "f4"])
+    assert list(traffic_items) == ["f2", "f4"]
+    execute.reset_mock()
+    execute.side_effect = lambda url, payload: [
+        {"name": "f%s" % select["from"][-1], "state": "started"}
+        for select in payload["selects"]
+    ]
+    traffic_items = api.select_traffic_items(names=["f1", "f3", "f5"])
+    assert traffic_items["f5"]["href"] == "%s/traffic/trafficItem/5" % HREF
+    # the known traffic items are selected by href, no name regex
+    assert execute.call_count == 2
+    for c in execute.call_args_list:
+        for select in c.args[1]["selects"]:
+            assert select["from"].startswith(HREF + "/traffic/trafficItem/")
+    # an unknown name falls back to selecting all the traffic items
+    execute.side_effect = None
+    execute.reset_mock()
+    assert api.select_traffic_items(names=["f6"]) == {}
+    assert execute.call_args.args[1]["selects"][0]["from"] == "/traffic"
+
+
+def test_remove_traffic_items():
+    api = Api()
+    api._ixnetwork = MagicMock()
+    api._ixnetwork.href = HREF
+    api._request = MagicMock()
+    api.select_traffic_items = MagicMock(return_value={})
+    items = []
+    for i in range(1, 4):
+        item = MagicMock()
+        item.Name = "f%d" % i
+        item.State = "started" if i < 3 else "stopped"
+        item.href = "%s/traffic/trafficItem/%d" % (HREF, i)
+        items.append(item)
+    ixn_obj = MagicMock()
+    ixn_obj._SDM_NAME = "trafficItem"
+    ixn_obj.find.return_value = items
+    api._remove(ixn_obj, [{"name": "f1"}])
+    api._ixnetwork._connection._execute.assert_called_once_with(
+        "%s/traffic/trafficItem/operations/stopstatelesstraffic" % HREF,
+        {"arg1": ["%s/traffic/trafficItem/2" % HREF]},
+    )
+    assert [c.args for c in api._request.call_args_list] == [
+        ("DELETE", "%s/traffic/trafficItem/2" % HREF),
+        ("DELETE", "%s/traffic/trafficItem/3" % HREF),
+    ]
+    ixn_obj.find.assert_called_once_with()
+
+
+def test_select_traffic_items_stale_href():
+    api = Api()
+    api._ixnetwork = MagicMock()
+    api._ixnetwork.href = HREF
+    api._traffic_item_hrefs = {"f1": "%s/traffic/trafficItem/9" % HREF}
+    traffic_items = {"trafficItem": [_traffic_item("f1", "stopped")]}
+
+    def execute(url, payload):
+        if payload["selects"][0]["from"] != "/traffic":
+            raise Exception("404 not found")
+        return [traffic_items]
+
+    api._ixnetwork._connection._execute.side_effect = execute
+    # the removed traffic item falls back to the select of all of them
+    selected = api.select_traffic_items(names=["f1"])
+    assert selected["f1"]["href"] == "%s/traffic/trafficItem/1" % HREF
+    assert api._traffic_item_hrefs == {"f1": selected["f1"]["href"]}
@@ -0,0 +1,102 @@
+import json
+import pytest
+from mock import MagicMock
+from snappi_ixnetwork.exceptions import SnappiIxnException
+from snappi_ixnetwork.snappi_api import Api
+from snappi_ixnetwork.trafficitem import TrafficItem
+
+
+def _flows_api(count=3):
+    api = Api()
+    config = api.config()
+    for i in range(count):
+        flow = config.flows.flow(name="f%d" % i)[-1]
+        flow.tx_rx.port.tx_name = "p1"
+        flow.packet.ethernet().ipv4()
+        flow.rate.pps = 1000
+    api._config = config
+    api._initial_flows_config = json.dumps(
+        config.flows.serialize(config.flows.DICT)
+    )
+    return api, config
+
+
+def test_update_flows_snapshot():
+    api, config = _flows_api()
+    flow = config.flows[1]
+    flow.rate.pps = 2000
+    update_config = api.config_update().flows
+    update_config.flows.append(flow)
+    TrafficItem(api)._validate_update_flows_config(update_config)
+    assert api._initial_flows["f1"]["rate"]["pps"] == "1000"
+    flow.packet[1].src.value = "2.2.2.2"
+    with pytest.raises(SnappiIxnException) as error:
+        TrafficItem(api)._validate_update_flows_config(update_config)
+    assert "packet property update is not supported on flow f1" in str(
+        error.value.args
+    )
+
+
+def test_update_flows_bulk():
+    api, config = _flows_api(500)
+    api._assistant = MagicMock()
+    api._ixnetwork = api._assistant.Session.Ixnetwork
+    api._ixnetwork.href = "/api/v1/sessions/1/ixnetwork/"
+    execute = api._assistant._ixnetwork._connection._execute
+    execute.return_value = [
+        {
+            "trafficItem": [
+                {
+                    "name": "f%d" % i,
+                    "xpath": "/traffic/trafficItem[%d]" % (i + 1),
+                    "highLevelStream": [
+                        {
+                            "xpath": "/traffic/trafficItem[%d]"
+                            "/highLevelStream[%d]" % (i + 1, j + 1)
+                        }
+                        for j in range(2)
+                    ],
+                }
+                for i in range(500)
+            ]
+        }
+    ]
+    api._request = MagicMock(return_value={"result": {}})
+    update_config = api.config_update().flows
+    for flow in config.flows:
+        flow.rate.pps = 2000
+        flow.size.fixed = 128
+        update_config.flows.append(flow)
+    TrafficItem(api).update_flows(update_config)
+    assert execute.call_count == 1
+    api._request.assert_called_once()
+    imports = json.loads(api._request.call_args.kwargs["payload"]["arg2"])
+    traffic_items = imports["traffic"]["trafficItem"]
+    assert len(traffic_items) == 500
+    assert traffic_items[1]["highLevelStream"][1] == {
+        "xpath": "/traffic/trafficItem[2]/highLevelStream[2]",
+        "frameSize": {
+            "xpath": "/traffic/trafficItem[2]/highLevelStream[2]/frameSize",
+            "type": "fixed",
+            "fixedSize": 128,
+        },
+        "frameRate": {
+            "xpath": "/traffic/trafficItem[2]/highLevelStream[2]/frameRate",
+            "type": "framesPerSecond",
+            "rate": 2000,
+        },
+    }
+
+
+def test_update_flows_errors():
+    api, config = _flows_api()
+    update_config = api.config_update().flows
+    update_config.flows.flow(name="f9")[-1].tx_rx.port.tx_name = "p1"
+    with pytest.raises(SnappiIxnException) as error:
+        TrafficItem(api).update_flows(update_config)
+    assert "Adding a new flow f9" in str(error.value.args)
+    update_config = api.config_update().flows
+    config.flows[0].size.increment.start = 64
+    update_config.flows.append(config.flows[0])
+    with pytest.raises(SnappiIxnException):
+        TrafficItem(api).update_flows(update_config)